@@ -1,21 +1,30 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File, Depends, Request
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from starlette.formparsers import MultiPartParser
 import uvicorn
 import os
+import json
+import asyncio
+import time
 from dotenv import load_dotenv
 from loguru import logger
 
-# Import services
-from services.gemini_service import GeminiService
-from services.audio_analysis import AudioAnalysisService
-from services.video_analysis import VideoAnalysisService
-from services.speech_recognition import SpeechRecognitionService
-from services.emotion_detection import EmotionDetectionService
-from services.resume_parser import ResumeParserService
+# Import services (service modules themselves are imported lazily by the registry)
+from services.registry import ServiceRegistry
+from services.executor import ExecutorManager, ExecutorBusyError
+from services.fallbacks import audio_analysis_fallback, emotion_batch_fallback, video_analysis_fallback
+from services.health_monitor import HealthMonitor
+from services.parse_cache import get_parse_cache
+from services.pcm import PCM_DTYPES, pcm_frame_bytes
+from services.shared_buffer import SharedBuffer
+from middleware.upload_limit import UploadLimitMiddleware
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 # Import models
 from models.analysis_models import (
@@ -44,6 +53,29 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Request body limits, enforced while the body streams in
+MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", 10485760))  # 10MB default
+MAX_VIDEO_SIZE = int(os.getenv("MAX_VIDEO_SIZE", 104857600))  # 100MB default
+MAX_REQUEST_SIZE = int(os.getenv("MAX_REQUEST_SIZE", 146800640))  # 140MB default (base64 video in JSON)
+UPLOAD_OVERHEAD = 64 * 1024  # multipart boundaries and part headers
+
+# Multipart files above this size are spooled to disk rather than held in memory
+MultiPartParser.max_file_size = int(os.getenv("UPLOAD_SPOOL_THRESHOLD", 1048576))
+
+app.add_middleware(
+    UploadLimitMiddleware,
+    default_limit=MAX_REQUEST_SIZE,
+    route_limits={
+        "/api/audio/analyze-raw": MAX_FILE_SIZE,
+        "/api/audio/analyze-upload": MAX_FILE_SIZE + UPLOAD_OVERHEAD,
+        "/api/audio/speech-to-text": MAX_FILE_SIZE + UPLOAD_OVERHEAD,
+        "/api/video/analyze-frame": MAX_FILE_SIZE + UPLOAD_OVERHEAD,
+        "/api/video/analyze-frames": MAX_FILE_SIZE + UPLOAD_OVERHEAD,
+        "/api/emotion/batch-analyze": MAX_VIDEO_SIZE + UPLOAD_OVERHEAD,
+        "/api/resume/parse": MAX_FILE_SIZE + UPLOAD_OVERHEAD
+    }
+)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -61,13 +93,71 @@ app.add_middleware(
 # Security
 security = HTTPBearer()
 
-# Initialize services
-gemini_service = GeminiService()
-audio_service = AudioAnalysisService()
-video_service = VideoAnalysisService()
-speech_service = SpeechRecognitionService()
-emotion_service = EmotionDetectionService()
-resume_service = ResumeParserService()
+# Initialize services. Each is imported and built on first use, or by the
+# background warmup started at startup, so the server accepts connections
+# without waiting for librosa, MediaPipe or OpenCV to load. Only Gemini is
+# served from this process; the others run in executor workers, which build
+# and warm their own instances, so they are not preloaded here.
+service_registry = ServiceRegistry()
+service_registry.register("gemini", "services.gemini_service:GeminiService")
+service_registry.register("audio", "services.audio_analysis:AudioAnalysisService", preload=False)
+service_registry.register("video", "services.video_analysis:VideoAnalysisService", preload=False)
+service_registry.register("speech", "services.speech_recognition:SpeechRecognitionService", preload=False)
+service_registry.register("emotion", "services.emotion_detection:EmotionDetectionService", preload=False)
+service_registry.register("resume", "services.resume_parser:ResumeParserService", preload=False)
+
+# Executor-backed services are never touched here: their calls go through
+# executors.run and their fallbacks come from services.fallbacks
+gemini_service = service_registry.proxy("gemini")
+
+# CPU-bound work runs off the event loop. librosa and MediaPipe get process
+# pools (GIL-bound, per-worker graphs); OpenCV, PDF parsing and the blocking
+# speech API use thread pools. Each worker builds its own service instance.
+# The video pool is sticky so every frame of a session reaches the worker
+# holding that session's tracking graphs.
+executors = ExecutorManager()
+executors.register("audio", service_registry.factory("audio"), kind="process")
+executors.register("video", service_registry.factory("video"), kind="process", sticky=True)
+executors.register("emotion", service_registry.factory("emotion"), kind="thread", max_workers=4)
+executors.register("speech", service_registry.factory("speech"), kind="thread", max_workers=4)
+executors.register("resume", service_registry.factory("resume"), kind="thread")
+
+# Health checks run in the background; the /health endpoints serve the cached snapshot.
+# Gemini reports its load state until it is built; the other services report
+# worker liveness and load from their executor pools, never a queued probe.
+health_monitor = HealthMonitor()
+health_monitor.register("gemini", partial(service_registry.health_check, "gemini"))
+for name in ("audio", "video", "speech", "emotion", "resume"):
+    health_monitor.register(name, executors.get(name).health_check)
+
+warmup_task: Optional[asyncio.Task] = None
+
+async def warm_up_services():
+    """Build and warm services, then the executor workers that do the real work"""
+    await service_registry.warmup()
+    if service_registry.warmup_enabled:
+        await executors.warmup()
+    await health_monitor.refresh()
+
+@app.on_event("startup")
+async def start_background_tasks():
+    """Start background health refresh and service warmup"""
+    global warmup_task
+    await health_monitor.start()
+    warmup_task = asyncio.create_task(warm_up_services())
+
+@app.on_event("shutdown")
+async def shutdown_executors():
+    """Stop background tasks, drain pending Gemini batches and stop worker and PDF page pools"""
+    if warmup_task is not None:
+        warmup_task.cancel()
+    await health_monitor.stop()
+    if service_registry.built("gemini"):
+        await gemini_service.close()
+    executors.shutdown()
+    
+    from services.document_text import shutdown_page_pool  # imports PyPDF2; deferred past startup
+    shutdown_page_pool()
 
 # Dependency for authentication
 async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
@@ -83,19 +173,16 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
     
     return credentials.credentials
 
-# File size validator
-MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", 10485760))  # 10MB default
-
-async def validate_file_size(file: UploadFile):
-    """Validate uploaded file size"""
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Maximum size is {MAX_FILE_SIZE / 1024 / 1024}MB"
-        )
-    await file.seek(0)  # Reset file pointer
-    return file
+def verify_websocket_token(websocket: WebSocket) -> bool:
+    """Verify the API token sent as a Bearer header or ``token`` query parameter"""
+    expected_token = os.getenv("API_KEY") or os.getenv("PYTHON_AI_SERVER_API_KEY")
+    if not expected_token:
+        logger.error("API_KEY not configured in environment")
+        return False
+    
+    authorization = websocket.headers.get("authorization", "")
+    token = authorization[7:] if authorization.lower().startswith("bearer ") else websocket.query_params.get("token")
+    return token == expected_token
 
 @app.get("/")
 async def root():
@@ -108,18 +195,44 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Detailed health check"""
+    """Detailed health check from the latest background snapshot"""
     return {
-        "status": "healthy",
+        **health_monitor.snapshot(),
+        "warmup": service_registry.stats(),
+        "executors": executors.stats(),
+        "gemini": gemini_service.stats() if service_registry.built("gemini") else None,
+        "resume_cache": get_parse_cache().stats()
+    }
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the event loop is serving requests"""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: services are loaded and warm, and none reported unhealthy"""
+    snapshot = health_monitor.snapshot()
+    executor_stats = executors.stats()
+    ready = (
+        health_monitor.ready
+        and service_registry.ready
+        and (executors.warm or not service_registry.warmup_enabled)
+    )
+    body = {
+        "ready": ready,
+        "status": snapshot["status"],
         "services": {
-            "gemini": await gemini_service.health_check(),
-            "audio": audio_service.health_check(),
-            "video": video_service.health_check(),
-            "speech": speech_service.health_check(),
-            "emotion": emotion_service.health_check(),
-            "resume": resume_service.health_check()
-        }
+            name: {
+                "health": snapshot["services"].get(name, {}).get("status"),
+                **state,
+                "workers_warm": executor_stats[name]["warm"] if name in executor_stats else None
+            }
+            for name, state in service_registry.stats().items()
+        },
+        "refreshed_at": snapshot["refreshed_at"]
     }
+    return JSONResponse(body, status_code=200 if ready else 503)
 
 # Audio Analysis Endpoints
 @app.post("/api/audio/analyze")
@@ -131,16 +244,186 @@ async def analyze_audio(
 ):
     """Analyze audio for speech patterns, pace, and quality"""
     try:
-        result = await audio_service.analyze_audio(
+        result = await executors.run(
+            "audio", "analyze_audio",
             audio_data=audio_request.audio_data,
             sample_rate=audio_request.sample_rate,
             duration=audio_request.duration
         )
         return {"success": True, "data": result}
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Audio analysis error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def validate_audio_encoding(encoding: Optional[str]):
+    """Validate a declared raw PCM encoding (None means an audio file such as WAV/FLAC)"""
+    if encoding and encoding not in PCM_DTYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported encoding. Use one of: {', '.join(PCM_DTYPES)}"
+        )
+
+def validate_audio_body(size: int, encoding: Optional[str], channels: int):
+    """Reject bodies that cannot hold audio: empty, or raw PCM cut off mid-sample"""
+    if size == 0:
+        raise HTTPException(status_code=400, detail="Audio body is empty")
+    if encoding:
+        if channels < 1:
+            raise HTTPException(status_code=400, detail="channels must be at least 1")
+        frame_bytes = pcm_frame_bytes(encoding, channels)
+        if size % frame_bytes:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{encoding} body with {channels} channel(s) must be a multiple of {frame_bytes} bytes"
+            )
+
+async def read_shared_body(request: Request) -> SharedBuffer:
+    """Stream a request body into shared memory for a process worker.
+
+    With a Content-Length the chunks are written straight into the block;
+    chunked bodies are read first and copied in once.
+    """
+    declared = request.headers.get("content-length")
+    if declared is None or not declared.isdigit():
+        body = await request.body()
+        buffer = SharedBuffer(len(body))
+        buffer.write(body)
+        return buffer
+    
+    buffer = SharedBuffer(int(declared))
+    try:
+        async for chunk in request.stream():
+            buffer.write(chunk)
+    except BaseException:
+        buffer.close()
+        raise
+    return buffer
+
+@app.post("/api/audio/analyze-raw")
+@limiter.limit("30/minute")  # Rate limit: 30 requests per minute
+async def analyze_audio_raw(
+    request: Request,
+    sample_rate: int = 44100,
+    encoding: Optional[str] = None,
+    channels: int = 1,
+    token: str = Depends(verify_token)
+):
+    """Analyze audio sent as an application/octet-stream body.
+
+    Send an audio file as-is, or raw PCM with ``encoding`` (pcm_s16le or
+    pcm_f32le) and its ``sample_rate``/``channels``. Avoids the base64/JSON
+    overhead of /api/audio/analyze. The body reaches the audio worker through
+    shared memory, so PCM is read there without being copied again.
+    """
+    try:
+        validate_audio_encoding(encoding)
+        buffer = await read_shared_body(request)
+        try:
+            validate_audio_body(buffer.size, encoding, channels)
+            result = await executors.run(
+                "audio", "analyze_shared_audio",
+                buffer.name, buffer.size, input_sample_rate=sample_rate, encoding=encoding, channels=channels
+            )
+        finally:
+            buffer.close()
+        return {"success": True, "data": result}
+    except HTTPException:
+        raise
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Audio analysis error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/audio/analyze-upload")
+@limiter.limit("30/minute")  # Rate limit: 30 requests per minute
+async def analyze_audio_upload(
+    request: Request,
+    audio_file: UploadFile = File(...),
+    sample_rate: int = Form(44100),
+    encoding: Optional[str] = Form(None),
+    channels: int = Form(1),
+    token: str = Depends(verify_token)
+):
+    """Analyze audio sent as a multipart file upload (audio file or raw PCM)"""
+    try:
+        validate_audio_encoding(encoding)
+        
+        audio_bytes = await audio_file.read()
+        validate_audio_body(len(audio_bytes), encoding, channels)
+        result = await executors.run(
+            "audio", "analyze_audio_bytes",
+            audio_bytes, input_sample_rate=sample_rate, encoding=encoding, channels=channels
+        )
+        return {"success": True, "data": result}
+    except HTTPException:
+        raise
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Audio analysis error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+MAX_STREAM_SECONDS = float(os.getenv("MAX_STREAM_SECONDS", 600))
+
+@app.websocket("/ws/audio/stream")
+async def stream_audio_analysis(websocket: WebSocket):
+    """Analyze a live answer from raw PCM chunks.
+
+    Query parameters: ``sample_rate`` (default 16000), ``encoding``
+    (``pcm_s16le`` or ``pcm_f32le``), ``partial_interval`` seconds between
+    partial updates. Binary messages carry audio; a ``{"type": "end"}`` text
+    message closes the answer and returns the same result as /api/audio/analyze.
+    """
+    if not verify_websocket_token(websocket):
+        await websocket.close(code=1008)
+        return
+    
+    from services.audio_stream import AudioStreamAnalyzer  # imports librosa; deferred past startup
+    
+    await websocket.accept()
+    try:
+        stream = AudioStreamAnalyzer(
+            sample_rate=int(websocket.query_params.get("sample_rate", 16000)),
+            encoding=websocket.query_params.get("encoding", "pcm_s16le"),
+            partial_interval=float(websocket.query_params.get("partial_interval", 2.0))
+        )
+    except ValueError as e:
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1003)
+        return
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            
+            if message.get("bytes"):
+                partial = await asyncio.to_thread(stream.feed, message["bytes"])
+                if partial:
+                    await websocket.send_json({"type": "partial", "data": partial})
+                if stream.duration > MAX_STREAM_SECONDS:
+                    await websocket.send_json({"type": "error", "detail": "Stream exceeds maximum duration"})
+                    break
+            elif message.get("text") and json.loads(message["text"]).get("type") == "end":
+                break
+        
+        result = await executors.run(
+            "audio", "analyze_signal",
+            stream.signal(), stream.sample_rate, stream.target_sample_rate
+        )
+        await websocket.send_json({"type": "final", "data": result})
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.info("Audio stream client disconnected")
+    except Exception as e:
+        logger.error(f"Audio stream error: {e}")
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1011)
+
 @app.post("/api/audio/speech-to-text")
 @limiter.limit("20/minute")  # Rate limit: 20 requests per minute
 async def speech_to_text(
@@ -150,14 +433,13 @@ async def speech_to_text(
 ):
     """Convert speech to text using Whisper"""
     try:
-        # Validate file size
-        await validate_file_size(audio_file)
-        
-        audio_data = await audio_file.read()
-        result = await speech_service.transcribe_audio(audio_data)
+        # Size is enforced by UploadLimitMiddleware; large uploads arrive spooled to disk
+        result = await executors.run("speech", "transcribe_audio", audio_file.file)
         return {"success": True, "data": result}
     except HTTPException:
         raise
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Speech-to-text error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -169,11 +451,14 @@ async def detect_filler_words(
 ):
     """Detect filler words in speech"""
     try:
-        result = await audio_service.detect_filler_words(
+        result = await executors.run(
+            "audio", "detect_filler_words",
             transcript=request.transcript,
             audio_timestamps=request.timestamps
         )
         return {"success": True, "data": result}
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Filler words detection error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -182,17 +467,89 @@ async def detect_filler_words(
 @app.post("/api/video/analyze-frame")
 async def analyze_video_frame(
     video_file: UploadFile = File(...),
+    session_id: Optional[str] = Form(None),
     token: str = Depends(verify_token)
 ):
-    """Analyze a single video frame for facial features and emotions"""
+    """Analyze a single video frame for facial features and emotions.
+
+    Frames sharing a ``session_id`` (e.g. the interview id) reuse that
+    session's MediaPipe graphs and keep their tracking state.
+    """
     try:
         frame_data = await video_file.read()
-        result = await video_service.analyze_frame(frame_data)
+        result = await executors.run(
+            "video", "analyze_frame", frame_data,
+            session_id=session_id, shard_key=session_id
+        )
         return {"success": True, "data": result}
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Video frame analysis error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+MAX_BATCH_FRAMES = int(os.getenv("MAX_BATCH_FRAMES", 30))
+
+@app.post("/api/video/analyze-frames")
+async def analyze_video_frames(
+    frames: List[UploadFile] = File(...),
+    timestamps: str = Form("[]"),
+    session_id: Optional[str] = Form(None),
+    token: str = Depends(verify_token)
+):
+    """Analyze a window of frames in one request.
+
+    ``frames`` are encoded images (JPEG/PNG) and ``timestamps`` a JSON array of
+    seconds, one per frame. Frames run through face mesh, pose and hands in
+    timestamp order; the response has per-frame results and a window aggregate.
+    Windows sharing a ``session_id`` keep that session's tracking state until
+    ``/api/video/end-session`` (or comprehensive analysis of that interview id).
+    """
+    try:
+        if len(frames) > MAX_BATCH_FRAMES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many frames. Maximum is {MAX_BATCH_FRAMES} per request"
+            )
+        
+        try:
+            frame_timestamps = [float(t) for t in json.loads(timestamps)] if timestamps else []
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="timestamps must be a JSON array of numbers")
+        if not frame_timestamps:
+            frame_timestamps = [float(i) for i in range(len(frames))]
+        if len(frame_timestamps) != len(frames):
+            raise HTTPException(status_code=400, detail="Provide one timestamp per frame")
+        
+        frame_data = [await frame.read() for frame in frames]
+        result = await executors.run(
+            "video", "analyze_frames", frame_data, frame_timestamps,
+            session_id=session_id, shard_key=session_id
+        )
+        return {"success": True, "data": result}
+    except HTTPException:
+        raise
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Batch frame analysis error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/video/end-session")
+async def end_video_session(
+    session_id: str = Form(...),
+    token: str = Depends(verify_token)
+):
+    """Release the tracking state kept for ``session_id`` by the frame endpoints"""
+    try:
+        result = await executors.run("video", "end_session", session_id, shard_key=session_id)
+        return {"success": True, "data": result}
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"End video session error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/video/eye-contact")
 async def analyze_eye_contact(
     request: VideoAnalysisRequest,
@@ -200,11 +557,14 @@ async def analyze_eye_contact(
 ):
     """Analyze eye contact patterns in video"""
     try:
-        result = await video_service.analyze_eye_contact(
+        result = await executors.run(
+            "video", "analyze_eye_contact",
             video_data=request.video_data,
             duration=request.duration
         )
         return {"success": True, "data": result}
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Eye contact analysis error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -216,11 +576,14 @@ async def analyze_posture(
 ):
     """Analyze posture and body language"""
     try:
-        result = await video_service.analyze_posture(
+        result = await executors.run(
+            "video", "analyze_posture",
             video_data=request.video_data,
             duration=request.duration
         )
         return {"success": True, "data": result}
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Posture analysis error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -233,11 +596,14 @@ async def analyze_emotions(
 ):
     """Analyze emotions from facial expressions"""
     try:
-        result = await emotion_service.analyze_emotions(
+        result = await executors.run(
+            "emotion", "analyze_emotions",
             image_data=request.image_data,
             timestamp=request.timestamp
         )
         return {"success": True, "data": result}
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Emotion analysis error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -249,9 +615,11 @@ async def batch_analyze_emotions(
 ):
     """Analyze emotions throughout an entire video"""
     try:
-        video_data = await video_file.read()
-        result = await emotion_service.batch_analyze_video(video_data)
+        # Pass the spooled upload through instead of loading the video into memory
+        result = await executors.run("emotion", "batch_analyze_video", video_file.file)
         return {"success": True, "data": result}
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Batch emotion analysis error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -266,9 +634,6 @@ async def parse_resume(
 ):
     """Parse resume and extract structured information"""
     try:
-        # Validate file size
-        await validate_file_size(resume_file)
-        
         # Validate file type
         allowed_types = ['application/pdf', 'application/msword', 
                         'application/vnd.openxmlformats-officedocument.wordprocessingml.document']
@@ -278,14 +643,16 @@ async def parse_resume(
                 detail="Invalid file type. Only PDF and DOC files are allowed"
             )
         
-        file_data = await resume_file.read()
-        result = await resume_service.parse_resume(
-            file_data=file_data,
+        result = await executors.run(
+            "resume", "parse_resume",
+            file_data=resume_file.file,
             filename=resume_file.filename
         )
         return {"success": True, "data": result}
     except HTTPException:
         raise
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Resume parsing error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -352,52 +719,167 @@ async def generate_feedback(
         logger.error(f"Feedback generation error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def sse_response(events: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """Serve parser events as Server-Sent Events (``event:`` name plus JSON ``data:``)"""
+    async def encode():
+        async for event in events:
+            name = event.pop("event")
+            yield f"event: {name}\ndata: {json.dumps(event)}\n\n"
+    
+    return StreamingResponse(
+        encode(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/ai/generate-questions/stream")
+@limiter.limit("20/minute")  # Rate limit: 20 requests per minute
+async def generate_questions_stream(
+    request: Request,
+    question_request: dict,
+    token: str = Depends(verify_token)
+):
+    """Generate interview questions, streaming each question as an SSE ``item`` event"""
+    return sse_response(gemini_service.stream_interview_questions(question_request))
+
+@app.post("/api/ai/generate-feedback/stream")
+@limiter.limit("15/minute")  # Rate limit: 15 requests per minute
+async def generate_feedback_stream(
+    request: Request,
+    feedback_request: dict,
+    token: str = Depends(verify_token)
+):
+    """Generate feedback, streaming each field (``field``) and list entry (``item``) as SSE events"""
+    return sse_response(gemini_service.stream_feedback(feedback_request))
+
 # Comprehensive Analysis Endpoint
+# Per-stage budgets for comprehensive analysis (seconds)
+STAGE_TIMEOUTS = {
+    "audio": float(os.getenv("STAGE_TIMEOUT_AUDIO", 60)),
+    "video": float(os.getenv("STAGE_TIMEOUT_VIDEO", 180)),
+    "content": float(os.getenv("STAGE_TIMEOUT_CONTENT", 45)),
+    "overall": float(os.getenv("STAGE_TIMEOUT_OVERALL", 45))
+}
+
+async def run_stage(
+    name: str,
+    awaitable: Awaitable[Any],
+    fallback: Callable[[], Any],
+    stages: Dict[str, Dict[str, Any]]
+) -> Any:
+    """Await one analysis stage under its timeout, substituting the fallback on failure.
+
+    A timed-out executor call stops being awaited, but work already running
+    in a worker finishes in the background.
+    """
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(awaitable, STAGE_TIMEOUTS[name])
+        status = "completed"
+    except asyncio.TimeoutError:
+        logger.warning(f"Comprehensive analysis stage '{name}' timed out after {STAGE_TIMEOUTS[name]}s")
+        result, status = fallback(), "timed_out"
+    except Exception as e:
+        logger.error(f"Comprehensive analysis stage '{name}' failed: {e}")
+        result, status = fallback(), "fallback"
+    
+    stages[name] = {
+        "status": status,
+        "duration_ms": round((time.perf_counter() - started) * 1000)
+    }
+    return result
+
 @app.post("/api/analysis/comprehensive")
 async def comprehensive_analysis(
     request: InterviewAnalysisRequest,
     token: str = Depends(verify_token)
 ):
-    """Perform comprehensive analysis of interview data"""
+    """Perform comprehensive analysis of interview data.
+
+    Audio, video (with emotions, from one decode) and content analysis run
+    concurrently, each under its own timeout; overall feedback starts once
+    they are done. ``stages`` reports each stage as completed, timed_out or
+    fallback.
+    """
     try:
-        # Combine all analysis services
         results = {}
+        stages = {}
+        pending = {}
         
         # Audio analysis
         if request.audio_data:
-            results["audio"] = await audio_service.analyze_audio(
-                audio_data=request.audio_data,
-                sample_rate=request.sample_rate or 44100,
-                duration=request.duration
+            pending["audio"] = run_stage(
+                "audio",
+                executors.run(
+                    "audio", "analyze_audio",
+                    audio_data=request.audio_data,
+                    sample_rate=request.sample_rate or 44100,
+                    duration=request.duration
+                ),
+                audio_analysis_fallback,
+                stages
             )
         
-        # Video analysis
+        # Video and emotion analysis share one decode of the recording
         if request.video_data:
-            results["video"] = await video_service.analyze_comprehensive(
-                video_data=request.video_data,
-                duration=request.duration
+            pending["video"] = run_stage(
+                "video",
+                executors.run(
+                    "video", "analyze_comprehensive",
+                    video_data=request.video_data,
+                    duration=request.duration,
+                    include_emotions=True
+                ),
+                video_analysis_fallback,
+                stages
             )
         
-        # Emotion analysis
-        if request.video_data:
-            results["emotions"] = await emotion_service.batch_analyze_video(
-                request.video_data
-            )
-        
-        # AI-powered content analysis
+        # AI-powered content analysis, one concurrent Gemini call per answer
         if request.responses:
-            results["content"] = await gemini_service.analyze_interview_content(
-                responses=request.responses,
-                questions=request.questions,
-                role=request.role
+            pending["content"] = run_stage(
+                "content",
+                gemini_service.analyze_interview_content(
+                    responses=request.responses,
+                    questions=request.questions,
+                    role=request.role
+                ),
+                lambda: {"responses": [], "responseCount": 0, "averageScore": None},
+                stages
             )
         
-        # Generate overall score and feedback
-        results["overall"] = await gemini_service.generate_comprehensive_feedback({
-            "analysis_results": results,
-            "interview_data": request.dict(),
-            "user_profile": request.user_profile
-        })
+        results.update(zip(pending, await asyncio.gather(*pending.values())))
+        
+        if "video" in results:
+            emotions = results["video"].pop("emotions", None)
+            status = stages["video"]["status"]
+            if emotions is None:
+                emotions = emotion_batch_fallback(f"Video stage {status}")
+            elif "error" in emotions:
+                status = "fallback"
+            stages["emotions"] = {"status": status, "duration_ms": stages["video"]["duration_ms"]}
+            results["emotions"] = emotions
+        
+        # Generate overall score and feedback once its inputs are ready
+        results["overall"] = await run_stage(
+            "overall",
+            gemini_service.generate_feedback({
+                "analysis_results": results,
+                "interview_data": request.dict(exclude={"audio_data", "video_data"}),
+                "user_profile": request.user_profile
+            }),
+            gemini_service._get_fallback_feedback,
+            stages
+        )
+        
+        results["stages"] = stages
+        
+        # The interview is over, so frame windows sent under its id are done too
+        try:
+            await executors.run(
+                "video", "end_session", request.interview_id, shard_key=request.interview_id
+            )
+        except Exception as e:
+            logger.warning(f"Could not release video session {request.interview_id}: {e}")
         
         return {"success": True, "data": results}
     except Exception as e:
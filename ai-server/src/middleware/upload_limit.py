@@ -0,0 +1,48 @@
+from typing import Dict, Optional
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+from loguru import logger
+
+
+class UploadLimitMiddleware:
+    """ASGI middleware enforcing per-route request body limits while streaming.
+
+    Requests whose Content-Length exceeds the route limit are rejected before
+    any of the body is read. Chunked or mislabelled bodies are counted as they
+    arrive and cut off with a 413 as soon as the limit is crossed, so an
+    oversized upload is never buffered in full.
+    """
+
+    def __init__(self, app, default_limit: int, route_limits: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.default_limit = default_limit
+        self.route_limits = route_limits or {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.route_limits.get(scope["path"], self.default_limit)
+        detail = f"Request body too large. Maximum size is {limit / 1024 / 1024:.1f}MB"
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            logger.warning(f"Rejected {scope['path']} upload of {int(content_length)} bytes (limit {limit})")
+            response = JSONResponse({"detail": detail}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    logger.warning(f"Aborted {scope['path']} upload after {received} bytes (limit {limit})")
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -7,6 +7,12 @@ from typing import Dict, List, Any, Optional
 from loguru import logger
 import re
 from collections import Counter
+from services.audio_features import AudioFeatureFrames
+from services.fallbacks import audio_analysis_fallback
+from services.pcm import pcm_to_float32
+from services.shared_buffer import attach_shared_buffer
+from services.voice_activity import VADSegmenter, VADSegments
+from services.pitch_tracking import PitchTracker
 
 class AudioAnalysisService:
     def __init__(self):
@@ -15,6 +21,8 @@ class AudioAnalysisService:
             'um', 'uh', 'er', 'ah', 'like', 'you know', 'so', 'well',
             'actually', 'basically', 'literally', 'right', 'okay', 'yeah'
         ]
+        self.vad = VADSegmenter()
+        self.pitch_tracker = PitchTracker()
         logger.info("Audio analysis service initialized")
 
     def health_check(self) -> Dict[str, str]:
@@ -28,13 +36,66 @@ class AudioAnalysisService:
             logger.error(f"Audio analysis health check failed: {e}")
             return {"status": "unhealthy", "service": "audio_analysis", "error": str(e)}
 
+    async def warmup(self):
+        """Run the full analysis once on a synthetic voiced signal (resampling, VAD, pitch tracking)"""
+        sr = 16000
+        t = np.arange(2 * sr) / sr
+        signal = (0.3 * np.sin(2 * np.pi * 150 * t) * (np.sin(2 * np.pi * 1.5 * t) > 0)).astype(np.float32)
+        await self.analyze_signal(signal, sr, self.sample_rate)
+
     async def analyze_audio(self, audio_data: str, sample_rate: int = 44100, duration: float = 0) -> Dict[str, Any]:
         """Comprehensive audio analysis"""
         try:
             # Decode base64 audio data
             audio_bytes = base64.b64decode(audio_data)
-            audio_array, sr = sf.read(io.BytesIO(audio_bytes))
+            audio_array, sr = sf.read(io.BytesIO(audio_bytes), dtype="float32")
+            
+            return await self.analyze_signal(audio_array, sr, sample_rate)
+            
+        except Exception as e:
+            logger.error(f"Audio analysis error: {e}")
+            return self._get_fallback_audio_analysis()
+
+    async def analyze_audio_bytes(
+        self,
+        audio_bytes: bytes,
+        input_sample_rate: int = 44100,
+        encoding: Optional[str] = None,
+        channels: int = 1
+    ) -> Dict[str, Any]:
+        """Analyze an audio file (WAV/FLAC/OGG), or raw PCM recorded at ``input_sample_rate`` when ``encoding`` is given.
+
+        Either way the signal is resampled to the analysis rate
+        (``self.sample_rate``), so the same audio scores the same whether it
+        arrives as PCM or as a file.
+        """
+        try:
+            if encoding:
+                audio_array, sr = pcm_to_float32(audio_bytes, encoding, channels), input_sample_rate
+            else:
+                audio_array, sr = sf.read(io.BytesIO(audio_bytes), dtype="float32")
+            
+            return await self.analyze_signal(audio_array, sr, self.sample_rate)
             
+        except Exception as e:
+            logger.error(f"Audio analysis error: {e}")
+            return self._get_fallback_audio_analysis()
+
+    async def analyze_shared_audio(
+        self,
+        buffer_name: str,
+        size: int,
+        input_sample_rate: int = 44100,
+        encoding: Optional[str] = None,
+        channels: int = 1
+    ) -> Dict[str, Any]:
+        """``analyze_audio_bytes`` for a body the API process placed in shared memory (see ``SharedBuffer``)"""
+        with attach_shared_buffer(buffer_name, size) as audio_bytes:
+            return await self.analyze_audio_bytes(audio_bytes, input_sample_rate, encoding, channels)
+
+    async def analyze_signal(self, audio_array: np.ndarray, sr: int, sample_rate: int = 44100) -> Dict[str, Any]:
+        """Comprehensive audio analysis of an already decoded signal"""
+        try:
             # Ensure mono audio
             if len(audio_array.shape) > 1:
                 audio_array = np.mean(audio_array, axis=1)
@@ -44,14 +105,18 @@ class AudioAnalysisService:
                 audio_array = librosa.resample(audio_array, orig_sr=sr, target_sr=sample_rate)
                 sr = sample_rate
             
+            # Frame the signal once; every analysis below reads from these features
+            features = AudioFeatureFrames(audio_array, sr)
+            segments = self.vad.segment(features)
+            
             # Perform various analyses
             results = {
-                "speech_rate": await self._analyze_speech_rate(audio_array, sr),
-                "pause_analysis": await self._analyze_pauses(audio_array, sr),
-                "tone_analysis": await self._analyze_tone(audio_array, sr),
-                "clarity_score": await self._analyze_clarity(audio_array, sr),
-                "volume_analysis": await self._analyze_volume(audio_array, sr),
-                "energy_analysis": await self._analyze_energy(audio_array, sr)
+                "speech_rate": await self._analyze_speech_rate(features, segments),
+                "pause_analysis": await self._analyze_pauses(segments),
+                "tone_analysis": await self._analyze_tone(features),
+                "clarity_score": await self._analyze_clarity(features),
+                "volume_analysis": await self._analyze_volume(features),
+                "energy_analysis": await self._analyze_energy(features)
             }
             
             logger.info("Audio analysis completed successfully")
@@ -107,36 +172,27 @@ class AudioAnalysisService:
                 "assessment": "Unable to analyze"
             }
 
-    async def _analyze_speech_rate(self, audio: np.ndarray, sr: int) -> Dict[str, Any]:
+    async def _analyze_speech_rate(self, features: AudioFeatureFrames, segments: VADSegments) -> Dict[str, Any]:
         """Analyze speech rate (words per minute)"""
         try:
-            # Estimate speech segments using energy-based voice activity detection
-            frame_length = int(0.025 * sr)  # 25ms frames
-            hop_length = int(0.01 * sr)     # 10ms hop
-            
-            # Calculate energy
-            energy = librosa.feature.rms(y=audio, frame_length=frame_length, hop_length=hop_length)[0]
+            total_duration = features.duration
             
-            # Simple voice activity detection
-            energy_threshold = np.mean(energy) * 0.3
-            speech_frames = energy > energy_threshold
-            
-            # Calculate speech duration
-            speech_duration = np.sum(speech_frames) * hop_length / sr
+            # Speech duration from voice activity segments
+            speech_duration = segments.speech_duration
             
             # Estimate words (rough approximation: 2.5 syllables per second average)
             estimated_syllables = speech_duration * 2.5
             estimated_words = estimated_syllables / 1.5  # Average syllables per word
             
             # Calculate WPM
-            duration_minutes = len(audio) / sr / 60
+            duration_minutes = total_duration / 60
             wpm = estimated_words / duration_minutes if duration_minutes > 0 else 0
             
             return {
                 "words_per_minute": round(wpm, 1),
                 "speech_duration": round(speech_duration, 2),
-                "total_duration": round(len(audio) / sr, 2),
-                "speech_percentage": round((speech_duration / (len(audio) / sr)) * 100, 1),
+                "total_duration": round(total_duration, 2),
+                "speech_percentage": round((speech_duration / total_duration) * 100, 1),
                 "assessment": self._assess_speech_rate(wpm)
             }
             
@@ -150,68 +206,34 @@ class AudioAnalysisService:
                 "assessment": "Normal pace"
             }
 
-    async def _analyze_pauses(self, audio: np.ndarray, sr: int) -> List[Dict[str, Any]]:
+    async def _analyze_pauses(self, segments: VADSegments) -> List[Dict[str, Any]]:
         """Analyze pause patterns"""
         try:
-            # Voice activity detection
-            frame_length = int(0.025 * sr)
-            hop_length = int(0.01 * sr)
-            
-            energy = librosa.feature.rms(y=audio, frame_length=frame_length, hop_length=hop_length)[0]
-            energy_threshold = np.mean(energy) * 0.2
-            
-            # Find silent segments
-            silent_frames = energy < energy_threshold
-            
-            # Convert to time
-            time_per_frame = hop_length / sr
-            
-            pauses = []
-            in_pause = False
-            pause_start = 0
-            
-            for i, is_silent in enumerate(silent_frames):
-                if is_silent and not in_pause:
-                    # Start of pause
-                    in_pause = True
-                    pause_start = i * time_per_frame
-                elif not is_silent and in_pause:
-                    # End of pause
-                    in_pause = False
-                    pause_duration = (i * time_per_frame) - pause_start
-                    
-                    # Only consider pauses longer than 0.3 seconds
-                    if pause_duration > 0.3:
-                        pauses.append({
-                            "start_time": round(pause_start, 2),
-                            "duration": round(pause_duration, 2),
-                            "type": self._classify_pause(pause_duration)
-                        })
-            
-            return pauses
+            # Only consider pauses longer than 0.3 seconds
+            starts, durations = segments.pauses(min_duration=0.3)
+            types = self._classify_pauses(durations)
+            
+            return [
+                {
+                    "start_time": round(start, 2),
+                    "duration": round(duration, 2),
+                    "type": pause_type
+                }
+                for start, duration, pause_type in zip(starts.tolist(), durations.tolist(), types.tolist())
+            ]
             
         except Exception as e:
             logger.error(f"Pause analysis error: {e}")
             return []
 
-    async def _analyze_tone(self, audio: np.ndarray, sr: int) -> List[Dict[str, Any]]:
+    async def _analyze_tone(self, features: AudioFeatureFrames) -> List[Dict[str, Any]]:
         """Analyze tone and pitch variations"""
         try:
-            # Extract pitch using librosa
-            pitches, magnitudes = librosa.piptrack(y=audio, sr=sr, threshold=0.1)
-            
-            # Get fundamental frequency over time
-            f0 = []
-            for t in range(pitches.shape[1]):
-                index = magnitudes[:, t].argmax()
-                pitch = pitches[index, t]
-                if pitch > 0:
-                    f0.append(pitch)
-            
-            if not f0:
-                return [{"analysis": "Unable to detect pitch"}]
+            # Fundamental frequency over voiced frames
+            f0 = self.pitch_tracker.track(features).voiced_f0.astype(np.float64)
             
-            f0 = np.array(f0)
+            if f0.size == 0:
+                return [{"analysis": "Unable to detect pitch"}]
             
             # Calculate statistics
             mean_pitch = np.mean(f0)
@@ -232,13 +254,13 @@ class AudioAnalysisService:
             logger.error(f"Tone analysis error: {e}")
             return [{"analysis": "Tone analysis unavailable"}]
 
-    async def _analyze_clarity(self, audio: np.ndarray, sr: int) -> float:
+    async def _analyze_clarity(self, features: AudioFeatureFrames) -> float:
         """Analyze speech clarity"""
         try:
             # Calculate spectral features that correlate with clarity
-            spectral_centroids = librosa.feature.spectral_centroid(y=audio, sr=sr)[0]
-            spectral_rolloff = librosa.feature.spectral_rolloff(y=audio, sr=sr)[0]
-            zero_crossing_rate = librosa.feature.zero_crossing_rate(audio)[0]
+            spectral_centroids = librosa.feature.spectral_centroid(S=features.magnitude, sr=features.sr)[0]
+            spectral_rolloff = librosa.feature.spectral_rolloff(S=features.magnitude, sr=features.sr)[0]
+            zero_crossing_rate = features.zcr
             
             # Normalize features
             centroid_score = np.mean(spectral_centroids) / 4000  # Normalize to ~0-1
@@ -247,7 +269,7 @@ class AudioAnalysisService:
             
             # Combine scores (this is a simplified heuristic)
             clarity_score = (centroid_score + rolloff_score + zcr_score) / 3
-            clarity_score = min(max(clarity_score, 0), 1) * 100  # Scale to 0-100
+            clarity_score = float(min(max(clarity_score, 0), 1)) * 100  # Scale to 0-100
             
             return round(clarity_score, 1)
             
@@ -255,11 +277,14 @@ class AudioAnalysisService:
             logger.error(f"Clarity analysis error: {e}")
             return 75.0  # Default score
 
-    async def _analyze_volume(self, audio: np.ndarray, sr: int) -> Dict[str, Any]:
+    async def _analyze_volume(self, features: AudioFeatureFrames) -> Dict[str, Any]:
         """Analyze volume patterns"""
         try:
-            # Calculate RMS energy
-            rms = librosa.feature.rms(y=audio)[0]
+            # Calculate RMS energy over STFT-sized windows
+            rms = features.aggregate_rms(
+                window_seconds=features.n_fft / features.sr,
+                hop_seconds=features.stft_hop_length / features.sr
+            )
             
             # Convert to dB
             rms_db = librosa.amplitude_to_db(rms)
@@ -282,14 +307,11 @@ class AudioAnalysisService:
                 "volume_assessment": "Normal volume"
             }
 
-    async def _analyze_energy(self, audio: np.ndarray, sr: int) -> Dict[str, Any]:
+    async def _analyze_energy(self, features: AudioFeatureFrames) -> Dict[str, Any]:
         """Analyze energy patterns"""
         try:
-            # Calculate energy over time
-            frame_length = int(0.1 * sr)  # 100ms frames
-            hop_length = int(0.05 * sr)   # 50ms hop
-            
-            energy = librosa.feature.rms(y=audio, frame_length=frame_length, hop_length=hop_length)[0]
+            # Calculate energy over time (100ms frames, 50ms hop)
+            energy = features.aggregate_rms(window_seconds=0.1, hop_seconds=0.05)
             
             return {
                 "average_energy": round(np.mean(energy), 4),
@@ -307,7 +329,8 @@ class AudioAnalysisService:
                 "energy_consistency": 0.8
             }
 
-    def _assess_speech_rate(self, wpm: float) -> str:
+    @staticmethod
+    def _assess_speech_rate(wpm: float) -> str:
         """Assess speech rate"""
         if wpm < 120:
             return "Slow pace - consider speaking slightly faster"
@@ -327,14 +350,16 @@ class AudioAnalysisService:
         else:
             return "Poor - significant filler word usage"
 
-    def _classify_pause(self, duration: float) -> str:
+    @staticmethod
+    def _classify_pause(duration: float) -> str:
         """Classify pause type"""
-        if duration < 1:
-            return "short"
-        elif duration < 3:
-            return "medium"
-        else:
-            return "long"
+        return str(AudioAnalysisService._classify_pauses(np.array([duration]))[0])
+
+    @staticmethod
+    def _classify_pauses(durations: np.ndarray) -> np.ndarray:
+        """Classify pause types for an array of durations (<1s short, <3s medium, else long)"""
+        labels = np.array(["short", "medium", "long"])
+        return labels[np.digitize(durations, [1, 3])]
 
     def _assess_tone(self, mean_pitch: float, variation: float) -> str:
         """Assess tone characteristics"""
@@ -358,20 +383,4 @@ class AudioAnalysisService:
 
     def _get_fallback_audio_analysis(self) -> Dict[str, Any]:
         """Fallback analysis when processing fails"""
-        return {
-            "speech_rate": {
-                "words_per_minute": 150,
-                "assessment": "Normal pace"
-            },
-            "pause_analysis": [],
-            "tone_analysis": [{"analysis": "Analysis unavailable"}],
-            "clarity_score": 75.0,
-            "volume_analysis": {
-                "average_volume_db": -20,
-                "volume_assessment": "Normal volume"
-            },
-            "energy_analysis": {
-                "average_energy": 0.1,
-                "energy_consistency": 0.8
-            }
-        }
\ No newline at end of file
+        return audio_analysis_fallback()
@@ -0,0 +1,66 @@
+from functools import cached_property
+import numpy as np
+import librosa
+
+
+class AudioFeatureFrames:
+    """Frame-level audio features shared by every sub-analysis of one request.
+
+    The signal is framed once at the finest resolution (25ms frames, 10ms hop)
+    for RMS and zero-crossing rate, and the STFT magnitude is computed at most
+    once. Analyses that need coarser windows aggregate the fine RMS envelope
+    instead of re-framing the audio.
+    """
+
+    def __init__(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        frame_seconds: float = 0.025,
+        hop_seconds: float = 0.01,
+        n_fft: int = 2048,
+        stft_hop_length: int = 512
+    ):
+        self.audio = np.ascontiguousarray(audio, dtype=np.float32)
+        self.sr = sr
+        self.frame_length = max(1, int(frame_seconds * sr))
+        self.hop_length = max(1, int(hop_seconds * sr))
+        self.n_fft = n_fft
+        self.stft_hop_length = stft_hop_length
+
+        self.rms = librosa.feature.rms(
+            y=self.audio, frame_length=self.frame_length, hop_length=self.hop_length
+        )[0]
+        self.zcr = librosa.feature.zero_crossing_rate(
+            self.audio, frame_length=self.frame_length, hop_length=self.hop_length
+        )[0]
+
+    @property
+    def duration(self) -> float:
+        """Signal duration in seconds"""
+        return len(self.audio) / self.sr
+
+    @property
+    def time_per_frame(self) -> float:
+        """Seconds between consecutive fine frames"""
+        return self.hop_length / self.sr
+
+    @cached_property
+    def magnitude(self) -> np.ndarray:
+        """STFT magnitude, computed on first access and reused afterwards"""
+        return np.abs(librosa.stft(self.audio, n_fft=self.n_fft, hop_length=self.stft_hop_length))
+
+    def aggregate_rms(self, window_seconds: float, hop_seconds: float) -> np.ndarray:
+        """RMS over coarser windows, derived from the fine envelope by mean power"""
+        window = max(1, int(round(window_seconds / self.time_per_frame)))
+        hop = max(1, int(round(hop_seconds / self.time_per_frame)))
+
+        power = self.rms.astype(np.float64) ** 2
+        if len(power) == 0:
+            return power
+        if len(power) <= window:
+            return np.sqrt(np.array([power.mean()]))
+
+        cumulative = np.concatenate(([0.0], np.cumsum(power)))
+        starts = np.arange(0, len(power) - window + 1, hop)
+        return np.sqrt((cumulative[starts + window] - cumulative[starts]) / window)
@@ -0,0 +1,219 @@
+import numpy as np
+from typing import Any, Dict, List, Optional
+from services.audio_analysis import AudioAnalysisService
+from services.audio_features import AudioFeatureFrames
+from services.pcm import PCM_DTYPES, pcm_to_float32
+from services.pitch_tracking import PitchTracker
+
+
+class AudioStreamAnalyzer:
+    """Incremental audio analysis for one live answer.
+
+    Chunks of raw mono PCM are framed as they arrive (25ms frames, 10ms hop),
+    keeping running energy statistics, open/closed pauses, rolling pitch
+    statistics and a rolling WPM estimate for partial updates. Partial updates
+    only use ``AudioAnalysisService``'s static assessment helpers, so no service
+    is built in the API process. When the stream closes, ``signal()`` is run
+    through ``AudioAnalysisService.analyze_signal`` in the audio executor, so
+    the final dict matches ``analyze_audio``.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        encoding: str = "pcm_s16le",
+        partial_interval: float = 2.0,
+        target_sample_rate: int = 44100,
+        speech_ratio: float = 0.3,
+        silence_ratio: float = 0.2,
+        min_pause: float = 0.3
+    ):
+        if encoding not in PCM_DTYPES:
+            raise ValueError(f"Unsupported stream encoding: {encoding}")
+
+        self.sample_rate = sample_rate
+        self.encoding = encoding
+        self.partial_interval = partial_interval
+        self.target_sample_rate = target_sample_rate
+        self.speech_ratio = speech_ratio
+        self.silence_ratio = silence_ratio
+        self.min_pause = min_pause
+
+        self.frame_length = int(0.025 * sample_rate)
+        self.hop_length = int(0.01 * sample_rate)
+        self.time_per_frame = self.hop_length / sample_rate
+        self.pitch_tracker = PitchTracker()
+
+        self._chunks: List[np.ndarray] = []
+        self._partial_sample = b""
+        self._samples = 0
+        self._carry = np.zeros(0, dtype=np.float32)
+        self._pitch_pending: List[np.ndarray] = []
+        self._pitch_pending_samples = 0
+        self._last_partial_at = 0.0
+
+        # Running energy statistics (Welford) over fine RMS frames
+        self._frames = 0
+        self._energy_mean = 0.0
+        self._energy_m2 = 0.0
+
+        # Voice activity state
+        self._speech_frames = 0
+        self._in_speech = False
+        self._open_pause_start: Optional[int] = 0
+        self.pauses: List[Dict[str, Any]] = []
+
+        # Running pitch statistics over voiced frames
+        self._pitch_count = 0
+        self._pitch_sum = 0.0
+        self._pitch_sumsq = 0.0
+        self._pitch_min = np.inf
+        self._pitch_max = -np.inf
+
+    @property
+    def duration(self) -> float:
+        return self._samples / self.sample_rate
+
+    def feed(self, chunk: bytes) -> Optional[Dict[str, Any]]:
+        """Consume one chunk; returns partial metrics when an update is due"""
+        dtype = PCM_DTYPES[self.encoding]
+        if self._partial_sample:
+            chunk = self._partial_sample + chunk
+
+        # A chunk may end mid-sample; keep the trailing bytes for the next one
+        usable = len(chunk) - len(chunk) % dtype.itemsize
+        self._partial_sample = bytes(chunk[usable:])
+        samples = pcm_to_float32(chunk, self.encoding)
+        if samples.size == 0:
+            return None
+
+        self._chunks.append(samples)
+        self._samples += samples.size
+        self._update_energy(samples)
+
+        self._pitch_pending.append(samples)
+        self._pitch_pending_samples += samples.size
+        if self._pitch_pending_samples >= self.sample_rate:
+            self._update_pitch()
+
+        if self.duration - self._last_partial_at >= self.partial_interval:
+            self._last_partial_at = self.duration
+            return self.partial_metrics()
+        return None
+
+    def _update_energy(self, samples: np.ndarray):
+        buffer = np.concatenate((self._carry, samples))
+        if len(buffer) < self.frame_length:
+            self._carry = buffer
+            return
+
+        frames = np.lib.stride_tricks.sliding_window_view(buffer, self.frame_length)[::self.hop_length]
+        self._carry = buffer[len(frames) * self.hop_length:]
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+
+        # Batch Welford update
+        count = len(rms)
+        batch_mean = rms.mean()
+        delta = batch_mean - self._energy_mean
+        total = self._frames + count
+        self._energy_mean += delta * count / total
+        self._energy_m2 += ((rms - batch_mean) ** 2).sum() + delta ** 2 * self._frames * count / total
+        first_frame = self._frames
+        self._frames = total
+
+        self._update_voice_activity(rms, first_frame)
+
+    def _update_voice_activity(self, rms: np.ndarray, first_frame: int):
+        speech = rms > self._energy_mean * self.speech_ratio
+        silence = rms < self._energy_mean * self.silence_ratio
+        decided = speech | silence
+
+        # Hysteresis: undecided frames keep the last decided state, carried across chunks
+        last_decided = np.where(decided, np.arange(len(rms)), -1)
+        np.maximum.accumulate(last_decided, out=last_decided)
+        mask = np.where(last_decided >= 0, speech[np.maximum(last_decided, 0)], self._in_speech)
+        self._speech_frames += int(np.count_nonzero(mask))
+
+        # Transitions relative to the previous chunk's final state
+        edges = np.diff(np.concatenate(([self._in_speech], mask)).astype(np.int8))
+        for index in np.flatnonzero(edges):
+            frame = first_frame + int(index)
+            if edges[index] > 0 and self._open_pause_start is not None:
+                pause_duration = (frame - self._open_pause_start) * self.time_per_frame
+                if pause_duration > self.min_pause:
+                    self.pauses.append({
+                        "start_time": round(self._open_pause_start * self.time_per_frame, 2),
+                        "duration": round(pause_duration, 2),
+                        "type": AudioAnalysisService._classify_pause(pause_duration)
+                    })
+                self._open_pause_start = None
+            elif edges[index] < 0:
+                self._open_pause_start = frame
+        self._in_speech = bool(mask[-1])
+
+    def _update_pitch(self):
+        window = np.concatenate(self._pitch_pending)
+        self._pitch_pending = []
+        self._pitch_pending_samples = 0
+
+        # Gate on the stream's running energy, not the window's own mean
+        f0 = self.pitch_tracker.track(
+            AudioFeatureFrames(window, self.sample_rate),
+            energy_floor=self._energy_mean * self.silence_ratio
+        ).voiced_f0
+        if f0.size == 0:
+            return
+        f0 = f0.astype(np.float64)
+        self._pitch_count += f0.size
+        self._pitch_sum += f0.sum()
+        self._pitch_sumsq += np.square(f0).sum()
+        self._pitch_min = min(self._pitch_min, f0.min())
+        self._pitch_max = max(self._pitch_max, f0.max())
+
+    def partial_metrics(self) -> Dict[str, Any]:
+        """Running metrics for everything received so far"""
+        speech_duration = self._speech_frames * self.time_per_frame
+        estimated_words = speech_duration * 2.5 / 1.5
+        wpm = estimated_words / (self.duration / 60) if self.duration > 0 else 0
+        energy_std = np.sqrt(self._energy_m2 / self._frames) if self._frames else 0.0
+
+        pitch = {}
+        if self._pitch_count:
+            mean_pitch = self._pitch_sum / self._pitch_count
+            pitch_std = np.sqrt(max(self._pitch_sumsq / self._pitch_count - mean_pitch ** 2, 0.0))
+            pitch = {
+                "mean_pitch_hz": round(mean_pitch, 2),
+                "pitch_variation": round(pitch_std / mean_pitch, 3) if mean_pitch > 0 else 0,
+                "pitch_range_hz": round(self._pitch_max - self._pitch_min, 2)
+            }
+
+        open_pause = None
+        if self._open_pause_start is not None:
+            open_pause = {
+                "start_time": round(self._open_pause_start * self.time_per_frame, 2),
+                "duration": round((self._frames - self._open_pause_start) * self.time_per_frame, 2)
+            }
+
+        return {
+            "elapsed_seconds": round(self.duration, 2),
+            "speech_rate": {
+                "words_per_minute": round(wpm, 1),
+                "speech_duration": round(speech_duration, 2),
+                "assessment": AudioAnalysisService._assess_speech_rate(wpm)
+            },
+            "energy": {
+                "average_energy": round(self._energy_mean, 4),
+                "energy_variation": round(energy_std, 4)
+            },
+            "pauses": list(self.pauses),
+            "open_pause": open_pause,
+            "pitch": pitch
+        }
+
+    def signal(self) -> np.ndarray:
+        """The full answer received so far as one float32 array"""
+        if not self._chunks:
+            return np.zeros(0, dtype=np.float32)
+        if len(self._chunks) > 1:
+            self._chunks = [np.concatenate(self._chunks)]
+        return self._chunks[0]
@@ -0,0 +1,154 @@
+import io
+import math
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import BinaryIO, Iterator, List, Optional, Union
+import PyPDF2
+import docx
+from loguru import logger
+
+# Raw bytes or an open (spooled) upload
+DocumentSource = Union[bytes, BinaryIO]
+
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+
+def read_document(file_data: DocumentSource) -> bytes:
+    """Bytes of an upload, reading a file handle from the start"""
+    if isinstance(file_data, (bytes, bytearray)):
+        return bytes(file_data)
+    file_data.seek(0)
+    return file_data.read()
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Text of pages ``start..stop-1``; runs in a page worker with its own reader"""
+    with open(pdf_path, "rb") as pdf_file:
+        reader = PyPDF2.PdfReader(pdf_file)
+        return [reader.pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+def _get_page_pool(workers: int) -> ProcessPoolExecutor:
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            context = multiprocessing.get_context(os.getenv("EXECUTOR_START_METHOD", "spawn"))
+            _page_pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return _page_pool
+
+
+def _reset_page_pool():
+    global _page_pool
+    with _page_pool_lock:
+        pool, _page_pool = _page_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_page_pool():
+    """Stop the shared page worker pool, e.g. at app shutdown; the next parallel extraction starts a new one"""
+    _reset_page_pool()
+
+
+class DocumentTextExtractor:
+    """Page-by-page text from PDF, DOCX and plain-text uploads, read in memory.
+
+    At most ``max_pages`` (``RESUME_MAX_PAGES``) pages are read, and
+    extraction stops after ``max_seconds`` (``RESUME_MAX_SECONDS``); either
+    cut-off sets ``truncated``. PDFs with at least ``parallel_pages``
+    (``RESUME_PDF_PARALLEL_PAGES``) pages are split into page ranges that a
+    shared process pool of ``RESUME_PDF_WORKERS`` workers extracts
+    concurrently, collected back in page order. The PDF is written once to
+    a temporary file that each worker opens, rather than pickled per range.
+    """
+
+    def __init__(
+        self,
+        max_pages: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        parallel_pages: Optional[int] = None,
+        workers: Optional[int] = None
+    ):
+        self.max_pages = max_pages or int(os.getenv("RESUME_MAX_PAGES", 20))
+        self.max_seconds = max_seconds or float(os.getenv("RESUME_MAX_SECONDS", 10))
+        self.parallel_pages = parallel_pages or int(os.getenv("RESUME_PDF_PARALLEL_PAGES", 8))
+        self.workers = workers or int(os.getenv("RESUME_PDF_WORKERS", min(4, os.cpu_count() or 1)))
+        self.truncated = False
+        self.page_count = 0
+
+    def pages(self, file_data: DocumentSource, file_type: str) -> List[str]:
+        """Text of each page read (a single page for DOCX and plain text)"""
+        if file_type == "pdf":
+            return list(self._pdf_pages(read_document(file_data)))
+        if file_type in ("doc", "docx"):
+            return [self._docx_text(file_data)]
+        if file_type == "txt":
+            self.page_count = 1
+            return [read_document(file_data).decode("utf-8", errors="ignore")]
+        raise ValueError(f"Unsupported file format: {file_type}")
+
+    def text(self, file_data: DocumentSource, file_type: str) -> str:
+        return "\n".join(self.pages(file_data, file_type)).strip()
+
+    def _pdf_pages(self, pdf_bytes: bytes) -> Iterator[str]:
+        deadline = time.monotonic() + self.max_seconds
+        reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+        self.page_count = len(reader.pages)
+        page_limit = min(self.page_count, self.max_pages)
+        self.truncated = self.page_count > page_limit
+
+        if page_limit < self.parallel_pages or self.workers <= 1:
+            yield from self._sequential_pages(reader, 0, page_limit, deadline)
+            return
+
+        # Small ranges spread work evenly across workers; larger ones amortize reader setup
+        chunk = max(1, math.ceil(page_limit / (self.workers * 2)))
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as pdf_file:
+            pdf_file.write(pdf_bytes)
+        pool = _get_page_pool(self.workers)
+        futures: List[Future] = []
+        try:
+            futures = [
+                pool.submit(_extract_page_range, pdf_file.name, start, min(start + chunk, page_limit))
+                for start in range(0, page_limit, chunk)
+            ]
+            for index, future in enumerate(futures):
+                try:
+                    pages = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    self.truncated = True
+                    return
+                except BrokenExecutor:
+                    # A page worker died; restart the pool next time and finish here
+                    logger.error("PDF page pool is broken, extracting remaining pages sequentially")
+                    _reset_page_pool()
+                    yield from self._sequential_pages(reader, index * chunk, page_limit, deadline)
+                    return
+                yield from pages
+        finally:
+            for future in futures:
+                future.cancel()
+            # Ranges still running after a cut-off are abandoned, so removing the file under them is harmless
+            os.unlink(pdf_file.name)
+
+    def _sequential_pages(self, reader: PyPDF2.PdfReader, start: int, stop: int, deadline: float) -> Iterator[str]:
+        for index in range(start, stop):
+            yield reader.pages[index].extract_text() or ""
+            if time.monotonic() > deadline and index + 1 < stop:
+                self.truncated = True
+                return
+
+    def _docx_text(self, file_data: DocumentSource) -> str:
+        self.page_count = 1
+        if isinstance(file_data, (bytes, bytearray)):
+            file_data = io.BytesIO(file_data)
+        else:
+            file_data.seek(0)
+        document = docx.Document(file_data)
+        return "\n".join(paragraph.text for paragraph in document.paragraphs)
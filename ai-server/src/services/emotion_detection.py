@@ -1,11 +1,12 @@
 import base64
-import io
+import os
 import cv2
 import numpy as np
 from typing import Dict, List, Any, Optional
 from loguru import logger
-import tempfile
-import os
+from services.fallbacks import EMOTIONS, default_emotion_stats, emotion_batch_fallback
+from services.frame_pipeline import FrameConsumer, SampledFrame
+from services.video_frames import FrameSampler, VideoSource, open_video
 
 try:
     from deepface import DeepFace
@@ -16,7 +17,7 @@ except ImportError:
 
 class EmotionDetectionService:
     def __init__(self):
-        self.emotions = ["angry", "disgust", "fear", "happy", "sad", "surprise", "neutral"]
+        self.emotions = list(EMOTIONS)
         self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
         logger.info(f"Emotion detection service initialized (DeepFace: {DEEPFACE_AVAILABLE})")
 
@@ -33,6 +34,10 @@ class EmotionDetectionService:
             logger.error(f"Emotion detection health check failed: {e}")
             return {"status": "unhealthy", "service": "emotion_detection", "error": str(e)}
 
+    async def warmup(self):
+        """Classify one synthetic frame so emotion models are loaded before the first request"""
+        await self.analyze_frame_array(np.zeros((480, 640, 3), dtype=np.uint8))
+
     async def analyze_emotions(self, image_data: str, timestamp: float = 0) -> Dict[str, Any]:
         """Analyze emotions from a single image"""
         try:
@@ -44,6 +49,15 @@ class EmotionDetectionService:
             if image is None:
                 raise ValueError("Could not decode image")
             
+            return await self.analyze_frame_array(image, timestamp)
+            
+        except Exception as e:
+            logger.error(f"Emotion analysis error: {e}")
+            return self._get_fallback_emotion_result(timestamp)
+
+    async def analyze_frame_array(self, image: np.ndarray, timestamp: float = 0) -> Dict[str, Any]:
+        """Analyze emotions from an already decoded BGR frame"""
+        try:
             # Use DeepFace if available, otherwise use fallback
             if DEEPFACE_AVAILABLE:
                 result = await self._analyze_with_deepface(image, timestamp)
@@ -57,21 +71,10 @@ class EmotionDetectionService:
             logger.error(f"Emotion analysis error: {e}")
             return self._get_fallback_emotion_result(timestamp)
 
-    async def batch_analyze_video(self, video_data: bytes) -> List[Dict[str, Any]]:
-        """Analyze emotions throughout an entire video"""
+    async def batch_analyze_video(self, video_data: VideoSource) -> List[Dict[str, Any]]:
+        """Analyze emotions throughout an entire video (base64, bytes or an open file handle)"""
         try:
-            # Save video to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as temp_file:
-                temp_file.write(video_data)
-                temp_file_path = temp_file.name
-            
-            try:
-                # Open video
-                cap = cv2.VideoCapture(temp_file_path)
-                
-                if not cap.isOpened():
-                    raise ValueError("Could not open video file")
-                
+            with open_video(video_data) as cap:
                 fps = cap.get(cv2.CAP_PROP_FPS)
                 frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
                 duration = frame_count / fps if fps > 0 else 0
@@ -84,89 +87,64 @@ class EmotionDetectionService:
                 frame_number = 0
                 
                 while True:
-                    ret, frame = cap.read()
-                    if not ret:
+                    # Advance without converting frames that are not sampled
+                    if not cap.grab():
                         break
                     
                     # Analyze frame if it's at the right interval
                     if frame_number % frame_interval == 0:
+                        ret, frame = cap.retrieve()
+                        if not ret:
+                            break
                         timestamp = frame_number / fps if fps > 0 else frame_number * 0.033
                         
-                        # Convert frame to base64 for analysis
-                        _, buffer = cv2.imencode('.jpg', frame)
-                        frame_base64 = base64.b64encode(buffer).decode('utf-8')
-                        
-                        # Analyze emotions
-                        emotion_result = await self.analyze_emotions(frame_base64, timestamp)
+                        # Analyze the decoded frame directly, no re-encode round trip
+                        emotion_result = await self.analyze_frame_array(frame, timestamp)
                         emotions_timeline.append(emotion_result)
                     
                     frame_number += 1
-                
-                cap.release()
-                
-                # Calculate overall emotion statistics
-                overall_stats = self._calculate_emotion_statistics(emotions_timeline)
-                
-                return {
-                    "timeline": emotions_timeline,
-                    "overall_statistics": overall_stats,
-                    "video_duration": duration,
-                    "frames_analyzed": len(emotions_timeline)
-                }
-                
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
+            
+            # Calculate overall emotion statistics
+            overall_stats = self._calculate_emotion_statistics(emotions_timeline)
+            
+            return {
+                "timeline": emotions_timeline,
+                "overall_statistics": overall_stats,
+                "video_duration": duration,
+                "frames_analyzed": len(emotions_timeline)
+            }
                     
         except Exception as e:
             logger.error(f"Batch emotion analysis error: {e}")
-            return {
-                "timeline": [],
-                "overall_statistics": self._get_default_emotion_stats(),
-                "video_duration": 0,
-                "frames_analyzed": 0,
-                "error": str(e)
-            }
+            return self._get_fallback_batch_analysis(str(e))
 
     async def _analyze_with_deepface(self, image: np.ndarray, timestamp: float) -> Dict[str, Any]:
         """Analyze emotions using DeepFace"""
         try:
-            # Save image to temporary file for DeepFace
-            with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as temp_file:
-                cv2.imwrite(temp_file.name, image)
-                temp_file_path = temp_file.name
-            
-            try:
-                # Analyze with DeepFace
-                result = DeepFace.analyze(
-                    img_path=temp_file_path,
-                    actions=['emotion'],
-                    enforce_detection=False
-                )
-                
-                # Extract emotion data
-                if isinstance(result, list):
-                    emotion_data = result[0]['emotion']
-                else:
-                    emotion_data = result['emotion']
-                
-                # Find dominant emotion
-                dominant_emotion = max(emotion_data.items(), key=lambda x: x[1])
-                
-                return {
-                    "emotions": emotion_data,
-                    "dominant_emotion": dominant_emotion[0],
-                    "confidence": dominant_emotion[1] / 100.0,
-                    "timestamp": timestamp,
-                    "face_detected": True,
-                    "method": "deepface"
-                }
-                
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
+            # DeepFace accepts BGR arrays directly, no temporary image file needed
+            result = DeepFace.analyze(
+                img_path=image,
+                actions=['emotion'],
+                enforce_detection=False
+            )
+            
+            # Extract emotion data
+            if isinstance(result, list):
+                emotion_data = result[0]['emotion']
+            else:
+                emotion_data = result['emotion']
+            
+            # Find dominant emotion
+            dominant_emotion = max(emotion_data.items(), key=lambda x: x[1])
+            
+            return {
+                "emotions": emotion_data,
+                "dominant_emotion": dominant_emotion[0],
+                "confidence": dominant_emotion[1] / 100.0,
+                "timestamp": timestamp,
+                "face_detected": True,
+                "method": "deepface"
+            }
                     
         except Exception as e:
             logger.error(f"DeepFace analysis error: {e}")
@@ -333,12 +311,38 @@ class EmotionDetectionService:
             "method": "fallback"
         }
 
+    def _get_fallback_batch_analysis(self, error: str) -> Dict[str, Any]:
+        """Fallback batch result when the video cannot be processed"""
+        return emotion_batch_fallback(error)
+
     def _get_default_emotion_stats(self) -> Dict[str, Any]:
         """Get default emotion statistics"""
+        return default_emotion_stats()
+
+
+class EmotionConsumer(FrameConsumer):
+    """Classifies emotions on the shared decoded frames, every 2 seconds like ``batch_analyze_video``.
+
+    Classification runs on its own time budget (``VIDEO_EMOTION_MAX_SECONDS``)
+    so it does not eat into the landmark consumers' sampling budget.
+    """
+
+    name = "emotions"
+    min_interval = 2.0
+
+    def __init__(self, service: EmotionDetectionService):
+        self.service = service
+        self.max_seconds = float(os.getenv("VIDEO_EMOTION_MAX_SECONDS", 10))
+        self.timeline: List[Dict[str, Any]] = []
+
+    async def consume(self, frame: SampledFrame):
+        self.timeline.append(await self.service.analyze_frame_array(frame.bgr, frame.timestamp))
+
+    def result(self, sampler: FrameSampler) -> Dict[str, Any]:
         return {
-            "average_emotions": {emotion: 100/len(self.emotions) for emotion in self.emotions},
-            "dominant_emotion_overall": "neutral",
-            "average_confidence": 0.6,
-            "emotion_stability": 0.8,
-            "frames_with_faces": 0
-        }
\ No newline at end of file
+            "timeline": self.timeline,
+            "overall_statistics": self.service._calculate_emotion_statistics(self.timeline),
+            "video_duration": sampler.video_duration,
+            "frames_analyzed": len(self.timeline),
+            "sampling_truncated": sampler.truncated or self.budget_exhausted
+        }
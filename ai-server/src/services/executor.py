@@ -0,0 +1,321 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+from loguru import logger
+from services.registry import run_warmup
+
+# Service instances owned by the current worker thread/process, keyed by pool name
+_worker_state = threading.local()
+
+
+def _init_worker(name: str, service_factory: Callable[[], Any]):
+    """Build a worker-local service instance (models, graphs, cascades) once per worker"""
+    services = getattr(_worker_state, "services", None)
+    if services is None:
+        services = _worker_state.services = {}
+    services[name] = service_factory()
+
+
+def _call_service(name: str, method: str, args: tuple, kwargs: dict) -> Any:
+    """Invoke a method on the worker-local service, driving coroutines to completion"""
+    result = getattr(_worker_state.services[name], method)(*args, **kwargs)
+    if asyncio.iscoroutine(result):
+        return asyncio.run(result)
+    return result
+
+
+def _warm_worker(name: str) -> Optional[Dict[str, Any]]:
+    """Run the worker-local service's warmup (graph initialization, JIT compilation).
+
+    Returns the service's own health check, taken while the worker is
+    otherwise idle, so the pool can report it without queueing a probe later.
+    """
+    service = _worker_state.services[name]
+    run_warmup(service)
+    check = getattr(service, "health_check", None)
+    if check is None:
+        return None
+    result = check()
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    return dict(result)
+
+
+class ExecutorBusyError(RuntimeError):
+    """Raised when a pool already has its maximum number of queued calls"""
+
+
+class ServicePool:
+    """A thread or process pool dedicated to one service.
+
+    Each worker builds its own service instance through ``service_factory``,
+    so per-worker state (MediaPipe graphs, numba caches, OpenCV cascades) is
+    never shared between concurrent calls. Pool size and queue depth default to
+    ``EXECUTOR_<NAME>_WORKERS`` and ``EXECUTOR_<NAME>_QUEUE``.
+
+    A ``sticky`` pool runs one single-worker executor per worker, and calls
+    made with the same ``shard_key`` always land on the same worker. Stateful
+    services (e.g. per-session tracking graphs) rely on this.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        service_factory: Callable[[], Any],
+        kind: str = "thread",
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        sticky: bool = False
+    ):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+
+        prefix = f"EXECUTOR_{name.upper()}"
+        self.name = name
+        self.kind = kind
+        self.service_factory = service_factory
+        self.max_workers = max_workers or int(os.getenv(f"{prefix}_WORKERS", 2))
+        self.max_queue = max_queue if max_queue is not None else int(os.getenv(f"{prefix}_QUEUE", 16))
+        self.sticky = sticky
+
+        shards = self.max_workers if sticky else 1
+        self._executors: List[Optional[Executor]] = [None] * shards
+        self._shard_in_flight = [0] * shards
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self.warm = False
+        self.warmup_ms: Optional[int] = None
+        self.warmup_errors: List[str] = []
+        self.worker_health: Optional[Dict[str, Any]] = None
+
+    def _get_executor(self, shard: int) -> Executor:
+        if self._executors[shard] is None:
+            workers = 1 if self.sticky else self.max_workers
+            if self.kind == "process":
+                context = multiprocessing.get_context(os.getenv("EXECUTOR_START_METHOD", "spawn"))
+                self._executors[shard] = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.name, self.service_factory)
+                )
+            else:
+                self._executors[shard] = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix=f"{self.name}-worker",
+                    initializer=_init_worker,
+                    initargs=(self.name, self.service_factory)
+                )
+            logger.info(f"Started {self.kind} pool '{self.name}' shard {shard} with {workers} workers")
+        return self._executors[shard]
+
+    def _select_shard(self, shard_key: Optional[str]) -> int:
+        if len(self._executors) == 1:
+            return 0
+        if shard_key is not None:
+            return zlib.crc32(shard_key.encode("utf-8")) % len(self._executors)
+        return min(range(len(self._executors)), key=self._shard_in_flight.__getitem__)
+
+    async def call(self, method: str, *args, shard_key: Optional[str] = None, **kwargs) -> Any:
+        """Run ``service.method(*args, **kwargs)`` on a worker without blocking the event loop"""
+        if self._in_flight >= self.max_workers + self.max_queue:
+            self._rejected += 1
+            raise ExecutorBusyError(f"The {self.name} service is busy, please retry shortly")
+
+        shard = self._select_shard(shard_key)
+        self._in_flight += 1
+        self._shard_in_flight[shard] += 1
+        loop = asyncio.get_running_loop()
+        submitted = False
+        try:
+            future = self._get_executor(shard).submit(_call_service, self.name, method, args, kwargs)
+            # The slot is held until the worker finishes, not until the caller stops
+            # waiting: a timed-out or cancelled call keeps its worker busy
+            future.add_done_callback(partial(self._on_call_done, loop, shard))
+            submitted = True
+            result = await asyncio.wrap_future(future)
+            self._completed += 1
+            return result
+        except BrokenExecutor:
+            # A worker died (e.g. OOM); drop the pool so the next call starts a fresh one
+            logger.error(f"Executor pool '{self.name}' shard {shard} is broken, restarting on next call")
+            self._failed += 1
+            self._reset(shard)
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            if not submitted:
+                self._release_slot(shard)
+
+    def _on_call_done(self, loop: asyncio.AbstractEventLoop, shard: int, future):
+        # Runs in the worker (thread pools) or the pool's management thread
+        # (process pools); the counters belong to the event loop thread
+        try:
+            loop.call_soon_threadsafe(self._release_slot, shard)
+        except RuntimeError:
+            # The loop has closed (shutdown); there is nothing left to admit
+            pass
+
+    def _release_slot(self, shard: int):
+        self._in_flight -= 1
+        self._shard_in_flight[shard] -= 1
+
+    async def warmup(self):
+        """Start every worker and run the service warmup in it.
+
+        Sticky pools get one call per shard. Other pools get one call per
+        worker; the executor hands them to idle workers, so this warms every
+        worker in practice but is best effort. The pool counts as warm once
+        at least one call succeeded; failures (e.g. the service could not be
+        imported or built in the worker) are kept in ``warmup_errors``.
+        """
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+
+        async def warm_one(shard: int):
+            # Submitting inside the coroutine captures a pool that breaks between submissions
+            await loop.run_in_executor(self._get_executor(shard), _warm_worker, self.name)
+
+        calls = [
+            warm_one(shard)
+            for shard in range(len(self._executors))
+            for _ in range(1 if self.sticky else self.max_workers)
+        ]
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        reports = [result for result in results if isinstance(result, dict)]
+        if reports:
+            self.worker_health = reports[0]
+        for error in errors:
+            logger.warning(f"Executor pool '{self.name}' warmup failed: {error!r}")
+        if any(isinstance(error, BrokenExecutor) for error in errors):
+            # Workers that failed to initialize break their executor; start fresh next time
+            self.shutdown()
+
+        self.warmup_ms = round((time.perf_counter() - started) * 1000)
+        self.warmup_errors = list(dict.fromkeys(repr(error) for error in errors))
+        self.warm = len(errors) < len(calls)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Pool health from worker liveness and load, without queueing a probe.
+
+        A probe sent as a job would wait behind real analysis calls (which
+        can take minutes) and time out on a busy but healthy pool. Instead
+        this reports the service check taken during warmup, ``unhealthy`` when
+        the pool is broken or a worker process died, and ``degraded`` when the
+        pool is saturated. An idle pool is not started just to be checked, and
+        a pool whose warmup failed retries it first, so a transient failure
+        recovers.
+        """
+        if self.warmup_errors and not self.warm:
+            await self.warmup()
+            if not self.warm:
+                return {"status": "unhealthy", "service": self.name, "error": self.warmup_errors[0]}
+        if not any(executor is not None for executor in self._executors):
+            return {"status": "starting", "service": self.name, "state": "idle"}
+
+        result = {"status": "healthy", "service": self.name, **(self.worker_health or {})}
+        result["in_flight"] = self._in_flight
+        result["queued"] = max(0, self._in_flight - self.max_workers)
+        dead = self._dead_workers()
+        if dead:
+            result.update(status="unhealthy", error=f"{dead} worker(s) not running")
+        elif result["status"] == "healthy" and self._in_flight >= self.max_workers + self.max_queue:
+            result.update(status="degraded", error="Pool saturated, new calls are rejected")
+        return result
+
+    def _dead_workers(self) -> int:
+        """Workers of started executors that are broken or no longer alive"""
+        dead = 0
+        for executor in self._executors:
+            if executor is None:
+                continue
+            if getattr(executor, "_broken", False):
+                dead += 1
+                continue
+            # Process pools spawn workers on demand; only the spawned ones are checked
+            processes = getattr(executor, "_processes", None) or {}
+            dead += sum(1 for process in list(processes.values()) if not process.is_alive())
+        return dead
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "sticky": self.sticky,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queued": max(0, self._in_flight - self.max_workers),
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "started": any(executor is not None for executor in self._executors),
+            "warm": self.warm,
+            "warmup_ms": self.warmup_ms,
+            "warmup_errors": self.warmup_errors
+        }
+
+    def _reset(self, shard: int):
+        executor, self._executors[shard] = self._executors[shard], None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        for shard in range(len(self._executors)):
+            self._reset(shard)
+
+
+class ExecutorManager:
+    """Registry of per-service pools that endpoints await CPU-bound work through"""
+
+    def __init__(self):
+        self._pools: Dict[str, ServicePool] = {}
+
+    def register(
+        self,
+        name: str,
+        service_factory: Callable[[], Any],
+        kind: str = "thread",
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        sticky: bool = False
+    ) -> ServicePool:
+        pool = ServicePool(name, service_factory, kind, max_workers, max_queue, sticky)
+        self._pools[name] = pool
+        return pool
+
+    def get(self, name: str) -> ServicePool:
+        if name not in self._pools:
+            raise KeyError(f"No executor registered for service '{name}'")
+        return self._pools[name]
+
+    async def run(self, name: str, method: str, *args, shard_key: Optional[str] = None, **kwargs) -> Any:
+        return await self.get(name).call(method, *args, shard_key=shard_key, **kwargs)
+
+    async def warmup(self):
+        """Warm every pool's workers concurrently"""
+        started = time.perf_counter()
+        await asyncio.gather(*(pool.warmup() for pool in self._pools.values()))
+        breakdown = ", ".join(f"{name} {pool.warmup_ms}ms" for name, pool in self._pools.items())
+        logger.info(f"Executor warmup finished in {(time.perf_counter() - started) * 1000:.0f}ms: {breakdown}")
+
+    @property
+    def warm(self) -> bool:
+        return all(pool.warm for pool in self._pools.values())
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+    def shutdown(self):
+        for pool in self._pools.values():
+            pool.shutdown()
@@ -0,0 +1,67 @@
+from typing import Any, Dict
+
+# Fallback results served when an analysis stage fails or times out. This
+# module has no heavy imports (librosa, OpenCV, MediaPipe), so the API process
+# can build a fallback without loading the service that normally runs the stage.
+
+EMOTIONS = ["angry", "disgust", "fear", "happy", "sad", "surprise", "neutral"]
+
+
+def audio_analysis_fallback() -> Dict[str, Any]:
+    """Fallback audio analysis when processing fails"""
+    return {
+        "speech_rate": {
+            "words_per_minute": 150,
+            "assessment": "Normal pace"
+        },
+        "pause_analysis": [],
+        "tone_analysis": [{"analysis": "Analysis unavailable"}],
+        "clarity_score": 75.0,
+        "volume_analysis": {
+            "average_volume_db": -20,
+            "volume_assessment": "Normal volume"
+        },
+        "energy_analysis": {
+            "average_energy": 0.1,
+            "energy_consistency": 0.8
+        }
+    }
+
+
+def video_analysis_fallback() -> Dict[str, Any]:
+    """Fallback video analysis when video processing fails"""
+    return {
+        "overall_score": 70.0,
+        "eye_contact": {
+            "eye_contact_percentage": 70.0,
+            "assessment": "Unable to analyze"
+        },
+        "posture": {
+            "posture_score": 75.0,
+            "posture_assessment": "Unable to analyze"
+        },
+        "engagement_level": "Unable to determine",
+        "recommendations": ["Ensure good lighting and camera positioning"]
+    }
+
+
+def default_emotion_stats() -> Dict[str, Any]:
+    """Default emotion statistics"""
+    return {
+        "average_emotions": {emotion: 100/len(EMOTIONS) for emotion in EMOTIONS},
+        "dominant_emotion_overall": "neutral",
+        "average_confidence": 0.6,
+        "emotion_stability": 0.8,
+        "frames_with_faces": 0
+    }
+
+
+def emotion_batch_fallback(error: str) -> Dict[str, Any]:
+    """Fallback batch emotion result when the video cannot be processed"""
+    return {
+        "timeline": [],
+        "overall_statistics": default_emotion_stats(),
+        "video_duration": 0,
+        "frames_analyzed": 0,
+        "error": error
+    }
@@ -0,0 +1,105 @@
+import time
+from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+import cv2
+import numpy as np
+from loguru import logger
+from services.video_frames import FrameSampler, VideoSource, open_video
+
+
+class SampledFrame:
+    """One decoded frame shared by every consumer; the RGB copy is made at most once"""
+
+    def __init__(self, timestamp: float, bgr: np.ndarray):
+        self.timestamp = timestamp
+        self.bgr = bgr
+
+    @cached_property
+    def rgb(self) -> np.ndarray:
+        return cv2.cvtColor(self.bgr, cv2.COLOR_BGR2RGB)
+
+    @property
+    def aspect_ratio(self) -> float:
+        return self.bgr.shape[1] / self.bgr.shape[0]
+
+
+class FrameConsumer(ABC):
+    """An analysis fed by ``FramePipeline`` that accumulates its own state.
+
+    ``min_interval`` thins the shared sample stream for expensive consumers
+    (e.g. emotion classification every 2s while landmarks run every 0.5s).
+    A consumer with ``max_seconds`` gets its own processing budget: its time
+    is not charged to the sampler's shared decode budget, so it does not cut
+    the frame coverage of the other consumers, and once its budget is spent
+    it is fed no more frames and ``budget_exhausted`` is set.
+    """
+
+    name = "consumer"
+    min_interval = 0.0
+    max_seconds: Optional[float] = None
+    budget_exhausted = False
+
+    @abstractmethod
+    async def consume(self, frame: SampledFrame):
+        """Analyze one sampled frame"""
+
+    @abstractmethod
+    def result(self, sampler: FrameSampler) -> Dict[str, Any]:
+        """Summarize every frame consumed so far"""
+
+
+class FramePipeline:
+    """Decode a video once and dispatch each sampled frame to registered consumers.
+
+    A consumer that fails on a frame skips that frame; one that fails to build
+    its result is left out of the returned dict (and recorded in ``errors``)
+    so the other analyses still come back.
+    """
+
+    def __init__(self, sampler: Optional[FrameSampler] = None):
+        self.sampler = sampler or FrameSampler()
+        self.consumers: List[FrameConsumer] = []
+        self.errors: Dict[str, str] = {}
+
+    def register(self, consumer: FrameConsumer) -> "FramePipeline":
+        self.consumers.append(consumer)
+        return self
+
+    async def run(self, video_data: VideoSource, duration: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        last_fed = {consumer.name: -np.inf for consumer in self.consumers}
+        spent = {consumer.name: 0.0 for consumer in self.consumers}
+        frame_count = 0
+
+        with open_video(video_data) as cap:
+            for timestamp, bgr in self.sampler.sample(cap, duration):
+                frame = SampledFrame(timestamp, bgr)
+                frame_count += 1
+                for consumer in self.consumers:
+                    if consumer.budget_exhausted or timestamp - last_fed[consumer.name] < consumer.min_interval:
+                        continue
+                    last_fed[consumer.name] = timestamp
+                    started = time.monotonic()
+                    try:
+                        await consumer.consume(frame)
+                    except Exception as e:
+                        logger.error(f"Frame consumer '{consumer.name}' failed at {timestamp:.2f}s: {e}")
+                    if consumer.max_seconds is not None:
+                        elapsed = time.monotonic() - started
+                        spent[consumer.name] += elapsed
+                        self.sampler.excluded_seconds += elapsed
+                        consumer.budget_exhausted = spent[consumer.name] >= consumer.max_seconds
+
+        if frame_count == 0:
+            raise ValueError("No frames could be read from video")
+
+        results = {}
+        for consumer in self.consumers:
+            try:
+                results[consumer.name] = consumer.result(self.sampler)
+            except Exception as e:
+                logger.error(f"Frame consumer '{consumer.name}' produced no result: {e}")
+                self.errors[consumer.name] = str(e)
+
+        logger.info(f"Frame pipeline decoded {frame_count} frames for {len(self.consumers)} consumers")
+        return results
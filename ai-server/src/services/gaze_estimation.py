@@ -0,0 +1,99 @@
+import numpy as np
+
+# FaceMesh landmark indices; refine_landmarks=True adds the iris points 468-477
+FACE_MESH_POINTS = 478
+RIGHT_EYE_CORNERS = (33, 133)
+LEFT_EYE_CORNERS = (362, 263)
+RIGHT_EYE_LIDS = (159, 145)
+LEFT_EYE_LIDS = (386, 374)
+RIGHT_IRIS_CENTER = 468
+LEFT_IRIS_CENTER = 473
+NOSE_TIP = 1
+FACE_EDGES = (234, 454)
+
+
+def face_landmark_array(multi_face_landmarks) -> np.ndarray:
+    """First detected face as a (478, 3) array; NaN when no face (or no iris points) was found"""
+    points = np.full((FACE_MESH_POINTS, 3), np.nan, dtype=np.float32)
+    if multi_face_landmarks:
+        landmarks = multi_face_landmarks[0].landmark
+        count = min(len(landmarks), FACE_MESH_POINTS)
+        points[:count] = [(lm.x, lm.y, lm.z) for lm in landmarks[:count]]
+    return points
+
+
+class GazeEstimate:
+    """Per-frame gaze ratios, head yaw and eye-contact decisions"""
+
+    def __init__(
+        self,
+        horizontal: np.ndarray,
+        vertical: np.ndarray,
+        head_yaw: np.ndarray,
+        face_detected: np.ndarray,
+        on_camera: np.ndarray,
+        score: np.ndarray
+    ):
+        self.horizontal = horizontal
+        self.vertical = vertical
+        self.head_yaw = head_yaw
+        self.face_detected = face_detected
+        self.on_camera = on_camera
+        self.score = score
+
+
+class GazeEstimator:
+    """Eye contact from iris position within each eye, vectorized over frames.
+
+    The iris centre is located relative to the eye corners (horizontal) and
+    lids (vertical); both ratios sit near 0.5 when looking into the camera.
+    Head yaw is the nose tip's offset between the face edges. A frame counts
+    as eye contact when all three stay within their tolerances, and its score
+    falls from 100 at dead centre to 50 at the tolerance edge.
+    """
+
+    def __init__(
+        self,
+        horizontal_tolerance: float = 0.12,
+        vertical_tolerance: float = 0.2,
+        yaw_tolerance: float = 0.15
+    ):
+        self.horizontal_tolerance = horizontal_tolerance
+        self.vertical_tolerance = vertical_tolerance
+        self.yaw_tolerance = yaw_tolerance
+
+    def estimate(self, landmarks: np.ndarray) -> GazeEstimate:
+        """Estimate gaze for a (frames, 478, 3) landmark array"""
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        if landmarks.ndim == 2:
+            landmarks = landmarks[np.newaxis]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            horizontal = 0.5 * (
+                self._ratio(landmarks, RIGHT_IRIS_CENTER, RIGHT_EYE_CORNERS, axis=0) +
+                self._ratio(landmarks, LEFT_IRIS_CENTER, LEFT_EYE_CORNERS, axis=0)
+            )
+            vertical = 0.5 * (
+                self._ratio(landmarks, RIGHT_IRIS_CENTER, RIGHT_EYE_LIDS, axis=1) +
+                self._ratio(landmarks, LEFT_IRIS_CENTER, LEFT_EYE_LIDS, axis=1)
+            )
+            head_yaw = self._ratio(landmarks, NOSE_TIP, FACE_EDGES, axis=0) - 0.5
+
+            offset = np.maximum.reduce([
+                np.abs(horizontal - 0.5) / self.horizontal_tolerance,
+                np.abs(vertical - 0.5) / self.vertical_tolerance,
+                np.abs(head_yaw) / self.yaw_tolerance
+            ])
+            on_camera = offset <= 1.0
+
+        score = np.nan_to_num(np.clip(100.0 * (1.0 - offset / 2.0), 0.0, 100.0), nan=0.0)
+        face_detected = ~np.isnan(landmarks[:, NOSE_TIP, 0])
+        return GazeEstimate(horizontal, vertical, head_yaw, face_detected, on_camera, score)
+
+    @staticmethod
+    def _ratio(landmarks: np.ndarray, point: int, bounds: tuple, axis: int) -> np.ndarray:
+        """Position of ``point`` between two landmarks along one axis (0 at the first, 1 at the second)"""
+        start = landmarks[:, bounds[0], axis]
+        span = landmarks[:, bounds[1], axis] - start
+        span = np.where(np.abs(span) > 1e-6, span, np.nan)
+        return (landmarks[:, point, axis] - start) / span
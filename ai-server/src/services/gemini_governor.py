@@ -0,0 +1,215 @@
+import asyncio
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+from loguru import logger
+
+try:
+    from google.api_core import exceptions as api_exceptions
+    RETRYABLE_ERRORS = (
+        api_exceptions.ResourceExhausted,
+        api_exceptions.TooManyRequests,
+        api_exceptions.ServiceUnavailable,
+        api_exceptions.InternalServerError,
+        api_exceptions.DeadlineExceeded,
+        api_exceptions.GatewayTimeout,
+        asyncio.TimeoutError,
+        ConnectionError
+    )
+except ImportError:
+    RETRYABLE_ERRORS = (asyncio.TimeoutError, ConnectionError)
+
+T = TypeVar("T")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for rate budgeting (about four characters per token)"""
+    return len(text) // 4 + 1
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling the model while the circuit breaker is open"""
+
+
+class TokenBucket:
+    """Per-minute budget that refills continuously"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` is available (0 when it is available now)"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        amount = min(amount, self.capacity)
+        return 0.0 if self.tokens >= amount else (amount - self.tokens) / self.rate
+
+    def take(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+
+class GeminiGovernor:
+    """Admission control around every Gemini call.
+
+    - at most ``GEMINI_MAX_CONCURRENCY`` calls in flight; others queue
+    - request and token budgets per minute (``GEMINI_REQUESTS_PER_MINUTE``,
+      ``GEMINI_TOKENS_PER_MINUTE``; 0 disables a budget)
+    - per-attempt timeout (``GEMINI_REQUEST_TIMEOUT``) and jittered
+      exponential retry for rate-limit, 5xx and timeout errors only
+      (``GEMINI_MAX_RETRIES``)
+    - a circuit breaker that opens after ``GEMINI_BREAKER_FAILURES``
+      consecutive failed calls and fails fast with ``CircuitOpenError`` for
+      ``GEMINI_BREAKER_RESET_SECONDS``, then lets one probe call through
+
+    Callers already catch exceptions and return their ``_get_fallback_*``
+    result, so an open breaker turns into an immediate fallback.
+    """
+
+    def __init__(self):
+        self.max_concurrency = int(os.getenv("GEMINI_MAX_CONCURRENCY", 4))
+        self.request_timeout = float(os.getenv("GEMINI_REQUEST_TIMEOUT", 30))
+        self.max_retries = int(os.getenv("GEMINI_MAX_RETRIES", 3))
+        self.base_delay = float(os.getenv("GEMINI_RETRY_BASE_DELAY", 0.5))
+        self.max_delay = float(os.getenv("GEMINI_RETRY_MAX_DELAY", 8))
+        self.failure_threshold = int(os.getenv("GEMINI_BREAKER_FAILURES", 5))
+        self.reset_seconds = float(os.getenv("GEMINI_BREAKER_RESET_SECONDS", 30))
+
+        requests_per_minute = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", 60))
+        tokens_per_minute = int(os.getenv("GEMINI_TOKENS_PER_MINUTE", 250000))
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._budget_lock: Optional[asyncio.Lock] = None
+        self._state = "closed"
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._consecutive_failures = 0
+        self._queued = 0
+        self._in_flight = 0
+        self._stats = {
+            "calls": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "retries": 0,
+            "rejected": 0,
+            "throttled": 0
+        }
+
+    async def call(self, request: Callable[[], Awaitable[T]], estimated_tokens: int = 0) -> T:
+        """Run ``request()`` under the concurrency cap, budgets, retry policy and breaker"""
+        probe = self._admit()
+        self._stats["calls"] += 1
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._budget_lock = asyncio.Lock()
+
+        try:
+            self._queued += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self._queued -= 1
+
+            self._in_flight += 1
+            try:
+                return await self._call_with_retries(request, estimated_tokens, probe)
+            finally:
+                self._in_flight -= 1
+                self._semaphore.release()
+        finally:
+            if probe:
+                # Let another probe through if this one never reached a verdict
+                self._probe_in_flight = False
+
+    async def _call_with_retries(self, request: Callable[[], Awaitable[T]], estimated_tokens: int, probe: bool) -> T:
+        for attempt in range(self.max_retries + 1):
+            await self._wait_for_budget(estimated_tokens)
+            try:
+                result = await asyncio.wait_for(request(), self.request_timeout)
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    self._record_failure(probe)
+                    raise
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                self._stats["retries"] += 1
+                logger.warning(f"Gemini call failed ({type(e).__name__}), retry {attempt + 1} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                # Not an upstream health problem (e.g. invalid request); do not retry
+                self._stats["failed"] += 1
+                raise
+            self._record_success()
+            return result
+
+    def _admit(self) -> bool:
+        """Fail fast while open; returns True when this call is the half-open probe"""
+        if self._state == "open":
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                self._stats["rejected"] += 1
+                raise CircuitOpenError("Gemini circuit breaker is open")
+            self._state = "half_open"
+            logger.info("Gemini circuit breaker half-open, sending probe request")
+
+        if self._state == "half_open":
+            if self._probe_in_flight:
+                self._stats["rejected"] += 1
+                raise CircuitOpenError("Gemini circuit breaker is half-open")
+            self._probe_in_flight = True
+            return True
+        return False
+
+    async def _wait_for_budget(self, estimated_tokens: int):
+        async with self._budget_lock:
+            while True:
+                wait = 0.0
+                if self.request_bucket is not None:
+                    wait = max(wait, self.request_bucket.wait_time(1))
+                if self.token_bucket is not None:
+                    wait = max(wait, self.token_bucket.wait_time(estimated_tokens))
+                if wait <= 0:
+                    break
+                self._stats["throttled"] += 1
+                await asyncio.sleep(wait)
+
+            if self.request_bucket is not None:
+                self.request_bucket.take(1)
+            if self.token_bucket is not None:
+                self.token_bucket.take(estimated_tokens)
+
+    def _record_success(self):
+        self._stats["succeeded"] += 1
+        self._consecutive_failures = 0
+        if self._state != "closed":
+            logger.info("Gemini circuit breaker closed")
+        self._state = "closed"
+
+    def _record_failure(self, probe: bool):
+        self._stats["failed"] += 1
+        self._consecutive_failures += 1
+        if probe or self._consecutive_failures >= self.failure_threshold:
+            if self._state != "open":
+                logger.error(f"Gemini circuit breaker opened after {self._consecutive_failures} consecutive failures")
+            self._state = "open"
+            self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        retry_in = 0.0
+        if self._state == "open":
+            retry_in = max(0.0, self.reset_seconds - (time.monotonic() - self._opened_at))
+        return {
+            "breaker_state": self._state,
+            "consecutive_failures": self._consecutive_failures,
+            "breaker_retry_in_seconds": round(retry_in, 1),
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "max_concurrency": self.max_concurrency,
+            **self._stats
+        }
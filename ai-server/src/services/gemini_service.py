@@ -1,9 +1,73 @@
 import os
 import json
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 import google.generativeai as genai
 from loguru import logger
+from services.gemini_governor import GeminiGovernor, estimate_tokens
+from services.json_stream import IncrementalJSONParser, assemble_events
+from services.prompt_builder import CompactPromptBuilder, PromptSection, collapse_whitespace, summarize_analysis
+from services.response_batcher import ResponseAnalysisBatcher
+from services.response_cache import ResponseCache
+
+# Templates for prompts built under the token budget (see CompactPromptBuilder)
+FEEDBACK_PROMPT = """
+Generate comprehensive interview feedback based on:
+
+Interview Data: {interview_data}
+Analysis Results: {analysis_results}
+
+Generate detailed feedback including:
+1. Overall performance rating (0-100)
+2. Key strengths (3-5 points)
+3. Areas for improvement (3-5 points)
+4. Specific recommendations (3-5 actionable items)
+5. Next steps for improvement
+
+Return ONLY a JSON object with this exact structure:
+{{
+  "overallRating": 85,
+  "strengths": ["strength 1", "strength 2", "strength 3"],
+  "improvements": ["improvement 1", "improvement 2", "improvement 3"],
+  "recommendations": ["recommendation 1", "recommendation 2", "recommendation 3"],
+  "nextSteps": ["step 1", "step 2", "step 3"],
+  "detailedFeedback": "comprehensive narrative feedback"
+}}
+"""
+
+RESUME_PROMPT = """
+Analyze this resume content:
+
+{resume_text}
+
+{role_text}
+
+Extract and analyze:
+1. Skills (technical and soft skills)
+2. Experience level (years)
+3. Education background
+4. Certifications
+5. Key achievements
+6. Professional summary
+
+Return ONLY a JSON object with this exact structure:
+{{
+  "skills": ["skill1", "skill2", "skill3"],
+  "experience": 5,
+  "education": [
+    {{
+      "degree": "Bachelor's in Computer Science",
+      "institution": "University Name",
+      "year": 2020
+    }}
+  ],
+  "certifications": ["cert1", "cert2"],
+  "achievements": ["achievement1", "achievement2"],
+  "summary": "professional summary",
+  "matchScore": 85,
+  "recommendations": ["recommendation1", "recommendation2"]
+}}
+"""
 
 class GeminiService:
     def __init__(self):
@@ -12,34 +76,35 @@ class GeminiService:
             raise ValueError("GEMINI_API_KEY environment variable is required")
         
         genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(os.getenv("GEMINI_MODEL", "gemini-2.5-flash"))
+        self.model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+        self.model = genai.GenerativeModel(self.model_name)
+        self.cache = ResponseCache()
+        self.governor = GeminiGovernor()
+        self.prompt_builder = CompactPromptBuilder()
+        
+        # Opt-in micro-batching of analyze_response calls
+        self.batcher = None
+        if os.getenv("GEMINI_BATCH_ANALYSIS", "false").lower() == "true":
+            self.batcher = ResponseAnalysisBatcher(self)
         logger.info("Gemini service initialized successfully")
 
     async def health_check(self) -> Dict[str, str]:
-        """Check if Gemini service is healthy"""
-        try:
-            # Simple test generation
-            response = await self.model.generate_content_async("Test")
-            return {"status": "healthy", "service": "gemini"}
-        except Exception as e:
-            logger.error(f"Gemini health check failed: {e}")
-            return {"status": "unhealthy", "service": "gemini", "error": str(e)}
+        """Check if Gemini service is healthy from recent call outcomes (no model call, no quota)"""
+        breaker_state = self.governor.stats()["breaker_state"]
+        if breaker_state == "closed":
+            return {"status": "healthy", "service": "gemini", "model": self.model_name}
+        return {
+            "status": "degraded",
+            "service": "gemini",
+            "model": self.model_name,
+            "note": f"Circuit breaker {breaker_state}, serving fallbacks"
+        }
 
     async def generate_interview_questions(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate interview questions based on parameters"""
         try:
             prompt = self._build_question_prompt(params)
-            
-            response = await self.model.generate_content_async(prompt)
-            
-            # Parse JSON response
-            questions_text = response.text.strip()
-            if questions_text.startswith('```json'):
-                questions_text = questions_text[7:-3]
-            elif questions_text.startswith('```'):
-                questions_text = questions_text[3:-3]
-            
-            questions = json.loads(questions_text)
+            questions = await self._generate_json("questions", prompt)
             
             logger.info(f"Generated {len(questions)} questions for {params.get('role', 'unknown')} role")
             return questions
@@ -50,20 +115,16 @@ class GeminiService:
             return self._get_fallback_questions(params)
 
     async def analyze_response(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze interview response"""
+        """Analyze interview response, batched with concurrent calls when batching is enabled"""
+        if self.batcher is not None:
+            return await self.batcher.submit(params)
+        return await self._analyze_response_now(params)
+
+    async def _analyze_response_now(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze one interview response with its own model call"""
         try:
             prompt = self._build_analysis_prompt(params)
-            
-            response = await self.model.generate_content_async(prompt)
-            
-            # Parse JSON response
-            analysis_text = response.text.strip()
-            if analysis_text.startswith('```json'):
-                analysis_text = analysis_text[7:-3]
-            elif analysis_text.startswith('```'):
-                analysis_text = analysis_text[3:-3]
-            
-            analysis = json.loads(analysis_text)
+            analysis = await self._generate_json("analysis", prompt)
             
             logger.info(f"Analyzed response for question: {params.get('question', '')[:50]}...")
             return analysis
@@ -76,17 +137,7 @@ class GeminiService:
         """Generate comprehensive feedback"""
         try:
             prompt = self._build_feedback_prompt(params)
-            
-            response = await self.model.generate_content_async(prompt)
-            
-            # Parse JSON response
-            feedback_text = response.text.strip()
-            if feedback_text.startswith('```json'):
-                feedback_text = feedback_text[7:-3]
-            elif feedback_text.startswith('```'):
-                feedback_text = feedback_text[3:-3]
-            
-            feedback = json.loads(feedback_text)
+            feedback = await self._generate_json("feedback", prompt)
             
             logger.info("Generated comprehensive feedback")
             return feedback
@@ -95,21 +146,53 @@ class GeminiService:
             logger.error(f"Error generating feedback: {e}")
             return self._get_fallback_feedback()
 
+    async def analyze_interview_content(
+        self,
+        responses: List[Dict[str, Any]],
+        questions: List[Dict[str, Any]],
+        role: str
+    ) -> Dict[str, Any]:
+        """Analyze every answer of an interview concurrently and summarize the scores"""
+        questions_by_id = {question.get("id"): question for question in questions}
+        params = []
+        for index, response in enumerate(responses):
+            question = questions_by_id.get(response.get("questionId")) or (
+                questions[index] if index < len(questions) else {}
+            )
+            params.append({
+                "question": response.get("question") or question.get("text", ""),
+                "answer": response.get("answer") or response.get("transcript") or response.get("text", ""),
+                "role": role
+            })
+        
+        analyses = await asyncio.gather(*(self.analyze_response(item) for item in params))
+        scores = [a["overallScore"] for a in analyses if isinstance(a.get("overallScore"), (int, float))]
+        
+        return {
+            "responses": analyses,
+            "responseCount": len(analyses),
+            "averageScore": round(sum(scores) / len(scores), 1) if scores else None
+        }
+
+    async def stream_interview_questions(self, params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Generate interview questions, yielding each question as soon as it is complete"""
+        async for event in self._stream_json(
+            "questions", self._build_question_prompt(params), lambda: self._get_fallback_questions(params)
+        ):
+            yield event
+
+    async def stream_feedback(self, params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Generate feedback, yielding each field and list entry as soon as it is complete"""
+        async for event in self._stream_json(
+            "feedback", self._build_feedback_prompt(params), self._get_fallback_feedback
+        ):
+            yield event
+
     async def analyze_resume(self, resume_text: str, target_role: Optional[str] = None) -> Dict[str, Any]:
         """Analyze resume content"""
         try:
             prompt = self._build_resume_prompt(resume_text, target_role)
-            
-            response = await self.model.generate_content_async(prompt)
-            
-            # Parse JSON response
-            analysis_text = response.text.strip()
-            if analysis_text.startswith('```json'):
-                analysis_text = analysis_text[7:-3]
-            elif analysis_text.startswith('```'):
-                analysis_text = analysis_text[3:-3]
-            
-            analysis = json.loads(analysis_text)
+            analysis = await self._generate_json("resume", prompt)
             
             logger.info("Analyzed resume content")
             return analysis
@@ -118,6 +201,96 @@ class GeminiService:
             logger.error(f"Error analyzing resume: {e}")
             return self._get_fallback_resume_analysis()
 
+    async def close(self):
+        """Finish in-flight response batches before shutdown"""
+        if self.batcher is not None:
+            await self.batcher.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Governor, cache and batching counters for monitoring"""
+        return {
+            "governor": self.governor.stats(),
+            "cache": self.cache.stats(),
+            "batching": self.batcher.stats() if self.batcher is not None else {"enabled": False}
+        }
+
+    async def _generate_json(self, method: str, prompt: str) -> Any:
+        """Generate and parse a JSON response, served from the response cache when possible.
+
+        Only successfully parsed responses are cached, so fallbacks are never
+        replayed from the cache.
+        """
+        key = self.cache.key(self.model_name, prompt)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            logger.info(f"Gemini cache hit for {method}")
+            return cached
+        
+        response = await self.governor.call(
+            lambda: self.model.generate_content_async(prompt), estimate_tokens(prompt)
+        )
+        result = self._parse_json_response(response.text)
+        await self.cache.set(key, result, self.cache.ttl_for(method))
+        return result
+
+    async def _stream_json(
+        self,
+        method: str,
+        prompt: str,
+        fallback: Callable[[], Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a JSON response as incremental parser events, ending with a ``done`` event.
+
+        Cached responses are replayed through the same events. If the stream
+        fails before anything was sent, an ``error`` event is followed by
+        ``done`` carrying the fallback result. If it fails partway, the client
+        already holds real items, so ``done`` is marked ``partial`` and carries
+        exactly what was streamed instead of contradicting it with a fallback.
+        """
+        key = self.cache.key(self.model_name, prompt)
+        streamed: List[Dict[str, Any]] = []
+        try:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                logger.info(f"Gemini cache hit for streamed {method}")
+                for event in IncrementalJSONParser().feed(json.dumps(cached)):
+                    yield event
+                yield {"event": "done", "value": cached, "cached": True}
+                return
+            
+            parser = IncrementalJSONParser()
+            # Only opening the stream is governed (and retried); once events reach
+            # the client a retry would repeat them, so later failures end it partial
+            response = await self.governor.call(
+                lambda: self.model.generate_content_async(prompt, stream=True), estimate_tokens(prompt)
+            )
+            async for chunk in response:
+                for event in parser.feed(chunk.text):
+                    streamed.append(event)
+                    yield event
+            
+            result = parser.result()
+            await self.cache.set(key, result, self.cache.ttl_for(method))
+            logger.info(f"Streamed {method} response")
+            yield {"event": "done", "value": result}
+            
+        except Exception as e:
+            logger.error(f"Error streaming {method}: {e}")
+            yield {"event": "error", "message": str(e)}
+            if streamed:
+                yield {"event": "done", "value": assemble_events(streamed), "partial": True}
+            else:
+                yield {"event": "done", "value": fallback(), "fallback": True}
+
+    def _parse_json_response(self, text: str) -> Any:
+        """Parse a JSON response, stripping Markdown code fences"""
+        text = text.strip()
+        if text.startswith('```json'):
+            text = text[7:-3]
+        elif text.startswith('```'):
+            text = text[3:-3]
+        return json.loads(text)
+
     def _build_question_prompt(self, params: Dict[str, Any]) -> str:
         """Build prompt for question generation"""
         return f"""
@@ -184,69 +357,65 @@ Return ONLY a JSON object with this exact structure:
 }}
 """
 
-    def _build_feedback_prompt(self, params: Dict[str, Any]) -> str:
-        """Build prompt for feedback generation"""
+    def _build_batch_analysis_prompt(self, items: List[Dict[str, Any]]) -> str:
+        """Build one prompt that analyzes several interview responses"""
+        responses = "\n".join(
+            f"""
+Response {index}:
+Question: "{params.get('question', '')}"
+Answer: "{params.get('answer', '')}"
+Role: {params.get('role', 'Software Engineer')}
+"""
+            for index, params in enumerate(items)
+        )
+        
         return f"""
-Generate comprehensive interview feedback based on:
-
-Interview Data: {json.dumps(params.get('interview_data', {}), indent=2)}
-Analysis Results: {json.dumps(params.get('analysis_results', {}), indent=2)}
-
-Generate detailed feedback including:
-1. Overall performance rating (0-100)
-2. Key strengths (3-5 points)
-3. Areas for improvement (3-5 points)
-4. Specific recommendations (3-5 actionable items)
-5. Next steps for improvement
+Analyze each of these {len(items)} interview responses independently:
+{responses}
+Analyze each response on these dimensions (0-100 scale):
+1. Relevance to the question
+2. Technical accuracy
+3. Communication clarity
+4. Structure and organization
+5. Depth of knowledge
+6. Use of examples
 
-Return ONLY a JSON object with this exact structure:
-{{
-  "overallRating": 85,
-  "strengths": ["strength 1", "strength 2", "strength 3"],
-  "improvements": ["improvement 1", "improvement 2", "improvement 3"],
-  "recommendations": ["recommendation 1", "recommendation 2", "recommendation 3"],
-  "nextSteps": ["step 1", "step 2", "step 3"],
-  "detailedFeedback": "comprehensive narrative feedback"
-}}
+Return ONLY a JSON array with one object per response, in order, with this exact structure:
+[
+  {{
+    "index": 0,
+    "scores": {{
+      "relevance": 85,
+      "technicalAccuracy": 90,
+      "clarity": 80,
+      "structure": 75,
+      "depth": 85,
+      "examples": 70
+    }},
+    "overallScore": 81,
+    "strengths": ["strength 1", "strength 2"],
+    "improvements": ["improvement 1", "improvement 2"],
+    "keywordMatches": ["keyword 1", "keyword 2"],
+    "feedback": "detailed feedback text"
+  }}
+]
 """
 
+    def _build_feedback_prompt(self, params: Dict[str, Any]) -> str:
+        """Build prompt for feedback generation from summarized analysis results"""
+        return self.prompt_builder.build(FEEDBACK_PROMPT, [
+            PromptSection("interview_data", params.get('interview_data', {}), priority=1),
+            PromptSection("analysis_results", summarize_analysis(params.get('analysis_results', {})), priority=2)
+        ])
+
     def _build_resume_prompt(self, resume_text: str, target_role: Optional[str]) -> str:
         """Build prompt for resume analysis"""
         role_text = f"Target Role: {target_role}" if target_role else ""
         
-        return f"""
-Analyze this resume content:
-
-{resume_text}
-
-{role_text}
-
-Extract and analyze:
-1. Skills (technical and soft skills)
-2. Experience level (years)
-3. Education background
-4. Certifications
-5. Key achievements
-6. Professional summary
-
-Return ONLY a JSON object with this exact structure:
-{{
-  "skills": ["skill1", "skill2", "skill3"],
-  "experience": 5,
-  "education": [
-    {{
-      "degree": "Bachelor's in Computer Science",
-      "institution": "University Name",
-      "year": 2020
-    }}
-  ],
-  "certifications": ["cert1", "cert2"],
-  "achievements": ["achievement1", "achievement2"],
-  "summary": "professional summary",
-  "matchScore": 85,
-  "recommendations": ["recommendation1", "recommendation2"]
-}}
-"""
+        return self.prompt_builder.build(RESUME_PROMPT, [
+            PromptSection("resume_text", collapse_whitespace(resume_text), priority=1, droppable=False),
+            PromptSection("role_text", role_text, priority=2)
+        ])
 
     def _get_fallback_questions(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Fallback questions if AI generation fails"""
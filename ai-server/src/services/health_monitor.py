@@ -0,0 +1,109 @@
+import asyncio
+import inspect
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+from loguru import logger
+
+
+class HealthMonitor:
+    """Background-refreshed health snapshot for the ``/health`` endpoints.
+
+    Registered checks run every ``HEALTH_REFRESH_SECONDS`` in a background
+    task (blocking checks in the default thread pool, each bounded by
+    ``HEALTH_CHECK_TIMEOUT``; a check that times out reports ``degraded``).
+    Requests read the cached snapshot and never run a check themselves, so
+    probe traffic costs no CPU or model quota. Only ``unhealthy`` services
+    make the instance not ready.
+    """
+
+    def __init__(self, interval: Optional[float] = None, check_timeout: Optional[float] = None):
+        self.interval = interval or float(os.getenv("HEALTH_REFRESH_SECONDS", 30))
+        self.check_timeout = check_timeout or float(os.getenv("HEALTH_CHECK_TIMEOUT", 10))
+        self.checks: Dict[str, Callable[[], Any]] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.refreshed_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, check: Callable[[], Any]):
+        """Add a check returning a ``{"status": ...}`` dict; may be sync or async"""
+        self.checks[name] = check
+
+    async def start(self):
+        """Take the first snapshot in the background and keep refreshing it"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Health refresh failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def refresh(self):
+        """Run every check concurrently and replace the snapshot"""
+        names = list(self.checks)
+        results = await asyncio.gather(*(self._run_check(name) for name in names))
+        self.results = dict(zip(names, results))
+        self.refreshed_at = time.time()
+
+    async def _run_check(self, name: str) -> Dict[str, Any]:
+        check = self.checks[name]
+        started = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(check):
+                awaitable = check()
+            else:
+                awaitable = asyncio.get_running_loop().run_in_executor(None, check)
+            result = dict(await asyncio.wait_for(awaitable, self.check_timeout))
+        except asyncio.TimeoutError:
+            # A slow check means a busy service, not a dead one: keep it in rotation
+            result = {"status": "degraded", "error": f"Health check timed out after {self.check_timeout}s"}
+        except Exception as e:
+            logger.error(f"{name} health check failed: {e}")
+            result = {"status": "unhealthy", "error": str(e)}
+
+        result["checked_at"] = _iso(time.time())
+        result["duration_ms"] = round((time.perf_counter() - started) * 1000)
+        return result
+
+    @property
+    def ready(self) -> bool:
+        """True once a snapshot exists and no service in it is unhealthy"""
+        return self.refreshed_at is not None and all(
+            result.get("status") != "unhealthy" for result in self.results.values()
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        if self.refreshed_at is None:
+            status = "starting"
+        elif not self.ready:
+            status = "unhealthy"
+        elif any(result.get("status") != "healthy" for result in self.results.values()):
+            status = "degraded"
+        else:
+            status = "healthy"
+
+        return {
+            "status": status,
+            "services": self.results,
+            "refreshed_at": _iso(self.refreshed_at) if self.refreshed_at else None,
+            "age_seconds": round(time.time() - self.refreshed_at, 1) if self.refreshed_at else None,
+            "refresh_interval_seconds": self.interval
+        }
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
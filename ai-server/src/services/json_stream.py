@@ -0,0 +1,133 @@
+import json
+from typing import Any, Dict, List, Optional
+
+
+class _Container:
+    __slots__ = ("kind", "depth", "element_start", "key", "count")
+
+    def __init__(self, kind: str, depth: int, element_start: int):
+        self.kind = kind
+        self.depth = depth
+        self.element_start = element_start
+        self.key: Optional[str] = None
+        self.count = 0
+
+
+class IncrementalJSONParser:
+    """Parse one JSON document from streamed text, reporting values as they complete.
+
+    Text before the first ``{`` or ``[`` (e.g. a Markdown code fence) is
+    skipped. Events are plain dicts:
+
+    - ``{"event": "field", "key": k, "value": v}`` for each completed member of
+      a top-level object
+    - ``{"event": "item", "key": k, "index": i, "value": v}`` for each completed
+      element of a top-level array (``key`` is None) or of an array held by a
+      top-level member (``key`` is that member), so ``strengths`` entries or
+      generated questions arrive one by one
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._finished = False
+        self._in_string = False
+        self._escaped = False
+        self._stack: List[_Container] = []
+        self._root_end: Optional[int] = None
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Consume the next chunk and return events for values completed by it"""
+        self._buffer += text
+        events = []
+        buffer = self._buffer
+
+        while self._pos < len(buffer) and not self._finished:
+            char = buffer[self._pos]
+
+            if not self._started:
+                if char in "{[":
+                    self._started = True
+                    self._stack.append(_Container(char, 1, self._pos + 1))
+            elif self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._stack.append(_Container(char, len(self._stack) + 1, self._pos + 1))
+            elif char == ":":
+                container = self._stack[-1]
+                if container.depth == 1 and container.kind == "{":
+                    container.key = json.loads(buffer[container.element_start:self._pos])
+            elif char in ",}]":
+                container = self._stack[-1]
+                self._complete_element(container, self._pos, events)
+                if char == ",":
+                    container.element_start = self._pos + 1
+                else:
+                    self._stack.pop()
+                    if not self._stack:
+                        self._finished = True
+                        self._root_end = self._pos + 1
+
+            self._pos += 1
+
+        return events
+
+    def _complete_element(self, container: _Container, end: int, events: List[Dict[str, Any]]):
+        text = self._buffer[container.element_start:end].strip()
+        if not text or container.depth > 2:
+            return
+
+        parent = self._stack[-2] if container.depth == 2 else None
+        if container.kind == "{":
+            if container.depth == 1:
+                value = json.loads("{" + text + "}")
+                key, member = next(iter(value.items()))
+                events.append({"event": "field", "key": key, "value": member})
+        elif container.depth == 1 or parent.kind == "{":
+            events.append({
+                "event": "item",
+                "key": parent.key if parent is not None else None,
+                "index": container.count,
+                "value": json.loads(text)
+            })
+        container.count += 1
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def result(self) -> Any:
+        """The complete document; raises if the stream ended before it closed"""
+        if not self._finished:
+            raise ValueError("JSON document is incomplete")
+        start = next(index for index, char in enumerate(self._buffer) if char in "{[")
+        return json.loads(self._buffer[start:self._root_end])
+
+
+def assemble_events(events: List[Dict[str, Any]]) -> Any:
+    """The document as far as ``events`` describe it.
+
+    Completed fields keep their full value; an array that was still open
+    holds the items received so far. Used to report what a stream that
+    failed partway had already delivered.
+    """
+    result = None
+    for event in events:
+        if event["event"] == "item" and event["key"] is None:
+            result = [] if result is None else result
+            result.append(event["value"])
+        elif event["event"] == "field":
+            result = {} if result is None else result
+            result[event["key"]] = event["value"]
+        else:
+            result = {} if result is None else result
+            result.setdefault(event["key"], []).append(event["value"])
+    return result
@@ -0,0 +1,123 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import mediapipe as mp
+from loguru import logger
+
+
+class MediaPipeGraphs:
+    """One FaceMesh, Pose and Hands graph set with its own tracking state"""
+
+    def __init__(self, static_image_mode: bool = False):
+        self.face_mesh = mp.solutions.face_mesh.FaceMesh(
+            static_image_mode=static_image_mode,
+            max_num_faces=1,
+            refine_landmarks=True,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        self.pose = mp.solutions.pose.Pose(
+            static_image_mode=static_image_mode,
+            model_complexity=1,
+            smooth_landmarks=True,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=static_image_mode,
+            max_num_hands=2,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        self.last_used = time.monotonic()
+
+    def close(self):
+        for graph in (self.face_mesh, self.pose, self.hands):
+            try:
+                graph.close()
+            except Exception as e:
+                logger.warning(f"Failed to close MediaPipe graph: {e}")
+
+
+class MediaPipeGraphPool:
+    """Per-session MediaPipe graphs with LRU and idle eviction.
+
+    Each interview session gets its own graph set so consecutive frames from
+    one candidate stay in cheap tracking mode instead of interleaving with
+    other sessions and forcing re-detection. The pool is capped at
+    ``max_sessions`` (``MEDIAPIPE_POOL_SIZE``); sessions unused for
+    ``idle_seconds`` (``MEDIAPIPE_POOL_IDLE_SECONDS``) are closed on the next
+    acquire, and ``release`` closes a session as soon as its interview ends.
+    """
+
+    def __init__(self, max_sessions: Optional[int] = None, idle_seconds: Optional[float] = None):
+        self.max_sessions = max_sessions or int(os.getenv("MEDIAPIPE_POOL_SIZE", 8))
+        self.idle_seconds = idle_seconds if idle_seconds is not None else float(
+            os.getenv("MEDIAPIPE_POOL_IDLE_SECONDS", 300)
+        )
+        self._sessions: "OrderedDict[str, MediaPipeGraphs]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._evicted = 0
+        self._released = 0
+
+    def acquire(self, session_id: str) -> MediaPipeGraphs:
+        """Graphs for ``session_id``, created on first use and marked most recently used"""
+        with self._lock:
+            now = time.monotonic()
+            self._evict_idle(now)
+
+            graphs = self._sessions.get(session_id)
+            if graphs is None:
+                graphs = MediaPipeGraphs()
+                self._sessions[session_id] = graphs
+                self._created += 1
+                while len(self._sessions) > self.max_sessions:
+                    evicted_id, evicted = self._sessions.popitem(last=False)
+                    evicted.close()
+                    self._evicted += 1
+                    logger.info(f"Evicted MediaPipe graphs for session {evicted_id} (pool full)")
+            else:
+                self._sessions.move_to_end(session_id)
+
+            graphs.last_used = now
+            return graphs
+
+    def release(self, session_id: str) -> bool:
+        """Close a session's graphs, e.g. when its interview ends; False if it held none"""
+        with self._lock:
+            graphs = self._sessions.pop(session_id, None)
+            if graphs is None:
+                return False
+            self._released += 1
+        graphs.close()
+        return True
+
+    def _evict_idle(self, now: float):
+        # Sessions are ordered by last use, so the idle ones are at the front
+        while self._sessions:
+            session_id, graphs = next(iter(self._sessions.items()))
+            if now - graphs.last_used < self.idle_seconds:
+                break
+            self._sessions.popitem(last=False)
+            graphs.close()
+            self._evicted += 1
+            logger.info(f"Evicted idle MediaPipe graphs for session {session_id}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "idle_seconds": self.idle_seconds,
+            "created": self._created,
+            "evicted": self._evicted,
+            "released": self._released
+        }
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, OrderedDict()
+        for graphs in sessions.values():
+            graphs.close()
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Tuple
+from loguru import logger
+
+
+class ParseCache:
+    """Parsed resumes keyed by content hash, in memory and on disk.
+
+    Keys are the SHA-256 of the file bytes plus the file type and parser
+    version, so re-uploads hit regardless of filename and a parser change
+    invalidates old entries. An in-process LRU (``RESUME_CACHE_MAX_ENTRIES``)
+    sits in front of a directory of JSON files (``RESUME_CACHE_DIR``) that
+    survives restarts and is kept under ``RESUME_CACHE_MAX_BYTES`` by
+    removing the least recently used files. Disk errors are counted and
+    treated as misses; the cache never fails a parse.
+
+    Entries hold candidates' resume text and contact details, so they expire
+    ``RESUME_CACHE_TTL_SECONDS`` after they were stored (7 days by default,
+    0 keeps them until evicted). Expired entries are never served, and
+    expired files are swept from disk at startup and periodically on writes.
+    A file's mtime is its store time and its atime its last use.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        self.enabled = os.getenv("RESUME_CACHE_ENABLED", "true").lower() != "false"
+        self.directory = directory or os.getenv("RESUME_CACHE_DIR", os.path.join("temp", "resume_cache"))
+        self.max_entries = max_entries or int(os.getenv("RESUME_CACHE_MAX_ENTRIES", 128))
+        self.max_bytes = max_bytes or int(os.getenv("RESUME_CACHE_MAX_BYTES", 52428800))  # 50MB
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None
+            else float(os.getenv("RESUME_CACHE_TTL_SECONDS", 604800))  # 7 days
+        )
+
+        # key -> (JSON payload, stored at)
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        self._last_sweep = time.time()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "disk_evictions": 0,
+            "expirations": 0,
+            "disk_errors": 0
+        }
+
+        if self.enabled:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                self._sweep_expired()
+            except OSError as e:
+                self._stats["disk_errors"] += 1
+                logger.warning(f"Resume cache directory unavailable, caching in memory only: {e}")
+
+    @staticmethod
+    def key(file_bytes: bytes, file_type: str, parser_version: str) -> str:
+        digest = hashlib.sha256(file_bytes).hexdigest()
+        return hashlib.sha256(f"{digest}:{file_type}:{parser_version}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                payload, stored_at = entry
+                if not self._expired(stored_at):
+                    self._entries.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return json.loads(payload)
+                del self._entries[key]
+
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+            if self._expired(stat.st_mtime):
+                self._stats["expirations"] += 1
+                self._remove(path)
+                value = None
+            else:
+                with open(path, encoding="utf-8") as cache_file:
+                    payload = cache_file.read()
+                value = json.loads(payload)
+                os.utime(path, (time.time(), stat.st_mtime))  # recently used files are evicted last
+        except FileNotFoundError:
+            value = None
+        except (OSError, ValueError) as e:
+            self._stats["disk_errors"] += 1
+            logger.warning(f"Resume cache read failed, dropping entry: {e}")
+            self._remove(path)
+            value = None
+
+        with self._lock:
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._remember(key, payload, stat.st_mtime)
+            self._stats["disk_hits"] += 1
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]):
+        if not self.enabled:
+            return
+
+        payload = json.dumps(value)
+        with self._lock:
+            self._remember(key, payload, time.time())
+            self._stats["sets"] += 1
+
+        path = self._path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                cache_file.write(payload)
+            os.replace(temp_path, path)
+            with self._lock:
+                self._disk_bytes += os.path.getsize(path) - previous
+                over_budget = self._disk_bytes > self.max_bytes
+            if over_budget:
+                self._evict_disk()
+            elif self.ttl_seconds and time.time() - self._last_sweep > min(self.ttl_seconds, 3600):
+                self._sweep_expired()
+        except OSError as e:
+            self._stats["disk_errors"] += 1
+            logger.warning(f"Resume cache write failed: {e}")
+            self._remove(temp_path)
+
+    def _expired(self, stored_at: float) -> bool:
+        return bool(self.ttl_seconds) and time.time() - stored_at > self.ttl_seconds
+
+    def _remember(self, key: str, payload: str, stored_at: float):
+        self._entries[key] = (payload, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _sweep_expired(self):
+        """Remove expired files and recount the directory size"""
+        total = 0
+        for path, size, _, stored_at in self._disk_files():
+            if self._expired(stored_at) and self._remove(path):
+                self._stats["expirations"] += 1
+            else:
+                total += size
+        with self._lock:
+            self._disk_bytes = total
+            self._last_sweep = time.time()
+
+    def _evict_disk(self):
+        """Remove least recently used files until the directory is at 90% of its budget"""
+        files = sorted(self._disk_files(), key=lambda item: item[2])
+        total = sum(size for _, size, _, _ in files)
+        target = self.max_bytes * 0.9
+        for path, size, _, _ in files:
+            if total <= target:
+                break
+            if self._remove(path):
+                total -= size
+                self._stats["disk_evictions"] += 1
+        with self._lock:
+            self._disk_bytes = total
+
+    def _disk_files(self) -> Iterator[Tuple[str, int, float, float]]:
+        """``(path, size, last used, stored at)`` for every cache file"""
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    yield entry.path, stat.st_size, stat.st_atime, stat.st_mtime
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.unlink(path)
+            return True
+        except OSError:
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "disk_bytes": self._disk_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": round(hits / lookups, 3) if lookups else None,
+            **self._stats
+        }
+
+
+@lru_cache(maxsize=1)
+def get_parse_cache() -> ParseCache:
+    """Cache shared by every resume parser in this process"""
+    return ParseCache()
@@ -0,0 +1,36 @@
+import numpy as np
+
+# Raw PCM support kept free of librosa, so the API process can validate
+# PCM bodies without loading the audio analysis stack
+
+PCM_DTYPES = {
+    "pcm_s16le": np.dtype("<i2"),
+    "pcm_f32le": np.dtype("<f4")
+}
+
+
+def pcm_to_float32(buffer: bytes, encoding: str, channels: int = 1) -> np.ndarray:
+    """Wrap raw PCM bytes as a float32 signal.
+
+    ``pcm_f32le`` is a zero-copy view over the buffer; ``pcm_s16le`` is
+    converted to float32 once. Trailing bytes that do not form a whole frame
+    are ignored. Multi-channel input is returned as (samples, channels).
+    """
+    if encoding not in PCM_DTYPES:
+        raise ValueError(f"Unsupported PCM encoding: {encoding}")
+
+    dtype = PCM_DTYPES[encoding]
+    frame_bytes = dtype.itemsize * channels
+    count = (len(buffer) // frame_bytes) * channels
+    samples = np.frombuffer(buffer, dtype=dtype, count=count)
+    if dtype.kind == "i":
+        samples = samples.astype(np.float32)
+        samples *= 1.0 / 32768.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels)
+    return samples
+
+
+def pcm_frame_bytes(encoding: str, channels: int = 1) -> int:
+    """Bytes per sample frame (one sample for every channel)"""
+    return PCM_DTYPES[encoding].itemsize * channels
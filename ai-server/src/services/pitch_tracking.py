@@ -0,0 +1,88 @@
+import os
+import numpy as np
+import librosa
+from services.audio_features import AudioFeatureFrames
+
+
+class PitchTrack:
+    """Frame-wise fundamental frequency with a voicing mask"""
+
+    def __init__(self, f0: np.ndarray, voiced: np.ndarray, time_per_frame: float):
+        self.f0 = f0
+        self.voiced = voiced
+        self.time_per_frame = time_per_frame
+
+    @property
+    def voiced_f0(self) -> np.ndarray:
+        return self.f0[self.voiced]
+
+
+class PitchTracker:
+    """Pitch tracking with a selectable backend.
+
+    ``yin`` runs YIN on a signal decimated to ``target_sr`` (speech f0 sits well
+    below 1kHz, so full-band audio only adds cost). ``piptrack`` reuses the
+    shared STFT magnitude and picks the strongest bin per frame in one
+    vectorized argmax.
+    """
+
+    backends = ("yin", "piptrack")
+
+    def __init__(
+        self,
+        backend: str = None,
+        target_sr: int = 16000,
+        fmin: float = 65.0,
+        fmax: float = 500.0,
+        silence_ratio: float = 0.2
+    ):
+        self.backend = backend or os.getenv("PITCH_BACKEND", "yin")
+        if self.backend not in self.backends:
+            raise ValueError(f"Unknown pitch backend: {self.backend}")
+        self.target_sr = target_sr
+        self.fmin = fmin
+        self.fmax = fmax
+        self.silence_ratio = silence_ratio
+
+    def track(self, features: AudioFeatureFrames, energy_floor: float = None) -> PitchTrack:
+        """Track f0; ``energy_floor`` overrides the per-signal silence gate (used by streams)"""
+        if self.backend == "piptrack":
+            return self._track_piptrack(features)
+        return self._track_yin(features, energy_floor)
+
+    def _track_yin(self, features: AudioFeatureFrames, energy_floor: float = None) -> PitchTrack:
+        audio, sr = features.audio, features.sr
+        if sr > self.target_sr:
+            audio = librosa.resample(audio, orig_sr=sr, target_sr=self.target_sr)
+            sr = self.target_sr
+
+        hop_length = max(1, int(0.01 * sr))
+        frame_length = 1 << int(np.ceil(np.log2(4 * sr / self.fmin)))
+        if len(audio) < frame_length:
+            return PitchTrack(np.zeros(0, dtype=np.float32), np.zeros(0, dtype=bool), hop_length / sr)
+
+        f0 = librosa.yin(
+            audio, fmin=self.fmin, fmax=self.fmax, sr=sr,
+            frame_length=frame_length, hop_length=hop_length
+        )
+
+        # YIN always returns a value; treat estimates pinned to the search
+        # bounds or falling in silent frames as unvoiced
+        times = np.arange(len(f0)) * hop_length / sr
+        energy = np.interp(times, np.arange(len(features.rms)) * features.time_per_frame, features.rms)
+        if energy_floor is None:
+            energy_floor = np.mean(features.rms) * self.silence_ratio
+        voiced = (
+            (f0 > self.fmin * 1.01) &
+            (f0 < self.fmax * 0.99) &
+            (energy > energy_floor)
+        )
+        return PitchTrack(f0, voiced, hop_length / sr)
+
+    def _track_piptrack(self, features: AudioFeatureFrames) -> PitchTrack:
+        pitches, magnitudes = librosa.piptrack(
+            S=features.magnitude, sr=features.sr, fmin=self.fmin, fmax=self.fmax, threshold=0.1
+        )
+        strongest = magnitudes.argmax(axis=0)
+        f0 = pitches[strongest, np.arange(pitches.shape[1])]
+        return PitchTrack(f0, f0 > 0, features.stft_hop_length / features.sr)
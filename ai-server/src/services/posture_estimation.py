@@ -0,0 +1,116 @@
+import numpy as np
+
+# Pose landmark indices (33 points, each x, y, z, visibility)
+POSE_POINTS = 33
+LEFT_EAR, RIGHT_EAR = 7, 8
+LEFT_SHOULDER, RIGHT_SHOULDER = 11, 12
+LEFT_WRIST, RIGHT_WRIST = 15, 16
+LEFT_HIP, RIGHT_HIP = 23, 24
+
+
+def pose_landmark_array(pose_landmarks) -> np.ndarray:
+    """Pose landmarks as a (33, 4) array of x, y, z, visibility; NaN when no pose was found"""
+    points = np.full((POSE_POINTS, 4), np.nan, dtype=np.float32)
+    if pose_landmarks:
+        points[:] = [(lm.x, lm.y, lm.z, lm.visibility) for lm in pose_landmarks.landmark]
+    return points
+
+
+class PostureEstimate:
+    """Per-frame posture metrics over a (frames, 33, 4) landmark array"""
+
+    def __init__(
+        self,
+        pose_detected: np.ndarray,
+        shoulder_tilt: np.ndarray,
+        head_forward: np.ndarray,
+        torso_lean: np.ndarray,
+        score: np.ndarray,
+        gesture_count: int
+    ):
+        self.pose_detected = pose_detected
+        self.shoulder_tilt = shoulder_tilt
+        self.head_forward = head_forward
+        self.torso_lean = torso_lean
+        self.score = score
+        self.gesture_count = gesture_count
+
+
+class PostureEstimator:
+    """Posture metrics computed as numpy ops over every sampled frame at once.
+
+    - shoulder tilt: angle of the shoulder line from horizontal, in degrees
+    - head-forward offset: how far the ears sit in front of the shoulders
+      (MediaPipe depth), in shoulder widths
+    - torso lean: angle of the hip-to-shoulder line from vertical, in degrees
+      (NaN when the hips are out of frame, as is common on webcams)
+    - gestures: onsets of wrist movement faster than ``gesture_speed``
+      shoulder widths per second between consecutive samples
+
+    Landmarks below ``min_visibility`` are ignored. Each metric beyond its
+    comfortable range costs up to its weight in points off a score of 100.
+    """
+
+    def __init__(self, min_visibility: float = 0.5, gesture_speed: float = 0.5):
+        self.min_visibility = min_visibility
+        self.gesture_speed = gesture_speed
+
+    def estimate(self, landmarks: np.ndarray, timestamps: np.ndarray = None, aspect_ratio: float = 1.0) -> PostureEstimate:
+        """Estimate posture for a (frames, 33, 4) array; ``aspect_ratio`` is frame width / height"""
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        if landmarks.ndim == 2:
+            landmarks = landmarks[np.newaxis]
+
+        # Hide low-visibility points and scale x so angles are in pixel space
+        visible = landmarks[..., 3:4] >= self.min_visibility
+        points = np.where(visible, landmarks[..., :3], np.nan)
+        points[..., 0] *= aspect_ratio
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            left_shoulder, right_shoulder = points[:, LEFT_SHOULDER], points[:, RIGHT_SHOULDER]
+            shoulder_mid = 0.5 * (left_shoulder + right_shoulder)
+            shoulder_vector = left_shoulder - right_shoulder
+            shoulder_width = np.hypot(shoulder_vector[:, 0], shoulder_vector[:, 1])
+            shoulder_width = np.where(shoulder_width > 1e-6, shoulder_width, np.nan)
+
+            shoulder_tilt = np.degrees(np.arctan2(np.abs(shoulder_vector[:, 1]), np.abs(shoulder_vector[:, 0])))
+
+            ear_mid = 0.5 * (points[:, LEFT_EAR] + points[:, RIGHT_EAR])
+            head_forward = (shoulder_mid[:, 2] - ear_mid[:, 2]) / shoulder_width
+
+            hip_mid = 0.5 * (points[:, LEFT_HIP] + points[:, RIGHT_HIP])
+            torso = shoulder_mid - hip_mid
+            torso_lean = np.degrees(np.arctan2(np.abs(torso[:, 0]), np.abs(torso[:, 1])))
+
+            penalty = (
+                30.0 * self._excess(shoulder_tilt, 3.0, 15.0) +
+                35.0 * self._excess(head_forward, 0.1, 0.5) +
+                35.0 * self._excess(torso_lean, 5.0, 25.0)
+            )
+
+        pose_detected = ~np.isnan(shoulder_width)
+        score = np.where(pose_detected, 100.0 - penalty, np.nan)
+        gesture_count = self._count_gestures(points, shoulder_width, timestamps)
+        return PostureEstimate(pose_detected, shoulder_tilt, head_forward, torso_lean, score, gesture_count)
+
+    @staticmethod
+    def _excess(values: np.ndarray, comfortable: float, worst: float) -> np.ndarray:
+        """0 within the comfortable range rising to 1 at ``worst``; missing metrics cost nothing"""
+        return np.nan_to_num(np.clip((values - comfortable) / (worst - comfortable), 0.0, 1.0), nan=0.0)
+
+    def _count_gestures(self, points: np.ndarray, shoulder_width: np.ndarray, timestamps: np.ndarray) -> int:
+        if len(points) < 2:
+            return 0
+        if timestamps is None:
+            timestamps = np.arange(len(points), dtype=np.float64)
+
+        wrists = points[:, [LEFT_WRIST, RIGHT_WRIST], :2]
+        steps = np.linalg.norm(np.diff(wrists, axis=0), axis=2)
+        dt = np.maximum(np.diff(np.asarray(timestamps, dtype=np.float64)), 1e-3)
+        with np.errstate(invalid="ignore"):
+            speed = steps / (shoulder_width[1:, np.newaxis] * dt[:, np.newaxis])
+            moving = np.any(speed > self.gesture_speed, axis=1)
+
+        # Each run of consecutive moving samples is one gesture
+        onsets = np.diff(np.concatenate(([False], moving)).astype(np.int8)) == 1
+        return int(np.count_nonzero(onsets))
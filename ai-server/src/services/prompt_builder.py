@@ -0,0 +1,156 @@
+import json
+import os
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from services.gemini_governor import estimate_tokens
+
+# Request fields that carry media and never belong in a prompt
+BINARY_FIELDS = {"audio_data", "video_data", "image_data", "frame_data", "file_data", "file_content"}
+
+# Per-frame / per-sample detail that adds tokens but no signal for feedback
+DETAIL_FIELDS = {"timeline", "frames", "landmarks"}
+
+_BASE64 = re.compile(r"^(data:[\w/+.-]+;base64,)?[A-Za-z0-9+/=_-]+$")
+_INLINE_WHITESPACE = re.compile(r"[ \t\r\f\v]+")
+_LINE_BREAKS = re.compile(r"\s*\n\s*")
+
+# Progressively tighter limits used when a prompt is over budget: (max string chars, max list items)
+COMPACTION_LEVELS = [(2000, 50), (1000, 25), (500, 12), (250, 6), (120, 3), (60, 2)]
+
+
+def collapse_whitespace(text: str) -> str:
+    """Collapse runs of spaces and blank lines (e.g. from PDF extraction) to single separators"""
+    return _LINE_BREAKS.sub("\n", _INLINE_WHITESPACE.sub(" ", text)).strip()
+
+
+def compact(value: Any, max_string: int = 2000, max_items: int = 50) -> Any:
+    """Copy of ``value`` without binary/detail fields, with long strings and lists truncated"""
+    if isinstance(value, dict):
+        return {
+            key: compact(item, max_string, max_items)
+            for key, item in value.items()
+            if key not in BINARY_FIELDS and key not in DETAIL_FIELDS and item is not None
+        }
+    if isinstance(value, (list, tuple)):
+        items = [compact(item, max_string, max_items) for item in value[:max_items]]
+        if len(value) > max_items:
+            items.append(f"... {len(value) - max_items} more")
+        return items
+    if isinstance(value, str):
+        if len(value) > 1000 and _BASE64.match(value[:1000]):
+            return f"[binary data omitted, {len(value)} chars]"
+        if len(value) > max_string:
+            return value[:max_string] + "..."
+        return value
+    if isinstance(value, float):
+        return round(value, 3)
+    return value
+
+
+def summarize_analysis(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Key metrics from comprehensive analysis results for the feedback prompt"""
+    summary = {}
+    for name, result in results.items():
+        if not isinstance(result, dict):
+            summary[name] = result
+        elif name == "audio":
+            summary[name] = _summarize_audio(result)
+        elif name == "emotions":
+            summary[name] = {
+                "frames_analyzed": result.get("frames_analyzed"),
+                **{
+                    key: value for key, value in (result.get("overall_statistics") or {}).items()
+                    if key != "average_emotions"
+                }
+            }
+        elif name == "content":
+            summary[name] = {
+                "averageScore": result.get("averageScore"),
+                "responses": [
+                    {
+                        "overallScore": analysis.get("overallScore"),
+                        "strengths": analysis.get("strengths", [])[:2],
+                        "improvements": analysis.get("improvements", [])[:2]
+                    }
+                    for analysis in result.get("responses", [])
+                ]
+            }
+        elif name == "stages":
+            summary[name] = {stage: info.get("status") for stage, info in result.items()}
+        else:
+            summary[name] = result
+    return summary
+
+
+def _summarize_audio(result: Dict[str, Any]) -> Dict[str, Any]:
+    summary = {key: value for key, value in result.items() if key not in ("pause_analysis", "tone_analysis")}
+
+    pauses = result.get("pause_analysis")
+    if isinstance(pauses, list):
+        durations = [pause.get("duration", 0) for pause in pauses if isinstance(pause, dict)]
+        summary["pauses"] = {
+            "count": len(durations),
+            "total_seconds": round(sum(durations), 2),
+            "by_type": dict(Counter(pause.get("type") for pause in pauses if isinstance(pause, dict)))
+        }
+
+    tone = result.get("tone_analysis")
+    if isinstance(tone, list) and tone:
+        summary["tone"] = tone[0]
+    return summary
+
+
+class PromptSection:
+    """A variable part of a prompt; lower ``priority`` is compacted first and dropped first"""
+
+    def __init__(self, name: str, value: Any, priority: int, droppable: bool = True):
+        self.name = name
+        self.value = value
+        self.priority = priority
+        self.droppable = droppable
+        self.level = 0
+        self.dropped = False
+
+    def render(self) -> str:
+        if self.dropped:
+            return "(omitted to fit the prompt budget)"
+        if isinstance(self.value, str):
+            # Free text is kept whole until the budget forces a cut, then halved per level
+            if self.level == 0:
+                return self.value
+            max_chars = COMPACTION_LEVELS[self.level - 1][0] * 8
+            return self.value if len(self.value) <= max_chars else self.value[:max_chars] + "..."
+        max_string, max_items = COMPACTION_LEVELS[self.level]
+        return json.dumps(compact(self.value, max_string, max_items), separators=(",", ":"))
+
+
+class CompactPromptBuilder:
+    """Fills prompt templates under a token budget (``GEMINI_PROMPT_TOKEN_BUDGET``).
+
+    Sections are rendered as compact JSON without binary or per-frame
+    fields. While the estimated prompt is over budget, the lowest-priority
+    section that can still shrink is compacted a level further (shorter
+    strings, fewer list items); once nothing can shrink, the lowest-priority
+    droppable section is dropped.
+    """
+
+    def __init__(self, token_budget: Optional[int] = None):
+        self.token_budget = token_budget or int(os.getenv("GEMINI_PROMPT_TOKEN_BUDGET", 6000))
+
+    def build(self, template: str, sections: List[PromptSection]) -> str:
+        """``template.format(**rendered_sections)``, trimmed to the token budget"""
+        while True:
+            prompt = template.format(**{section.name: section.render() for section in sections})
+            if estimate_tokens(prompt) <= self.token_budget:
+                return prompt
+
+            remaining = sorted((s for s in sections if not s.dropped), key=lambda s: s.priority)
+            shrinkable = [s for s in remaining if s.level < len(COMPACTION_LEVELS) - 1]
+            if shrinkable:
+                shrinkable[0].level += 1
+                continue
+            droppable = [s for s in remaining if s.droppable]
+            if not droppable:
+                return prompt
+            droppable[0].dropped = True
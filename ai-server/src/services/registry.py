@@ -0,0 +1,190 @@
+import asyncio
+import importlib
+import inspect
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from loguru import logger
+
+# Lifecycle of a registered service
+COLD, LOADING, LOADED, WARMING, WARM, FAILED = "cold", "loading", "loaded", "warming", "warm", "failed"
+
+
+def load_class(target: str) -> type:
+    """Import ``"package.module:ClassName"``"""
+    module_name, class_name = target.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class ServiceFactory:
+    """Picklable factory that imports and builds a service where it is called.
+
+    Passed to executor pools so spawned workers import heavy modules
+    (librosa, mediapipe, cv2) themselves instead of the parent importing them
+    up front just to hand over the class.
+    """
+
+    def __init__(self, target: str):
+        self.target = target
+
+    def __call__(self) -> Any:
+        return load_class(self.target)()
+
+
+def run_warmup(service: Any):
+    """Call the service's ``warmup()`` hot-path exercise, if it has one"""
+    warmup = getattr(service, "warmup", None)
+    if warmup is None:
+        return
+    result = warmup()
+    if inspect.iscoroutine(result):
+        asyncio.run(result)
+
+
+class _Entry:
+    def __init__(self, name: str, target: str, preload: bool):
+        self.name = name
+        self.target = target
+        self.preload = preload
+        self.instance: Any = None
+        self.state = COLD
+        self.error: Optional[str] = None
+        self.timings: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+
+class ServiceRegistry:
+    """Services built on first use or by a background warmup at startup.
+
+    ``get(name)`` imports and constructs a service the first time it is
+    needed. ``warmup()`` does the same for every preloaded service in the
+    default thread pool and then runs each service's ``warmup()`` on
+    synthetic input, so the first real request skips numba compilation and
+    graph initialization. Services registered with ``preload=False`` do their
+    real work in executor workers, which warm their own instances; their
+    main-process instance is only built if something asks for it. Import,
+    construction and warmup times are recorded per service. Set
+    ``SERVICE_WARMUP=false`` to build lazily only.
+    """
+
+    def __init__(self):
+        self.warmup_enabled = os.getenv("SERVICE_WARMUP", "true").lower() != "false"
+        self._entries: Dict[str, _Entry] = {}
+
+    def register(self, name: str, target: str, preload: bool = True):
+        """Register ``"package.module:ClassName"`` under ``name`` without importing it"""
+        self._entries[name] = _Entry(name, target, preload)
+
+    def proxy(self, name: str) -> "LazyService":
+        return LazyService(self, name)
+
+    def factory(self, name: str) -> ServiceFactory:
+        """Factory for building the same service in executor workers"""
+        return ServiceFactory(self._entries[name].target)
+
+    def get(self, name: str) -> Any:
+        entry = self._entries[name]
+        if entry.instance is not None:
+            return entry.instance
+
+        with entry.lock:
+            if entry.instance is None:
+                entry.state = LOADING
+                try:
+                    module_name, class_name = entry.target.split(":")
+                    started = time.perf_counter()
+                    service_class = getattr(importlib.import_module(module_name), class_name)
+                    imported = time.perf_counter()
+                    instance = service_class()
+                    built = time.perf_counter()
+                except Exception as e:
+                    entry.state = FAILED
+                    entry.error = str(e)
+                    logger.error(f"Failed to build {name} service: {e}")
+                    raise
+
+                entry.timings["import_ms"] = round((imported - started) * 1000)
+                entry.timings["init_ms"] = round((built - imported) * 1000)
+                entry.instance = instance
+                entry.state = LOADED
+        return entry.instance
+
+    def built(self, name: str) -> bool:
+        return self._entries[name].instance is not None
+
+    async def warmup(self):
+        """Build and warm every preloaded service concurrently off the event loop"""
+        if not self.warmup_enabled:
+            return
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        preloaded = [entry for entry in self._entries.values() if entry.preload]
+        await asyncio.gather(
+            *(loop.run_in_executor(None, self._warm, entry.name) for entry in preloaded),
+            return_exceptions=True
+        )
+
+        breakdown = ", ".join(
+            f"{entry.name} {entry.state} (import {entry.timings.get('import_ms', 0)}ms, "
+            f"init {entry.timings.get('init_ms', 0)}ms, warmup {entry.timings.get('warmup_ms', 0)}ms)"
+            for entry in preloaded
+        )
+        logger.info(f"Service warmup finished in {(time.perf_counter() - started) * 1000:.0f}ms: {breakdown}")
+
+    def _warm(self, name: str):
+        entry = self._entries[name]
+        service = self.get(name)
+        if entry.state != LOADED:
+            return
+
+        entry.state = WARMING
+        started = time.perf_counter()
+        try:
+            run_warmup(service)
+        except Exception as e:
+            # The service still works; only the first request pays the warmup cost
+            logger.warning(f"{name} service warmup failed: {e}")
+            entry.error = str(e)
+        entry.timings["warmup_ms"] = round((time.perf_counter() - started) * 1000)
+        entry.state = WARM
+
+    async def health_check(self, name: str) -> Dict[str, Any]:
+        """Service health, or its load state while it is not built yet (never builds it)"""
+        entry = self._entries[name]
+        if entry.instance is None:
+            status = "unhealthy" if entry.state == FAILED else "starting"
+            return {"status": status, "service": name, "state": entry.state, "error": entry.error}
+
+        check = entry.instance.health_check
+        if inspect.iscoroutinefunction(check):
+            return await check()
+        return await asyncio.get_running_loop().run_in_executor(None, check)
+
+    @property
+    def ready(self) -> bool:
+        """Preloaded services warm (or, with warmup disabled, built on demand), and none failed to build"""
+        lazy_states = {COLD, LOADING, LOADED, WARMING, WARM}
+        ready_states = {WARM} if self.warmup_enabled else lazy_states
+        return all(
+            entry.state in (ready_states if entry.preload else lazy_states)
+            for entry in self._entries.values()
+        )
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {"state": entry.state, **entry.timings, **({"error": entry.error} if entry.error else {})}
+            for name, entry in self._entries.items()
+        }
+
+
+class LazyService:
+    """Stand-in that builds the registered service on first attribute access"""
+
+    def __init__(self, registry: ServiceRegistry, name: str):
+        self._registry = registry
+        self._name = name
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._registry.get(self._name), attribute)
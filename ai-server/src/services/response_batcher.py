@@ -0,0 +1,148 @@
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Set, Tuple
+from loguru import logger
+
+
+class ResponseAnalysisBatcher:
+    """Micro-batches ``analyze_response`` calls into multi-answer Gemini prompts.
+
+    Requests arriving within ``window_seconds`` (``GEMINI_BATCH_WINDOW_MS``)
+    are collected, up to ``max_items`` (``GEMINI_BATCH_MAX_ITEMS``), and scored
+    by one prompt that returns a JSON array. Results fan back out to the
+    awaiting callers. Items missing from or malformed in the batch reply fall
+    back to an individual call. Each answer is still cached under its own
+    single-answer prompt, so repeats skip both paths. Flushes run as tasks
+    held until they finish; ``close()`` drains them on shutdown.
+    """
+
+    def __init__(self, service, window_seconds: Optional[float] = None, max_items: Optional[int] = None):
+        self.service = service
+        self.window_seconds = window_seconds if window_seconds is not None else (
+            float(os.getenv("GEMINI_BATCH_WINDOW_MS", 50)) / 1000
+        )
+        self.max_items = max_items or int(os.getenv("GEMINI_BATCH_MAX_ITEMS", 8))
+
+        self._pending: List[Tuple[Dict[str, Any], str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {
+            "batches": 0,
+            "batched_items": 0,
+            "individual_fallbacks": 0
+        }
+
+    async def submit(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue one answer for the next batch and wait for its analysis"""
+        cache = self.service.cache
+        key = cache.key(self.service.model_name, self.service._build_analysis_prompt(params))
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((params, key, future))
+
+        if len(self._pending) >= self.max_items:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._start_flush)
+
+        return await future
+
+    def _start_flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            # The loop only keeps weak references to tasks; hold flushes until they finish
+            task = asyncio.ensure_future(self._run_flush(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_flush(self, batch: List[Tuple[Dict[str, Any], str, asyncio.Future]]):
+        """Flush a batch, failing any waiter it leaves unresolved so no caller hangs"""
+        try:
+            await self._flush(batch)
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Response analysis batch failed: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def close(self, timeout: float = 5.0):
+        """Flush queued answers and wait for in-flight batches, cancelling any still running after ``timeout``"""
+        self._start_flush()
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], str, asyncio.Future]]):
+        if len(batch) == 1:
+            params, _, future = batch[0]
+            await self._resolve_individually(params, future)
+            return
+
+        self._stats["batches"] += 1
+        self._stats["batched_items"] += len(batch)
+        try:
+            prompt = self.service._build_batch_analysis_prompt([params for params, _, _ in batch])
+            response = await self.service._generate_json("analysis", prompt)
+            results = self._index_results(response, len(batch))
+        except Exception as e:
+            logger.error(f"Batched response analysis failed, falling back to individual calls: {e}")
+            results = {}
+
+        retries = []
+        for index, (params, key, future) in enumerate(batch):
+            analysis = results.get(index)
+            if analysis is None:
+                self._stats["individual_fallbacks"] += 1
+                retries.append(self._resolve_individually(params, future))
+                continue
+            await self.service.cache.set(key, analysis, self.service.cache.ttl_for("analysis"))
+            if not future.done():
+                future.set_result(analysis)
+
+        if retries:
+            await asyncio.gather(*retries)
+        logger.info(f"Analyzed {len(batch)} responses in one batch ({len(retries)} individual fallbacks)")
+
+    async def _resolve_individually(self, params: Dict[str, Any], future: asyncio.Future):
+        analysis = await self.service._analyze_response_now(params)
+        if not future.done():
+            future.set_result(analysis)
+
+    @staticmethod
+    def _index_results(response: Any, count: int) -> Dict[int, Dict[str, Any]]:
+        """Map batch reply items to request positions, keeping only well-formed analyses"""
+        if not isinstance(response, list):
+            raise ValueError("Batch analysis reply is not a JSON array")
+
+        results = {}
+        for position, item in enumerate(response):
+            if not isinstance(item, dict) or "overallScore" not in item or "scores" not in item:
+                continue
+            index = item.pop("index", position)
+            if isinstance(index, int) and 0 <= index < count:
+                results[index] = item
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": True,
+            "window_ms": round(self.window_seconds * 1000),
+            "max_items": self.max_items,
+            "pending": len(self._pending),
+            "in_flight_batches": len(self._tasks),
+            **self._stats
+        }
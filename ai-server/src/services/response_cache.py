@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from loguru import logger
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    logger.warning("redis not available, Gemini response cache is in-process only")
+
+# Default time-to-live per GeminiService method (seconds); override with
+# GEMINI_CACHE_TTL_<METHOD>, e.g. GEMINI_CACHE_TTL_QUESTIONS=3600
+DEFAULT_TTLS = {
+    "questions": 6 * 3600,
+    "analysis": 3600,
+    "feedback": 3600,
+    "resume": 24 * 3600
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class ResponseCache:
+    """Cache of parsed model responses keyed by model name and normalized prompt.
+
+    An in-process LRU with per-entry expiry (``GEMINI_CACHE_MAX_ENTRIES``)
+    sits in front of an optional Redis tier, enabled when ``REDIS_URL`` is set
+    and ``GEMINI_CACHE_REDIS`` is not ``false``. Values are stored as JSON so
+    callers never share mutable cached objects. Redis errors are counted and
+    treated as misses; the cache never fails a model call.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        redis_url: Optional[str] = None,
+        prefix: str = "gemini:response:"
+    ):
+        self.enabled = os.getenv("GEMINI_CACHE_ENABLED", "true").lower() != "false"
+        self.max_entries = max_entries or int(os.getenv("GEMINI_CACHE_MAX_ENTRIES", 512))
+        self.prefix = prefix
+        self.ttls = {
+            method: int(os.getenv(f"GEMINI_CACHE_TTL_{method.upper()}", ttl))
+            for method, ttl in DEFAULT_TTLS.items()
+        }
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._stats = {
+            "memory_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "redis_errors": 0
+        }
+
+        self.redis = None
+        redis_url = redis_url or os.getenv("REDIS_URL")
+        use_redis = os.getenv("GEMINI_CACHE_REDIS", "true").lower() != "false"
+        if self.enabled and use_redis and redis_url and REDIS_AVAILABLE:
+            self.redis = aioredis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            logger.info("Gemini response cache using Redis tier")
+
+    @staticmethod
+    def key(model_name: str, prompt: str) -> str:
+        """Cache key for a prompt; runs of whitespace do not change the key"""
+        normalized = _WHITESPACE.sub(" ", prompt).strip()
+        return hashlib.sha256(f"{model_name}\0{normalized}".encode("utf-8")).hexdigest()
+
+    def ttl_for(self, method: str) -> int:
+        return self.ttls.get(method, 3600)
+
+    async def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return json.loads(payload)
+            del self._entries[key]
+
+        if self.redis is not None:
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    payload, ttl = await pipe.get(self.prefix + key).ttl(self.prefix + key).execute()
+                if payload is not None:
+                    self._remember(key, payload, ttl if ttl and ttl > 0 else 60)
+                    self._stats["redis_hits"] += 1
+                    return json.loads(payload)
+            except Exception as e:
+                self._stats["redis_errors"] += 1
+                logger.warning(f"Gemini cache Redis read failed: {e}")
+
+        self._stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: Any, ttl: int):
+        if not self.enabled or ttl <= 0:
+            return
+
+        payload = json.dumps(value)
+        self._remember(key, payload, ttl)
+        self._stats["sets"] += 1
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(self.prefix + key, payload, ex=ttl)
+            except Exception as e:
+                self._stats["redis_errors"] += 1
+                logger.warning(f"Gemini cache Redis write failed: {e}")
+
+    def _remember(self, key: str, payload, ttl: int):
+        self._entries[key] = (time.monotonic() + ttl, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self._stats["memory_hits"] + self._stats["redis_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "redis": self.redis is not None,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hit_rate": round(hits / lookups, 3) if lookups else None,
+            **self._stats
+        }
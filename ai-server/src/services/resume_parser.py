@@ -1,42 +1,21 @@
-import base64
-import io
 import re
-import tempfile
 import os
 from typing import Dict, List, Any, Optional
 from loguru import logger
-import PyPDF2
-import docx
 from datetime import datetime
-import json
+from services.document_text import DocumentSource, DocumentTextExtractor, read_document
+from services.parse_cache import get_parse_cache
+from services.resume_sections import SectionIndex
+from services.skill_matcher import load_skill_index
+
+# Part of the parse cache key; bump when extraction output changes
+PARSER_VERSION = "4"
 
 class ResumeParserService:
     def __init__(self):
-        self.skills_keywords = {
-            "programming_languages": [
-                "python", "java", "javascript", "typescript", "c++", "c#", "php", "ruby", "go", "rust",
-                "swift", "kotlin", "scala", "r", "matlab", "sql", "html", "css", "xml", "json"
-            ],
-            "frameworks": [
-                "react", "angular", "vue", "django", "flask", "spring", "express", "node.js", "laravel",
-                "rails", "asp.net", "bootstrap", "jquery", "tensorflow", "pytorch", "keras"
-            ],
-            "databases": [
-                "mysql", "postgresql", "mongodb", "redis", "sqlite", "oracle", "sql server", "cassandra",
-                "elasticsearch", "dynamodb", "firebase"
-            ],
-            "cloud_platforms": [
-                "aws", "azure", "google cloud", "gcp", "heroku", "digitalocean", "linode", "cloudflare"
-            ],
-            "tools": [
-                "git", "docker", "kubernetes", "jenkins", "travis", "circleci", "jira", "confluence",
-                "slack", "trello", "figma", "sketch", "photoshop", "illustrator"
-            ],
-            "soft_skills": [
-                "leadership", "communication", "teamwork", "problem solving", "analytical", "creative",
-                "adaptable", "organized", "detail-oriented", "time management", "project management"
-            ]
-        }
+        # Compiled once per process from the taxonomy file (SKILLS_TAXONOMY_PATH)
+        self.skill_index = load_skill_index()
+        self.cache = get_parse_cache()
         
         self.education_keywords = [
             "bachelor", "master", "phd", "doctorate", "degree", "university", "college", "institute",
@@ -50,50 +29,84 @@ class ResumeParserService:
         try:
             # Test basic functionality
             test_text = "Test resume parsing functionality"
-            _ = self._extract_skills(test_text)
+            _ = self._extract_skills(test_text, SectionIndex(test_text))
             return {"status": "healthy", "service": "resume_parser"}
         except Exception as e:
             logger.error(f"Resume parser health check failed: {e}")
             return {"status": "unhealthy", "service": "resume_parser", "error": str(e)}
 
-    async def parse_resume(self, file_data: bytes, filename: str) -> Dict[str, Any]:
-        """Parse resume file and extract structured information"""
+    async def warmup(self):
+        """Parse a small synthetic resume through every extractor"""
+        await self.parse_resume(
+            b"Jane Doe\njane@example.com\n\nSUMMARY\nPython developer\n\nSKILLS\nPython, Docker, SQL\n\n"
+            b"EXPERIENCE\nSoftware Engineer at Example Corp (2019 - 2023)\n\n"
+            b"EDUCATION\nBachelor of Science, Example University, 2019\n",
+            "warmup.txt",
+            use_cache=False
+        )
+
+    async def parse_resume(self, file_data: DocumentSource, filename: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Parse resume file (bytes or an open file handle) and extract structured information.
+
+        Results are cached by file content, so a re-upload of the same file
+        skips extraction entirely.
+        """
         try:
             # Determine file type and extract text
             file_extension = filename.lower().split('.')[-1] if '.' in filename else ''
+            file_bytes = read_document(file_data)
+            
+            # Taxonomy edits change skill output, so they invalidate cached parses too
+            cache_key = self.cache.key(
+                file_bytes, file_extension, f"{PARSER_VERSION}:{self.skill_index.fingerprint}"
+            )
+            cached = self.cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                cached["parsing_metadata"].update(filename=filename, cached=True)
+                logger.info(f"Resume parse cache hit: {filename}")
+                return cached
+            
+            extractor = DocumentTextExtractor()
             
             if file_extension == 'pdf':
-                text = await self._extract_text_from_pdf(file_data)
+                text = await self._extract_text_from_pdf(file_bytes, extractor)
             elif file_extension in ['doc', 'docx']:
-                text = await self._extract_text_from_docx(file_data)
+                text = await self._extract_text_from_docx(file_bytes, extractor)
             elif file_extension == 'txt':
-                text = file_data.decode('utf-8', errors='ignore')
+                text = extractor.text(file_bytes, 'txt')
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
             
             if not text.strip():
                 raise ValueError("No text could be extracted from the resume")
             
-            # Parse different sections
+            # Parse different sections; headings are located once and shared by every extractor
+            sections = SectionIndex(text)
             parsed_data = {
                 "raw_text": text,
                 "contact_info": self._extract_contact_info(text),
-                "skills": self._extract_skills(text),
-                "experience": self._extract_experience(text),
-                "education": self._extract_education(text),
-                "certifications": self._extract_certifications(text),
-                "projects": self._extract_projects(text),
-                "summary": self._extract_summary(text),
-                "achievements": self._extract_achievements(text),
-                "languages": self._extract_languages(text),
+                "skills": self._extract_skills(text, sections),
+                "experience": self._extract_experience(sections),
+                "education": self._extract_education(sections),
+                "certifications": self._extract_certifications(text, sections),
+                "projects": self._extract_projects(sections),
+                "summary": self._extract_summary(sections),
+                "achievements": self._extract_achievements(sections),
+                "languages": self._extract_languages(sections),
                 "parsing_metadata": {
                     "filename": filename,
                     "file_type": file_extension,
                     "text_length": len(text),
+                    "page_count": extractor.page_count,
+                    "truncated": extractor.truncated,
                     "parsed_at": datetime.now().isoformat()
                 }
             }
             
+            # Cut-off extraction (page or time limit) is not cached; a time limit may not hit next time
+            if use_cache and not extractor.truncated:
+                self.cache.set(cache_key, parsed_data)
+            
             logger.info(f"Successfully parsed resume: {filename}")
             return parsed_data
             
@@ -118,48 +131,22 @@ class ResumeParserService:
                 }
             }
 
-    async def _extract_text_from_pdf(self, file_data: bytes) -> str:
+    async def _extract_text_from_pdf(self, file_data: DocumentSource, extractor: DocumentTextExtractor) -> str:
         """Extract text from PDF file"""
         try:
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-                temp_file.write(file_data)
-                temp_file_path = temp_file.name
-            
-            try:
-                text = ""
-                with open(temp_file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-                
-                return text.strip()
-                
-            finally:
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
+            text = extractor.text(file_data, 'pdf')
+            if extractor.truncated:
+                logger.warning(f"PDF text extraction stopped early ({extractor.page_count} pages)")
+            return text
                     
         except Exception as e:
             logger.error(f"PDF text extraction error: {e}")
             raise ValueError(f"Could not extract text from PDF: {e}")
 
-    async def _extract_text_from_docx(self, file_data: bytes) -> str:
+    async def _extract_text_from_docx(self, file_data: DocumentSource, extractor: DocumentTextExtractor) -> str:
         """Extract text from DOCX file"""
         try:
-            with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as temp_file:
-                temp_file.write(file_data)
-                temp_file_path = temp_file.name
-            
-            try:
-                doc = docx.Document(temp_file_path)
-                text = ""
-                for paragraph in doc.paragraphs:
-                    text += paragraph.text + "\n"
-                
-                return text.strip()
-                
-            finally:
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
+            return extractor.text(file_data, 'docx')
                     
         except Exception as e:
             logger.error(f"DOCX text extraction error: {e}")
@@ -209,26 +196,31 @@ class ResumeParserService:
             logger.error(f"Contact info extraction error: {e}")
             return {}
 
-    def _extract_skills(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_skills(self, text: str, sections: SectionIndex) -> List[Dict[str, Any]]:
         """Extract skills from resume text"""
         try:
-            text_lower = text.lower()
             found_skills = []
             
-            for category, skills_list in self.skills_keywords.items():
-                category_skills = []
-                for skill in skills_list:
-                    if skill.lower() in text_lower:
-                        category_skills.append(skill)
-                
-                if category_skills:
+            # One pass over the text for every skill and synonym in the taxonomy; names that are
+            # also everyday words ("Go", "Spring", "Slack") only count inside the skills section
+            matches_by_category: Dict[str, List[Dict[str, Any]]] = {}
+            for match in self.skill_index.find(text, context=sections.spans.get("skills", [])):
+                matches_by_category.setdefault(match["category"], []).append(match)
+            
+            for category in self.skill_index.categories:
+                matches = matches_by_category.get(category)
+                if matches:
                     found_skills.append({
                         "category": category.replace("_", " ").title(),
-                        "skills": category_skills
+                        "skills": list(dict.fromkeys(match["skill"] for match in matches)),
+                        "matches": [
+                            {"skill": match["skill"], "start": match["start"], "end": match["end"]}
+                            for match in matches
+                        ]
                     })
             
             # Also look for skills in dedicated skills section
-            skills_section = self._find_section(text, ["skills", "technical skills", "core competencies"])
+            skills_section = sections.get("skills")
             if skills_section:
                 additional_skills = self._extract_skills_from_section(skills_section)
                 if additional_skills:
@@ -243,16 +235,13 @@ class ResumeParserService:
             logger.error(f"Skills extraction error: {e}")
             return []
 
-    def _extract_experience(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_experience(self, sections: SectionIndex) -> List[Dict[str, Any]]:
         """Extract work experience"""
         try:
             experience = []
             
             # Look for experience section
-            exp_section = self._find_section(text, [
-                "experience", "work experience", "professional experience", 
-                "employment", "career history", "work history"
-            ])
+            exp_section = sections.get("experience")
             
             if not exp_section:
                 return []
@@ -274,15 +263,13 @@ class ResumeParserService:
             logger.error(f"Experience extraction error: {e}")
             return []
 
-    def _extract_education(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_education(self, sections: SectionIndex) -> List[Dict[str, Any]]:
         """Extract education information"""
         try:
             education = []
             
             # Look for education section
-            edu_section = self._find_section(text, [
-                "education", "academic background", "qualifications", "academic qualifications"
-            ])
+            edu_section = sections.get("education")
             
             if not edu_section:
                 return []
@@ -322,15 +309,13 @@ class ResumeParserService:
             logger.error(f"Education extraction error: {e}")
             return []
 
-    def _extract_certifications(self, text: str) -> List[str]:
+    def _extract_certifications(self, text: str, sections: SectionIndex) -> List[str]:
         """Extract certifications"""
         try:
             certifications = []
             
             # Look for certifications section
-            cert_section = self._find_section(text, [
-                "certifications", "certificates", "professional certifications", "licenses"
-            ])
+            cert_section = sections.get("certifications")
             
             if cert_section:
                 # Split by lines and filter
@@ -360,15 +345,13 @@ class ResumeParserService:
             logger.error(f"Certifications extraction error: {e}")
             return []
 
-    def _extract_projects(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_projects(self, sections: SectionIndex) -> List[Dict[str, Any]]:
         """Extract project information"""
         try:
             projects = []
             
             # Look for projects section
-            proj_section = self._find_section(text, [
-                "projects", "personal projects", "key projects", "notable projects"
-            ])
+            proj_section = sections.get("projects")
             
             if proj_section:
                 # Split by project separators
@@ -392,14 +375,11 @@ class ResumeParserService:
             logger.error(f"Projects extraction error: {e}")
             return []
 
-    def _extract_summary(self, text: str) -> str:
+    def _extract_summary(self, sections: SectionIndex) -> str:
         """Extract professional summary"""
         try:
             # Look for summary section
-            summary_section = self._find_section(text, [
-                "summary", "professional summary", "profile", "objective", 
-                "career objective", "about me", "overview"
-            ])
+            summary_section = sections.get("summary")
             
             if summary_section:
                 # Clean up the summary
@@ -414,15 +394,13 @@ class ResumeParserService:
             logger.error(f"Summary extraction error: {e}")
             return ""
 
-    def _extract_achievements(self, text: str) -> List[str]:
+    def _extract_achievements(self, sections: SectionIndex) -> List[str]:
         """Extract achievements and accomplishments"""
         try:
             achievements = []
             
             # Look for achievements section
-            ach_section = self._find_section(text, [
-                "achievements", "accomplishments", "awards", "honors", "recognition"
-            ])
+            ach_section = sections.get("achievements")
             
             if ach_section:
                 lines = ach_section.split('\n')
@@ -440,15 +418,13 @@ class ResumeParserService:
             logger.error(f"Achievements extraction error: {e}")
             return []
 
-    def _extract_languages(self, text: str) -> List[Dict[str, str]]:
+    def _extract_languages(self, sections: SectionIndex) -> List[Dict[str, str]]:
         """Extract language skills"""
         try:
             languages = []
             
             # Look for languages section
-            lang_section = self._find_section(text, [
-                "languages", "language skills", "linguistic skills"
-            ])
+            lang_section = sections.get("languages")
             
             if lang_section:
                 # Common language patterns
@@ -475,25 +451,6 @@ class ResumeParserService:
             logger.error(f"Languages extraction error: {e}")
             return []
 
-    def _find_section(self, text: str, section_names: List[str]) -> str:
-        """Find a specific section in the resume text"""
-        try:
-            text_lower = text.lower()
-            
-            for section_name in section_names:
-                # Look for section headers
-                pattern = rf'(?:^|\n)\s*{re.escape(section_name)}\s*[:\-]?\s*\n(.*?)(?=\n\s*[A-Z][^a-z]*[:\-]|\n\s*$|$)'
-                match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-                
-                if match:
-                    return match.group(1).strip()
-            
-            return ""
-            
-        except Exception as e:
-            logger.error(f"Section finding error: {e}")
-            return ""
-
     def _find_line_containing(self, text: str, substring: str) -> str:
         """Find the line containing a specific substring"""
         lines = text.split('\n')
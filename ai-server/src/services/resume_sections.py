@@ -0,0 +1,90 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Section key -> heading texts that open it (matched case-insensitively, with
+# an optional trailing ":" or "-")
+SECTION_HEADINGS = {
+    "summary": [
+        "summary", "professional summary", "profile", "objective",
+        "career objective", "about me", "overview"
+    ],
+    "skills": ["skills", "technical skills", "core competencies"],
+    "experience": [
+        "experience", "work experience", "professional experience",
+        "employment", "career history", "work history"
+    ],
+    "education": ["education", "academic background", "qualifications", "academic qualifications"],
+    "certifications": ["certifications", "certificates", "professional certifications", "licenses"],
+    "projects": ["projects", "personal projects", "key projects", "notable projects"],
+    "achievements": ["achievements", "accomplishments", "awards", "honors", "recognition"],
+    "languages": ["languages", "language skills", "linguistic skills"]
+}
+
+_HEADING_LOOKUP = {
+    heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings
+}
+
+_LINE = re.compile(r"[^\n]+")
+_INLINE_HEADING = re.compile(r"\s*([A-Za-z][A-Za-z &]{1,40}?)\s*:\s*(\S.*)")
+
+
+def _normalize(line: str) -> str:
+    return " ".join(line.strip().rstrip(":-").lower().split())
+
+
+class SectionIndex:
+    """Heading -> text span index over a resume, built in one pass over its lines.
+
+    A line is a heading when it is one of ``SECTION_HEADINGS`` on its own
+    (``Experience``, ``SKILLS:``) or followed by inline content
+    (``Skills: Python, Go``). Only these headings open or close a section:
+    company names, job titles and sub-labels inside a section ("GOOGLE INC",
+    "Responsibilities:") are body text. A section runs to the next heading;
+    a section heading that appears more than once contributes every span.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.spans: Dict[str, List[Tuple[int, int]]] = {}
+        self.headings: List[Tuple[str, int]] = []
+
+        current: Optional[str] = None
+        content_start = 0
+        for line in _LINE.finditer(text):
+            heading = self._classify(line.group())
+            if heading is None:
+                continue
+            section, inline_offset = heading
+            if current is not None:
+                self._add_span(current, content_start, line.start())
+            current = section
+            content_start = line.start() + inline_offset if inline_offset else line.end()
+            self.headings.append((section, line.start()))
+
+        if current is not None:
+            self._add_span(current, content_start, len(text))
+
+    @staticmethod
+    def _classify(line: str) -> Optional[Tuple[str, int]]:
+        """``(section, inline content offset)`` for a heading line, or None for body text"""
+        if len(line) > 60:
+            return None
+
+        section = _HEADING_LOOKUP.get(_normalize(line))
+        if section is not None:
+            return section, 0
+
+        inline = _INLINE_HEADING.match(line)
+        if inline:
+            section = _HEADING_LOOKUP.get(_normalize(inline.group(1)))
+            if section is not None:
+                return section, inline.start(2)
+        return None
+
+    def _add_span(self, section: str, start: int, end: int):
+        if self.text[start:end].strip():
+            self.spans.setdefault(section, []).append((start, end))
+
+    def get(self, section: str) -> str:
+        """Text of ``section`` (every occurrence, in order), or "" when the resume has none"""
+        return "\n".join(self.text[start:end].strip() for start, end in self.spans.get(section, []))
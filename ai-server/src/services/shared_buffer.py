@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Iterator
+
+
+class SharedBuffer:
+    """Request bytes handed to a process worker through shared memory.
+
+    The API process writes a body into one shared block as it streams in and
+    passes only the block's name and size to the worker, which maps the same
+    memory (``attach_shared_buffer``). Large audio bodies are therefore never
+    pickled or copied through the executor's pipe. The creating side owns the
+    block and removes it on ``close()``.
+    """
+
+    def __init__(self, capacity: int):
+        self.shm = shared_memory.SharedMemory(create=True, size=max(capacity, 1))
+        self.capacity = capacity
+        self.size = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def write(self, chunk: bytes):
+        end = self.size + len(chunk)
+        if end > self.capacity:
+            raise ValueError("Body is larger than its declared Content-Length")
+        self.shm.buf[self.size:end] = chunk
+        self.size = end
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+@contextmanager
+def attach_shared_buffer(name: str, size: int) -> Iterator[memoryview]:
+    """The first ``size`` bytes of a ``SharedBuffer`` block, mapped in a worker.
+
+    Arrays viewing the memory must be released before the block is detached.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf[:size]
+    try:
+        yield view
+    finally:
+        view.release()
+        shm.close()
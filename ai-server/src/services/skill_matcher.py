@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "skills_taxonomy.json")
+
+_WHITESPACE = {" ", "\t", "\n", "\r", "\f", "\v"}
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _joined(text: str, outside: int, inside: int, step: int) -> bool:
+    """Whether the match edge at ``inside`` continues into a longer word at ``outside``.
+
+    A dot followed by a word character counts as part of the word, so "js" is
+    not found inside "Node.js" nor "net" inside "ASP.NET".
+    """
+    if not 0 <= outside < len(text) or not _is_word_char(text[inside]):
+        return False
+    if _is_word_char(text[outside]):
+        return True
+    beyond = outside + step
+    return text[outside] == "." and 0 <= beyond < len(text) and _is_word_char(text[beyond])
+
+
+class SkillIndex:
+    """Aho-Corasick automaton over every skill name and synonym in a taxonomy.
+
+    The taxonomy maps categories to skills, and each skill to its surface
+    forms::
+
+        {"categories": {"programming_languages": {
+            "python": [],
+            "javascript": ["js", "ecmascript"],
+            "go": {"synonyms": ["golang"], "exact": ["Go"], "context": true}
+        }}}
+
+    A list gives synonyms. The object form adds ``exact`` forms that only
+    match with the same case and replace the skill name itself, for names
+    like "R" that are ordinary words in lower case. ``"context": true`` marks
+    names that are also everyday words in any case ("Go-getter", "Spring
+    2020", "Slack off"): the skill name and its exact forms then only match
+    inside the ``context`` spans passed to ``find`` (the resume's skills
+    section), while its synonyms ("golang") match anywhere. ``find`` scans the
+    text once, whatever the taxonomy size, and keeps only matches that start
+    and end on word boundaries (dotted names such as "Node.js" count as one
+    word). Runs of whitespace match a single space. ``fingerprint`` is a
+    hash of the taxonomy, so results derived from it can be invalidated
+    when it changes.
+    """
+
+    def __init__(self, taxonomy: Dict[str, Any], fingerprint: Optional[str] = None):
+        self.fingerprint = fingerprint or hashlib.sha256(
+            json.dumps(taxonomy, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._output_link: List[int] = [0]
+        # (skill, category, surface form, case sensitive, needs context, length)
+        self.patterns: List[Tuple[str, str, str, bool, bool, int]] = []
+        self.categories: List[str] = []
+        self.skills: Dict[str, str] = {}
+
+        for category, skills in taxonomy.get("categories", taxonomy).items():
+            self.categories.append(category)
+            for skill, forms in skills.items():
+                self.skills[skill] = category
+                if isinstance(forms, dict):
+                    exact = forms.get("exact", [])
+                    synonyms = forms.get("synonyms", [])
+                    contextual = bool(forms.get("context", False))
+                else:
+                    exact, synonyms, contextual = [], forms, False
+                if not exact:
+                    self._add(skill, category, skill, False, contextual)
+                for surface in synonyms:
+                    self._add(skill, category, surface, False, False)
+                for surface in exact:
+                    self._add(skill, category, surface, True, contextual)
+        self._build_links()
+
+    @classmethod
+    def from_file(cls, path: str) -> "SkillIndex":
+        with open(path, "rb") as taxonomy_file:
+            content = taxonomy_file.read()
+        return cls(json.loads(content), fingerprint=hashlib.sha256(content).hexdigest())
+
+    def _add(self, skill: str, category: str, surface: str, case_sensitive: bool, contextual: bool):
+        surface = " ".join(surface.split())
+        state = 0
+        for char in surface.lower():
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._output_link.append(0)
+            state = next_state
+        self._output[state].append(len(self.patterns))
+        self.patterns.append((skill, category, surface, case_sensitive, contextual, len(surface)))
+
+    def _build_links(self):
+        """Breadth-first failure links, plus links to the nearest suffix state that ends a pattern"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                suffix = self._fail[child]
+                self._output_link[child] = suffix if self._output[suffix] else self._output_link[suffix]
+                queue.append(child)
+
+    def find(self, text: str, context: Sequence[Tuple[int, int]] = ()) -> List[Dict[str, Any]]:
+        """Every skill occurrence as ``{"skill", "category", "start", "end"}`` offsets into ``text``.
+
+        ``context`` lists ``(start, end)`` spans of ``text`` where contextual
+        names count; outside them (or when it is empty) they are skipped.
+        """
+        goto, fail, output, output_link = self._goto, self._fail, self._output, self._output_link
+        matches = []
+        # Original offsets of the characters fed to the automaton, to map matches back
+        consumed: List[int] = []
+        state = 0
+        previous_space = True
+
+        for index, char in enumerate(text):
+            if char in _WHITESPACE:
+                if previous_space:
+                    continue
+                char = " "
+                previous_space = True
+            else:
+                char = char.lower()
+                previous_space = False
+            consumed.append(index)
+
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            emitting = state if output[state] else output_link[state]
+            while emitting:
+                for pattern_id in output[emitting]:
+                    match = self._accept(text, consumed, index, pattern_id, context)
+                    if match is not None:
+                        matches.append(match)
+                emitting = output_link[emitting]
+
+        return matches
+
+    def _accept(
+        self,
+        text: str,
+        consumed: List[int],
+        end_index: int,
+        pattern_id: int,
+        context: Sequence[Tuple[int, int]]
+    ) -> Optional[Dict[str, Any]]:
+        skill, category, surface, case_sensitive, contextual, length = self.patterns[pattern_id]
+        start = consumed[-length]
+        end = end_index + 1
+        if contextual and not any(span_start <= start and end <= span_end for span_start, span_end in context):
+            return None
+        if _joined(text, start - 1, start, -1) or _joined(text, end, end - 1, 1):
+            return None
+        if case_sensitive and " ".join(text[start:end].split()) != surface:
+            return None
+        return {"skill": skill, "category": category, "start": start, "end": end}
+
+
+@lru_cache(maxsize=4)
+def load_skill_index(path: Optional[str] = None) -> SkillIndex:
+    """Compiled index for ``path`` (``SKILLS_TAXONOMY_PATH``), built once per process"""
+    return SkillIndex.from_file(path or os.getenv("SKILLS_TAXONOMY_PATH") or DEFAULT_TAXONOMY_PATH)
@@ -3,7 +3,7 @@ import io
 import os
 import tempfile
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union, BinaryIO
 from loguru import logger
 import speech_recognition as sr
 # import whisper  # Commented out due to compatibility issues
@@ -39,8 +39,8 @@ class SpeechRecognitionService:
             logger.error(f"Speech recognition health check failed: {e}")
             return {"status": "unhealthy", "service": "speech_recognition", "error": str(e)}
 
-    async def transcribe_audio(self, audio_data: bytes) -> Dict[str, Any]:
-        """Transcribe audio to text using multiple methods"""
+    async def transcribe_audio(self, audio_data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
+        """Transcribe audio (bytes or an open file handle) to text using multiple methods"""
         try:
             # Try Whisper first (more accurate)
             if self.whisper_model:
@@ -72,7 +72,7 @@ class SpeechRecognitionService:
                 "error": str(e)
             }
 
-    async def _transcribe_with_whisper(self, audio_data: bytes) -> Dict[str, Any]:
+    async def _transcribe_with_whisper(self, audio_data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         """Transcribe using Whisper model - DISABLED"""
         try:
             logger.warning("Whisper transcription disabled due to compatibility issues")
@@ -81,16 +81,22 @@ class SpeechRecognitionService:
             logger.error(f"Whisper transcription error: {e}")
             return {"success": False, "error": str(e)}
 
-    async def _transcribe_with_google(self, audio_data: bytes) -> Dict[str, Any]:
+    async def _transcribe_with_google(self, audio_data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         """Transcribe using Google Speech Recognition"""
         try:
-            # Convert audio data to AudioFile
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_file.write(audio_data)
-                temp_file_path = temp_file.name
+            # File handles (e.g. spooled uploads) are read in place; raw bytes go through a temp file
+            temp_file_path = None
+            if isinstance(audio_data, (bytes, bytearray)):
+                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+                    temp_file.write(audio_data)
+                    temp_file_path = temp_file.name
+                audio_source = temp_file_path
+            else:
+                audio_data.seek(0)
+                audio_source = audio_data
             
             try:
-                with sr.AudioFile(temp_file_path) as source:
+                with sr.AudioFile(audio_source) as source:
                     # Record the audio data
                     audio = self.recognizer.record(source)
                 
@@ -130,7 +136,7 @@ class SpeechRecognitionService:
                 
             finally:
                 # Clean up temporary file
-                if os.path.exists(temp_file_path):
+                if temp_file_path and os.path.exists(temp_file_path):
                     os.unlink(temp_file_path)
                     
         except sr.UnknownValueError:
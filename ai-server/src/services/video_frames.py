@@ -0,0 +1,119 @@
+import base64
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+import cv2
+import numpy as np
+
+# Base64 text (JSON endpoints), raw bytes or an open (spooled) upload
+VideoSource = Union[str, bytes, BinaryIO]
+
+# Containers without a usable frame rate (e.g. MediaRecorder WebM) are read as 30fps
+DEFAULT_FPS = 30.0
+
+
+@contextmanager
+def open_video(video_data: VideoSource) -> Iterator[cv2.VideoCapture]:
+    """Open a video with OpenCV through a temporary file that is removed afterwards"""
+    if isinstance(video_data, str):
+        video_data = base64.b64decode(video_data)
+
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as temp_file:
+        if isinstance(video_data, (bytes, bytearray)):
+            temp_file.write(video_data)
+        else:
+            video_data.seek(0)
+            shutil.copyfileobj(video_data, temp_file)
+        temp_file_path = temp_file.name
+
+    cap = cv2.VideoCapture(temp_file_path)
+    try:
+        if not cap.isOpened():
+            raise ValueError("Could not open video file")
+        yield cap
+    finally:
+        cap.release()
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+
+class FrameSampler:
+    """Evenly spaced frames from a video under a frame-count and wall-clock budget.
+
+    The sampling interval stretches with the video so at most ``max_frames``
+    (``VIDEO_SAMPLE_MAX_FRAMES``) frames cover the whole recording, and never
+    drops below ``min_interval`` seconds. Sampling stops after ``max_seconds``
+    (``VIDEO_SAMPLE_MAX_SECONDS``) of decode time and sets ``truncated``, so a
+    30-minute recording still finishes in bounded time. Time the caller adds
+    to ``excluded_seconds`` while consuming frames (work with its own budget)
+    does not count against ``max_seconds``. Sparse sampling on
+    seekable files jumps straight to each frame; otherwise frames are grabbed
+    sequentially and only the sampled ones are converted.
+    """
+
+    # Seeking beats sequential grabbing once samples are this many frames apart
+    seek_stride = 60
+
+    def __init__(
+        self,
+        max_frames: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        min_interval: float = 0.5
+    ):
+        self.max_frames = max_frames or int(os.getenv("VIDEO_SAMPLE_MAX_FRAMES", 120))
+        self.max_seconds = max_seconds or float(os.getenv("VIDEO_SAMPLE_MAX_SECONDS", 20))
+        self.min_interval = min_interval
+        self.truncated = False
+        self.video_duration = 0.0
+        self.excluded_seconds = 0.0
+
+    def sample(self, cap: cv2.VideoCapture, duration: Optional[float] = None) -> Iterator[Tuple[float, np.ndarray]]:
+        """Yield ``(timestamp_seconds, bgr_frame)`` pairs; ``duration`` is used when the container has no frame count"""
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        if not 0 < fps <= 240:
+            fps = DEFAULT_FPS
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.video_duration = frame_count / fps if frame_count > 0 else (duration or 0.0)
+
+        interval = max(self.min_interval, self.video_duration / self.max_frames)
+        stride = max(1, int(round(interval * fps)))
+        deadline = time.monotonic() + self.max_seconds
+        self.excluded_seconds = 0.0
+
+        if frame_count > 0 and stride >= self.seek_stride:
+            frames = self._seek(cap, stride, frame_count, fps)
+        else:
+            frames = self._grab(cap, stride, fps)
+
+        sampled = 0
+        for timestamp, frame in frames:
+            yield timestamp, frame
+            sampled += 1
+            if sampled >= self.max_frames or time.monotonic() - self.excluded_seconds > deadline:
+                # Only a cut-off if the video actually continues past this frame
+                self.truncated = timestamp + interval < self.video_duration or (
+                    frame_count <= 0 and cap.grab()
+                )
+                break
+
+    def _seek(self, cap: cv2.VideoCapture, stride: int, frame_count: int, fps: float):
+        for frame_number in range(0, frame_count, stride):
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            ok, frame = cap.read()
+            if not ok:
+                break
+            yield frame_number / fps, frame
+
+    def _grab(self, cap: cv2.VideoCapture, stride: int, fps: float):
+        frame_number = 0
+        while cap.grab():
+            if frame_number % stride == 0:
+                ok, frame = cap.retrieve()
+                if not ok:
+                    break
+                position = cap.get(cv2.CAP_PROP_POS_MSEC)
+                yield (position / 1000 if position > 0 else frame_number / fps), frame
+            frame_number += 1
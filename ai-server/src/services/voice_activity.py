@@ -0,0 +1,95 @@
+import numpy as np
+from typing import Optional, Tuple
+from services.audio_features import AudioFeatureFrames
+
+
+def run_lengths(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return start/end frame indices (end exclusive) of every True run in a boolean mask"""
+    padded = np.concatenate(([False], np.asarray(mask, dtype=bool), [False]))
+    edges = np.diff(padded.astype(np.int8))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+class EnergyVADEngine:
+    """Energy-based voice activity with hysteresis between two RMS thresholds.
+
+    Frames above ``speech_ratio * mean`` are speech, frames below
+    ``silence_ratio * mean`` are silence, and frames in between keep the state
+    of the last decided frame.
+    """
+
+    name = "energy"
+
+    def __init__(self, speech_ratio: float = 0.3, silence_ratio: float = 0.2):
+        self.speech_ratio = speech_ratio
+        self.silence_ratio = silence_ratio
+
+    def speech_mask(self, features: AudioFeatureFrames) -> np.ndarray:
+        energy = features.rms
+        if len(energy) == 0:
+            return np.zeros(0, dtype=bool)
+
+        mean_energy = np.mean(energy)
+        speech = energy > mean_energy * self.speech_ratio
+        silence = energy < mean_energy * self.silence_ratio
+        decided = speech | silence
+
+        # Forward-fill undecided frames with the last decided state
+        last_decided = np.where(decided, np.arange(len(energy)), -1)
+        np.maximum.accumulate(last_decided, out=last_decided)
+        return np.where(last_decided >= 0, speech[np.maximum(last_decided, 0)], False)
+
+
+class VADSegments:
+    """Speech and silence segments of one signal as parallel numpy arrays (seconds)"""
+
+    def __init__(self, speech_mask: np.ndarray, time_per_frame: float):
+        self.speech_mask = speech_mask
+        self.time_per_frame = time_per_frame
+        self.total_frames = len(speech_mask)
+
+        speech_starts, speech_ends = run_lengths(speech_mask)
+        silence_starts, silence_ends = run_lengths(~speech_mask)
+
+        self.speech_starts = speech_starts * time_per_frame
+        self.speech_ends = speech_ends * time_per_frame
+        self.silence_starts = silence_starts * time_per_frame
+        self.silence_ends = silence_ends * time_per_frame
+        self._silence_end_frames = silence_ends
+
+    @property
+    def speech_durations(self) -> np.ndarray:
+        return self.speech_ends - self.speech_starts
+
+    @property
+    def silence_durations(self) -> np.ndarray:
+        return self.silence_ends - self.silence_starts
+
+    @property
+    def speech_duration(self) -> float:
+        return float(np.count_nonzero(self.speech_mask) * self.time_per_frame)
+
+    def pauses(self, min_duration: float = 0.3) -> Tuple[np.ndarray, np.ndarray]:
+        """Start times and durations of silences bounded by speech on the right.
+
+        Trailing silence that runs to the end of the signal is not a pause.
+        """
+        durations = self.silence_durations
+        keep = (durations > min_duration) & (self._silence_end_frames < self.total_frames)
+        return self.silence_starts[keep], durations[keep]
+
+
+class VADSegmenter:
+    """Pluggable voice-activity segmentation over shared audio feature frames.
+
+    An engine is any object exposing ``speech_mask(features) -> np.ndarray``;
+    the segmenter turns that mask into speech/silence segments by run-length
+    encoding, without a per-frame Python loop.
+    """
+
+    def __init__(self, engine: Optional[object] = None):
+        self.engine = engine or EnergyVADEngine()
+
+    def segment(self, features: AudioFeatureFrames) -> VADSegments:
+        speech_mask = np.asarray(self.engine.speech_mask(features), dtype=bool)
+        return VADSegments(speech_mask, features.time_per_frame)
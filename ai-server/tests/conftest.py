@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Services are imported as top-level packages from src, as main.py does
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
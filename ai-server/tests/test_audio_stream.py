@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from services.audio_analysis import AudioAnalysisService
+from services.audio_stream import AudioStreamAnalyzer
+
+SR = 16000
+
+
+def tone(seconds):
+    t = np.arange(int(seconds * SR)) / SR
+    return 0.3 * np.sin(2 * np.pi * 150 * t)
+
+
+def speech_pause_speech():
+    signal = np.concatenate([tone(1), np.zeros(int(1.5 * SR)), tone(1)]).astype(np.float32)
+    return signal, (signal * 32767).astype("<i2").tobytes()
+
+
+def feed_all(analyzer, pcm, chunk_bytes):
+    # Odd chunk sizes split samples across chunks
+    return [
+        partial for partial in (
+            analyzer.feed(pcm[start:start + chunk_bytes]) for start in range(0, len(pcm), chunk_bytes)
+        )
+        if partial
+    ]
+
+
+def test_partials_arrive_every_interval_and_track_the_open_pause():
+    _, pcm = speech_pause_speech()
+    analyzer = AudioStreamAnalyzer(sample_rate=SR, partial_interval=0.5)
+
+    partials = feed_all(analyzer, pcm, 8001)
+
+    assert [p["elapsed_seconds"] for p in partials] == [0.5, 1.0, 1.5, 2.0, 2.5, 3.0]
+    during_pause = [p for p in partials if 1.0 < p["elapsed_seconds"] <= 2.5]
+    assert all(p["open_pause"]["start_time"] == 1.0 for p in during_pause)
+    durations = [p["open_pause"]["duration"] for p in during_pause]
+    assert durations == sorted(durations) and durations[-1] == pytest.approx(1.5, abs=0.05)
+    assert all(p["pauses"] == [] for p in during_pause)
+    assert partials[1]["pitch"]["mean_pitch_hz"] == pytest.approx(150, abs=2)
+
+
+def test_pause_closes_when_speech_resumes():
+    _, pcm = speech_pause_speech()
+    analyzer = AudioStreamAnalyzer(sample_rate=SR, partial_interval=0.5)
+
+    feed_all(analyzer, pcm, 8001)
+    final_partial = analyzer.partial_metrics()
+
+    assert final_partial["open_pause"] is None
+    assert len(final_partial["pauses"]) == 1
+    pause = final_partial["pauses"][0]
+    assert pause["start_time"] == 1.0
+    assert pause["duration"] == pytest.approx(1.5, abs=0.05)
+    assert pause["type"] == "medium"
+
+
+@pytest.mark.asyncio
+async def test_final_result_matches_full_analysis_of_the_stream():
+    signal, pcm = speech_pause_speech()
+    analyzer = AudioStreamAnalyzer(sample_rate=SR, partial_interval=0.5)
+    feed_all(analyzer, pcm, 8001)
+
+    streamed = analyzer.signal()
+    assert np.allclose(streamed, signal, atol=1e-4)
+
+    service = AudioAnalysisService()
+    final = await service.analyze_signal(streamed, analyzer.sample_rate, analyzer.target_sample_rate)
+    assert final == await service.analyze_signal(signal, SR, analyzer.target_sample_rate)
+    assert "pause_analysis" in final and "open_pause" not in final
+
+
+def test_unsupported_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        AudioStreamAnalyzer(encoding="mp3")
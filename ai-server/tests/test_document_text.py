@@ -0,0 +1,107 @@
+import glob
+import io
+import os
+import tempfile
+
+import docx
+import pytest
+
+from services.document_text import DocumentTextExtractor, shutdown_page_pool
+
+
+def make_pdf(page_texts):
+    """A minimal PDF with one line of Helvetica text per page"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in page_texts:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+
+def temp_pdfs():
+    return set(glob.glob(os.path.join(tempfile.gettempdir(), "*.pdf")))
+
+
+def test_plain_text_from_bytes_and_file_handle():
+    extractor = DocumentTextExtractor()
+    handle = io.BytesIO(b"Jane Doe\nPython")
+    handle.read()
+
+    assert extractor.pages(b"Jane Doe\nPython", "txt") == ["Jane Doe\nPython"]
+    assert extractor.text(handle, "txt") == "Jane Doe\nPython"
+    assert extractor.page_count == 1
+
+
+def test_docx_paragraphs():
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    document.add_paragraph("Skills: Python")
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    extractor = DocumentTextExtractor()
+
+    assert extractor.text(buffer.getvalue(), "docx") == "Jane Doe\nSkills: Python"
+    assert extractor.page_count == 1
+
+
+def test_pdf_pages_in_order():
+    extractor = DocumentTextExtractor(parallel_pages=100)
+
+    assert extractor.pages(make_pdf(["Page one", "Page two", "Page three"]), "pdf") == [
+        "Page one", "Page two", "Page three"
+    ]
+    assert extractor.page_count == 3
+    assert not extractor.truncated
+
+
+def test_pdf_page_limit_truncates():
+    extractor = DocumentTextExtractor(max_pages=2, parallel_pages=100)
+
+    assert extractor.pages(make_pdf(["A", "B", "C", "D"]), "pdf") == ["A", "B"]
+    assert extractor.page_count == 4
+    assert extractor.truncated
+
+
+def test_pdf_time_limit_truncates():
+    extractor = DocumentTextExtractor(max_seconds=1e-9, parallel_pages=100)
+
+    pages = extractor.pages(make_pdf(["A", "B", "C"]), "pdf")
+
+    assert pages == ["A"]
+    assert extractor.truncated
+
+
+def test_parallel_pdf_extraction_keeps_page_order_and_cleans_up():
+    texts = [f"Page {index}" for index in range(10)]
+    before = temp_pdfs()
+    try:
+        extractor = DocumentTextExtractor(parallel_pages=2, workers=2)
+
+        assert extractor.pages(make_pdf(texts), "pdf") == texts
+        assert not extractor.truncated
+        assert temp_pdfs() - before == set()
+    finally:
+        shutdown_page_pool()
+
+
+def test_unsupported_format_is_rejected():
+    with pytest.raises(ValueError):
+        DocumentTextExtractor().pages(b"data", "rtf")
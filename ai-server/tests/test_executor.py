@@ -0,0 +1,141 @@
+import asyncio
+import threading
+
+import pytest
+
+from services.executor import ExecutorBusyError, ServicePool
+
+
+class EchoService:
+    def echo(self, value):
+        return value
+
+    def health_check(self):
+        return {"status": "healthy", "service": "echo"}
+
+
+class BlockingService:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def wait(self):
+        self.release.wait(5)
+        return "done"
+
+
+class BrokenService:
+    def __init__(self):
+        raise ImportError("No module named 'mediapipe'")
+
+
+@pytest.mark.asyncio
+async def test_warmup_marks_pool_warm():
+    pool = ServicePool("echo", EchoService, max_workers=2)
+    try:
+        await pool.warmup()
+
+        assert pool.warm
+        assert pool.stats()["warmup_errors"] == []
+        assert await pool.call("echo", 3) == 3
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_warmup_is_not_warm_and_reports_errors():
+    pool = ServicePool("broken", BrokenService, max_workers=2)
+    try:
+        await pool.warmup()
+
+        assert not pool.warm
+        assert pool.stats()["warmup_errors"]
+        health = await pool.health_check()
+        assert health["status"] == "unhealthy"
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_health_check_does_not_start_idle_pool():
+    pool = ServicePool("echo", EchoService)
+
+    assert (await pool.health_check())["status"] == "starting"
+    assert not pool.stats()["started"]
+
+
+@pytest.mark.asyncio
+async def test_health_check_reports_worker_check_from_warmup():
+    pool = ServicePool("echo", EchoService)
+    try:
+        await pool.warmup()
+
+        health = await pool.health_check()
+        assert health["status"] == "healthy"
+        assert health["service"] == "echo"
+        assert health["in_flight"] == 0
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_health_check_does_not_queue_behind_running_jobs():
+    service = BlockingService()
+    pool = ServicePool("blocking", lambda: service, max_workers=1, max_queue=1)
+    try:
+        await pool.warmup()
+        job = asyncio.ensure_future(pool.call("wait"))
+        await asyncio.sleep(0.05)
+
+        health = await asyncio.wait_for(pool.health_check(), timeout=0.5)
+        assert health["status"] == "healthy"
+        assert health["in_flight"] == 1
+
+        service.release.set()
+        assert await job == "done"
+        assert pool.stats()["completed"] == 1
+    finally:
+        service.release.set()
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_is_degraded():
+    service = BlockingService()
+    pool = ServicePool("blocking", lambda: service, max_workers=1, max_queue=0)
+    try:
+        await pool.warmup()
+        job = asyncio.ensure_future(pool.call("wait"))
+        await asyncio.sleep(0.05)
+
+        assert (await pool.health_check())["status"] == "degraded"
+
+        service.release.set()
+        await job
+    finally:
+        service.release.set()
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_call_holds_its_slot_until_the_worker_finishes():
+    service = BlockingService()
+    pool = ServicePool("blocking", lambda: service, max_workers=1, max_queue=0)
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.call("wait"), timeout=0.05)
+
+        # The worker is still running the abandoned call, so there is no room
+        assert pool.stats()["in_flight"] == 1
+        with pytest.raises(ExecutorBusyError):
+            await pool.call("wait")
+
+        service.release.set()
+        for _ in range(100):
+            if pool.stats()["in_flight"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert pool.stats()["in_flight"] == 0
+        assert await pool.call("wait") == "done"
+    finally:
+        service.release.set()
+        pool.shutdown()
@@ -0,0 +1,68 @@
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from services.frame_pipeline import FrameConsumer, FramePipeline
+from services.video_frames import FrameSampler
+
+
+@pytest.fixture
+def video_bytes(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    for index in range(100):
+        writer.write(np.full((48, 64, 3), index, dtype=np.uint8))
+    writer.release()
+    with open(path, "rb") as video_file:
+        return video_file.read()
+
+
+class RecordingConsumer(FrameConsumer):
+    def __init__(self, name, delay=0.0, min_interval=0.0, max_seconds=None):
+        self.name = name
+        self.delay = delay
+        self.min_interval = min_interval
+        self.max_seconds = max_seconds
+        self.timestamps = []
+
+    async def consume(self, frame):
+        time.sleep(self.delay)
+        self.timestamps.append(frame.timestamp)
+
+    def result(self, sampler):
+        return {"frames": len(self.timestamps)}
+
+
+def test_consumer_must_implement_consume_and_result():
+    class Incomplete(FrameConsumer):
+        async def consume(self, frame):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+@pytest.mark.asyncio
+async def test_min_interval_thins_frames(video_bytes):
+    every, sparse = RecordingConsumer("every"), RecordingConsumer("sparse", min_interval=2.0)
+
+    results = await FramePipeline(FrameSampler(min_interval=0.5)).register(every).register(sparse).run(video_bytes)
+
+    assert results["every"]["frames"] == 20
+    assert sparse.timestamps == [0.0, 2.0, 4.0, 6.0, 8.0]
+
+
+@pytest.mark.asyncio
+async def test_own_budget_consumer_does_not_cut_shared_sampling(video_bytes):
+    sampler = FrameSampler(max_seconds=0.1, min_interval=0.5)
+    landmarks = RecordingConsumer("landmarks")
+    emotions = RecordingConsumer("emotions", delay=0.05, max_seconds=0.12)
+
+    await FramePipeline(sampler).register(landmarks).register(emotions).run(video_bytes)
+
+    assert len(landmarks.timestamps) == 20
+    assert not sampler.truncated
+    assert emotions.budget_exhausted
+    assert len(emotions.timestamps) < 20
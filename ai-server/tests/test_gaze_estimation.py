@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from services.gaze_estimation import (
+    FACE_EDGES, FACE_MESH_POINTS, LEFT_EYE_CORNERS, LEFT_EYE_LIDS, LEFT_IRIS_CENTER, NOSE_TIP,
+    RIGHT_EYE_CORNERS, RIGHT_EYE_LIDS, RIGHT_IRIS_CENTER, GazeEstimator, face_landmark_array
+)
+
+
+def face(iris_x=0.5, iris_y=0.5, nose_x=0.5):
+    """Frontal face landmarks; iris and nose positions as fractions of the eye / face span"""
+    points = np.zeros((FACE_MESH_POINTS, 3), dtype=np.float32)
+    for corners, lids, iris, (left, right) in (
+        (RIGHT_EYE_CORNERS, RIGHT_EYE_LIDS, RIGHT_IRIS_CENTER, (0.3, 0.4)),
+        (LEFT_EYE_CORNERS, LEFT_EYE_LIDS, LEFT_IRIS_CENTER, (0.6, 0.7)),
+    ):
+        points[corners[0], :2] = (left, 0.4)
+        points[corners[1], :2] = (right, 0.4)
+        points[lids[0], :2] = ((left + right) / 2, 0.38)
+        points[lids[1], :2] = ((left + right) / 2, 0.42)
+        points[iris, :2] = (left + iris_x * (right - left), 0.38 + iris_y * 0.04)
+    points[FACE_EDGES[0], :2] = (0.2, 0.5)
+    points[FACE_EDGES[1], :2] = (0.8, 0.5)
+    points[NOSE_TIP, :2] = (0.2 + nose_x * 0.6, 0.5)
+    return points
+
+
+def test_centred_gaze_is_full_eye_contact():
+    gaze = GazeEstimator().estimate(face())
+
+    assert gaze.horizontal == pytest.approx([0.5], abs=1e-5)
+    assert gaze.vertical == pytest.approx([0.5], abs=1e-5)
+    assert gaze.head_yaw == pytest.approx([0.0], abs=1e-5)
+    assert gaze.on_camera.tolist() == [True]
+    assert gaze.score == pytest.approx([100.0], abs=1e-3)
+
+
+def test_frames_are_scored_independently():
+    frames = np.stack([
+        face(),
+        face(iris_x=0.56),  # half the horizontal tolerance
+        face(iris_x=0.8),  # looking to the side
+        face(iris_y=0.9),  # looking down
+        face(nose_x=0.7),  # head turned
+        np.full((FACE_MESH_POINTS, 3), np.nan, dtype=np.float32)  # no face
+    ])
+
+    gaze = GazeEstimator().estimate(frames)
+
+    assert gaze.on_camera.tolist() == [True, True, False, False, False, False]
+    assert gaze.face_detected.tolist() == [True, True, True, True, True, False]
+    assert gaze.score[:2] == pytest.approx([100.0, 75.0], abs=0.1)
+    assert gaze.score[2] == 0.0
+    assert gaze.score[5] == 0.0
+
+
+def test_face_landmark_array_converts_the_first_face():
+    landmarks = [SimpleNamespace(x=i / 1000, y=0.5, z=0.0) for i in range(FACE_MESH_POINTS)]
+    other = [SimpleNamespace(x=1.0, y=1.0, z=1.0)] * FACE_MESH_POINTS
+
+    points = face_landmark_array([SimpleNamespace(landmark=landmarks), SimpleNamespace(landmark=other)])
+
+    assert points.shape == (FACE_MESH_POINTS, 3)
+    assert points[10] == pytest.approx([0.01, 0.5, 0.0])
+
+
+def test_face_landmark_array_is_nan_without_a_face_or_iris_points():
+    assert np.isnan(face_landmark_array(None)).all()
+
+    no_iris = [SimpleNamespace(x=0.5, y=0.5, z=0.0)] * 468
+    points = face_landmark_array([SimpleNamespace(landmark=no_iris)])
+    assert not np.isnan(points[:468]).any()
+    assert np.isnan(points[468:]).all()
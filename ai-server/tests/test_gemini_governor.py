@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from services.gemini_governor import CircuitOpenError, GeminiGovernor, TokenBucket
+
+
+def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(60)  # one per second
+    bucket.take(60)
+
+    assert bucket.wait_time(1) == pytest.approx(1.0, abs=0.01)
+
+    bucket.updated -= 2  # two seconds pass
+    assert bucket.wait_time(2) == 0.0
+
+
+def test_token_bucket_caps_requests_at_capacity():
+    bucket = TokenBucket(10)
+
+    assert bucket.wait_time(50) == 0.0
+    bucket.take(50)
+    assert bucket.tokens == 0.0
+
+
+@pytest.fixture
+def governor(monkeypatch):
+    monkeypatch.setenv("GEMINI_MAX_RETRIES", "1")
+    monkeypatch.setenv("GEMINI_RETRY_BASE_DELAY", "0")
+    monkeypatch.setenv("GEMINI_BREAKER_FAILURES", "2")
+    monkeypatch.setenv("GEMINI_BREAKER_RESET_SECONDS", "30")
+    return GeminiGovernor()
+
+
+def failing(error):
+    async def request():
+        raise error
+    return request
+
+
+async def succeeding():
+    return "ok"
+
+
+@pytest.mark.asyncio
+async def test_retryable_errors_are_retried(governor):
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("reset")
+        return "ok"
+
+    assert await governor.call(flaky) == "ok"
+    assert governor.stats()["retries"] == 1
+    assert governor.stats()["breaker_state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_do_not_trip_breaker(governor):
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            await governor.call(failing(ValueError("bad request")))
+
+    assert governor.stats()["breaker_state"] == "closed"
+    assert governor.stats()["retries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_consecutive_failures_and_fails_fast(governor):
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await governor.call(failing(ConnectionError("down")))
+
+    assert governor.stats()["breaker_state"] == "open"
+    with pytest.raises(CircuitOpenError):
+        await governor.call(succeeding)
+    assert governor.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_breaker_on_success(governor):
+    governor._state = "open"
+    governor._opened_at -= 60
+
+    assert await governor.call(succeeding) == "ok"
+    assert governor.stats()["breaker_state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_half_open_admits_one_probe_and_failed_probe_reopens(governor):
+    governor._state = "open"
+    governor._opened_at -= 60
+    release = asyncio.Event()
+
+    async def slow_failure():
+        await release.wait()
+        raise ConnectionError("still down")
+
+    probe = asyncio.ensure_future(governor.call(slow_failure))
+    await asyncio.sleep(0)
+    with pytest.raises(CircuitOpenError):
+        await governor.call(succeeding)
+
+    release.set()
+    with pytest.raises(ConnectionError):
+        await probe
+    assert governor.stats()["breaker_state"] == "open"
@@ -0,0 +1,70 @@
+import pytest
+
+from services.gemini_service import GeminiService
+from services.response_cache import ResponseCache
+
+
+class Chunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+
+    async def generate_content_async(self, prompt, stream=False):
+        async def response():
+            for index, text in enumerate(self.chunks):
+                if index == self.fail_after:
+                    raise ConnectionError("stream reset")
+                yield Chunk(text)
+        return response()
+
+
+class PassThroughGovernor:
+    async def call(self, request, tokens):
+        return await request()
+
+
+def make_service(model):
+    service = GeminiService.__new__(GeminiService)
+    service.model_name = "test-model"
+    service.model = model
+    service.cache = ResponseCache()
+    service.governor = PassThroughGovernor()
+    return service
+
+
+async def collect(service):
+    return [event async for event in service._stream_json("feedback", "prompt", lambda: {"fallback": True})]
+
+
+@pytest.mark.asyncio
+async def test_completed_stream_ends_with_the_full_document():
+    service = make_service(FakeModel(['{"score": 7, "strengths": ["a", ', '"b"]}']))
+
+    events = await collect(service)
+
+    assert events[-1] == {"event": "done", "value": {"score": 7, "strengths": ["a", "b"]}}
+
+
+@pytest.mark.asyncio
+async def test_failure_partway_ends_with_a_partial_done_of_the_streamed_items():
+    service = make_service(FakeModel(['{"score": 7, "strengths": ["a", ', '"b"]}'], fail_after=1))
+
+    events = await collect(service)
+
+    assert [event["event"] for event in events] == ["field", "item", "error", "done"]
+    assert events[-1] == {"event": "done", "value": {"score": 7, "strengths": ["a"]}, "partial": True}
+
+
+@pytest.mark.asyncio
+async def test_failure_before_any_event_ends_with_the_fallback():
+    service = make_service(FakeModel(['{"score"', ': 7}'], fail_after=1))
+
+    events = await collect(service)
+
+    assert [event["event"] for event in events] == ["error", "done"]
+    assert events[-1] == {"event": "done", "value": {"fallback": True}, "fallback": True}
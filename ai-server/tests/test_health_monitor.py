@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from services.health_monitor import HealthMonitor
+
+
+@pytest.mark.asyncio
+async def test_timed_out_check_is_degraded_and_still_ready():
+    async def slow():
+        await asyncio.sleep(1)
+        return {"status": "healthy"}
+
+    monitor = HealthMonitor(check_timeout=0.05)
+    monitor.register("slow", slow)
+    await monitor.refresh()
+
+    assert monitor.results["slow"]["status"] == "degraded"
+    assert monitor.ready
+    assert monitor.snapshot()["status"] == "degraded"
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_check_is_not_ready():
+    monitor = HealthMonitor()
+    monitor.register("ok", lambda: {"status": "healthy"})
+    monitor.register("down", lambda: {"status": "unhealthy"})
+
+    assert not monitor.ready
+    await monitor.refresh()
+
+    assert not monitor.ready
+    assert monitor.snapshot()["status"] == "unhealthy"
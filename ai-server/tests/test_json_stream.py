@@ -0,0 +1,66 @@
+import pytest
+
+from services.json_stream import IncrementalJSONParser, assemble_events
+
+
+def feed_in_chunks(parser, text, size):
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    return events
+
+
+DOCUMENT = '```json\n{"overallScore": 82, "strengths": ["clear", "concise"], "tips": {"a": [1, 2]}, "note": "a, b] {c}"}\n```'
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, len(DOCUMENT)])
+def test_object_fields_and_member_items_arrive_in_order(chunk_size):
+    parser = IncrementalJSONParser()
+
+    events = feed_in_chunks(parser, DOCUMENT, chunk_size)
+
+    assert events == [
+        {"event": "field", "key": "overallScore", "value": 82},
+        {"event": "item", "key": "strengths", "index": 0, "value": "clear"},
+        {"event": "item", "key": "strengths", "index": 1, "value": "concise"},
+        {"event": "field", "key": "strengths", "value": ["clear", "concise"]},
+        {"event": "field", "key": "tips", "value": {"a": [1, 2]}},
+        {"event": "field", "key": "note", "value": "a, b] {c}"},
+    ]
+    assert parser.finished
+    assert parser.result()["note"] == "a, b] {c}"
+
+
+def test_top_level_array_items():
+    parser = IncrementalJSONParser()
+
+    events = feed_in_chunks(parser, '[{"question": "Why?"}, {"question": "How \\"so\\"?"}]', 5)
+
+    assert [event["value"]["question"] for event in events] == ["Why?", 'How "so"?']
+    assert [event["index"] for event in events] == [0, 1]
+    assert all(event["key"] is None for event in events)
+
+
+def test_text_after_document_is_ignored():
+    parser = IncrementalJSONParser()
+
+    parser.feed('{"a": 1} trailing [text]')
+
+    assert parser.result() == {"a": 1}
+
+
+def test_incomplete_document_raises():
+    parser = IncrementalJSONParser()
+    parser.feed('{"a": [1, 2')
+
+    assert not parser.finished
+    with pytest.raises(ValueError):
+        parser.result()
+
+
+def test_assemble_events_rebuilds_what_was_streamed():
+    parser = IncrementalJSONParser()
+    events = parser.feed('{"overallScore": 82, "strengths": ["clear", "concise", "str')
+
+    assert assemble_events(events) == {"overallScore": 82, "strengths": ["clear", "concise"]}
+    assert assemble_events(IncrementalJSONParser().feed('[1, 2, 3')) == [1, 2]
@@ -0,0 +1,84 @@
+import pytest
+
+pytest.importorskip("mediapipe")
+
+from services import mediapipe_graphs  # noqa: E402
+from services.mediapipe_graphs import MediaPipeGraphPool  # noqa: E402
+
+
+class FakeGraphs:
+    """Stands in for a MediaPipe graph set so pool tests do not load models"""
+
+    def __init__(self):
+        self.closed = False
+        self.last_used = 0.0
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(mediapipe_graphs, "MediaPipeGraphs", FakeGraphs)
+    monkeypatch.setattr(mediapipe_graphs.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_sessions_keep_their_own_graphs(clock):
+    pool = MediaPipeGraphPool(max_sessions=4, idle_seconds=60)
+
+    first = pool.acquire("a")
+
+    assert pool.acquire("a") is first
+    assert pool.acquire("b") is not first
+    assert pool.stats()["created"] == 2
+
+
+def test_least_recently_used_session_is_evicted_when_full(clock):
+    pool = MediaPipeGraphPool(max_sessions=2, idle_seconds=60)
+    a, b = pool.acquire("a"), pool.acquire("b")
+    pool.acquire("a")  # b is now least recently used
+
+    pool.acquire("c")
+
+    assert b.closed and not a.closed
+    assert pool.acquire("a") is a
+    assert pool.stats()["sessions"] == 2
+    assert pool.stats()["evicted"] == 1
+
+
+def test_idle_sessions_are_evicted_on_next_acquire(clock):
+    pool = MediaPipeGraphPool(max_sessions=4, idle_seconds=60)
+    idle = pool.acquire("idle")
+    clock[0] += 30
+    active = pool.acquire("active")
+
+    clock[0] += 45  # idle unused for 75s, active for 45s
+    pool.acquire("new")
+
+    assert idle.closed and not active.closed
+    assert pool.acquire("active") is active
+    assert pool.stats()["evicted"] == 1
+
+
+def test_release_closes_a_session_when_it_ends(clock):
+    pool = MediaPipeGraphPool(max_sessions=4, idle_seconds=60)
+    graphs = pool.acquire("interview-1")
+
+    assert pool.release("interview-1") is True
+    assert graphs.closed
+    assert pool.release("interview-1") is False
+    assert pool.stats()["sessions"] == 0
+    assert pool.stats()["released"] == 1
+    assert pool.acquire("interview-1") is not graphs
+
+
+def test_close_closes_every_session(clock):
+    pool = MediaPipeGraphPool(max_sessions=4, idle_seconds=60)
+    sessions = [pool.acquire(name) for name in ("a", "b")]
+
+    pool.close()
+
+    assert all(graphs.closed for graphs in sessions)
+    assert pool.stats()["sessions"] == 0
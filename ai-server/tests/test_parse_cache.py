@@ -0,0 +1,104 @@
+import os
+import time
+
+from services.parse_cache import ParseCache
+
+
+def make_cache(tmp_path, **kwargs):
+    options = {"max_entries": 8, "max_bytes": 1024 * 1024, "ttl_seconds": 0}
+    options.update(kwargs)
+    return ParseCache(directory=str(tmp_path), **options)
+
+
+def test_key_depends_on_content_type_and_version():
+    key = ParseCache.key(b"resume", "pdf", "3")
+
+    assert key == ParseCache.key(b"resume", "pdf", "3")
+    assert key != ParseCache.key(b"resume!", "pdf", "3")
+    assert key != ParseCache.key(b"resume", "docx", "3")
+    assert key != ParseCache.key(b"resume", "pdf", "4")
+
+
+def test_miss_then_memory_hit(tmp_path):
+    cache = make_cache(tmp_path)
+
+    assert cache.get("a") is None
+    cache.set("a", {"skills": ["python"]})
+
+    assert cache.get("a") == {"skills": ["python"]}
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_hits_return_copies(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set("a", {"parsing_metadata": {"filename": "a.pdf"}})
+
+    cache.get("a")["parsing_metadata"]["filename"] = "b.pdf"
+
+    assert cache.get("a")["parsing_metadata"]["filename"] == "a.pdf"
+
+
+def test_disk_hit_after_restart(tmp_path):
+    make_cache(tmp_path).set("a", {"summary": "Engineer"})
+
+    cache = make_cache(tmp_path)
+
+    assert cache.get("a") == {"summary": "Engineer"}
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_memory_lru_evicts_oldest(tmp_path):
+    cache = make_cache(tmp_path, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, {"key": key})
+
+    assert list(cache._entries) == ["b", "c"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disk_eviction_removes_least_recently_used(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=250)
+    payload = {"text": "x" * 80}
+    cache.set("old", payload)
+    cache.set("used", payload)
+    past = time.time() - 100
+    os.utime(tmp_path / "old.json", (past, past))
+    os.utime(tmp_path / "used.json", (past + 50, past))
+
+    cache.set("new", payload)
+
+    assert sorted(os.listdir(tmp_path)) == ["new.json", "used.json"]
+    assert cache.stats()["disk_evictions"] == 1
+
+
+def test_expired_entries_are_not_served(tmp_path):
+    cache = make_cache(tmp_path, ttl_seconds=60)
+    cache.set("a", {"summary": "Engineer"})
+    stale = time.time() - 120
+    cache._entries["a"] = (cache._entries["a"][0], stale)
+    os.utime(tmp_path / "a.json", (stale, stale))
+
+    assert cache.get("a") is None
+    assert not (tmp_path / "a.json").exists()
+    assert cache.stats()["expirations"] == 1
+
+
+def test_expired_files_are_swept_at_startup(tmp_path):
+    make_cache(tmp_path).set("a", {"summary": "Engineer"})
+    stale = time.time() - 120
+    os.utime(tmp_path / "a.json", (stale, stale))
+
+    cache = make_cache(tmp_path, ttl_seconds=60)
+
+    assert os.listdir(tmp_path) == []
+    assert cache.stats()["disk_bytes"] == 0
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.enabled = False
+    cache.set("a", {"summary": "Engineer"})
+
+    assert cache.get("a") is None
+    assert os.listdir(tmp_path) == []
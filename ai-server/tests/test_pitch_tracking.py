@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from services.audio_features import AudioFeatureFrames
+from services.pitch_tracking import PitchTracker
+
+
+def sine(frequency, seconds, sr):
+    t = np.arange(int(seconds * sr)) / sr
+    return (0.3 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+@pytest.mark.parametrize("backend", PitchTracker.backends)
+@pytest.mark.parametrize("sr", [16000, 44100])
+@pytest.mark.parametrize("frequency", [100.0, 120.0, 220.0])
+def test_sine_tracks_its_frequency(backend, sr, frequency):
+    track = PitchTracker(backend).track(AudioFeatureFrames(sine(frequency, 2, sr), sr))
+
+    assert track.voiced.mean() > 0.9
+    assert np.median(track.voiced_f0) == pytest.approx(frequency, rel=0.02)
+
+
+def test_silence_after_a_tone_is_unvoiced():
+    sr = 16000
+    signal = np.concatenate([sine(200, 1, sr), np.zeros(sr, dtype=np.float32)])
+
+    track = PitchTracker("yin").track(AudioFeatureFrames(signal, sr))
+
+    assert track.time_per_frame == 0.01
+    assert track.voiced[:90].all()
+    assert not track.voiced[110:].any()
+
+
+def test_signal_shorter_than_one_frame_has_no_track():
+    track = PitchTracker("yin").track(AudioFeatureFrames(np.zeros(100, dtype=np.float32), 16000))
+
+    assert track.f0.size == 0
+    assert track.voiced_f0.size == 0
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        PitchTracker("crepe")
@@ -0,0 +1,90 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from services.posture_estimation import (
+    LEFT_EAR, LEFT_HIP, LEFT_SHOULDER, LEFT_WRIST, POSE_POINTS, RIGHT_EAR, RIGHT_HIP, RIGHT_SHOULDER,
+    RIGHT_WRIST, PostureEstimator, pose_landmark_array
+)
+
+
+def pose(tilt_degrees=0.0, ears_forward=0.0, hips_visible=True, wrist_x=0.3):
+    """Upright seated pose, 0.2 shoulder widths across, with optional faults"""
+    points = np.zeros((POSE_POINTS, 4), dtype=np.float32)
+    points[:, 3] = 0.9
+    points[RIGHT_SHOULDER, :3] = (0.4, 0.5, 0.0)
+    points[LEFT_SHOULDER, :3] = (0.6, 0.5 + 0.2 * math.tan(math.radians(tilt_degrees)), 0.0)
+    points[RIGHT_EAR, :3] = (0.45, 0.3, -ears_forward)
+    points[LEFT_EAR, :3] = (0.55, 0.3, -ears_forward)
+    points[RIGHT_HIP, :3] = (0.42, 0.9, 0.0)
+    points[LEFT_HIP, :3] = (0.58, 0.9, 0.0)
+    points[[RIGHT_WRIST, LEFT_WRIST], :2] = (wrist_x, 0.8)
+    if not hips_visible:
+        points[[LEFT_HIP, RIGHT_HIP], 3] = 0.1
+    return points
+
+
+def test_upright_pose_scores_full_marks():
+    posture = PostureEstimator().estimate(pose())
+
+    assert posture.pose_detected.tolist() == [True]
+    assert posture.shoulder_tilt == pytest.approx([0.0], abs=1e-4)
+    assert posture.head_forward == pytest.approx([0.0], abs=1e-4)
+    assert posture.torso_lean == pytest.approx([0.0], abs=1e-4)
+    assert posture.score == pytest.approx([100.0])
+
+
+def test_each_fault_costs_its_weight_at_its_worst():
+    posture = PostureEstimator().estimate(np.stack([
+        pose(tilt_degrees=15.0),
+        pose(tilt_degrees=9.0),
+        pose(ears_forward=0.1),
+        pose(tilt_degrees=15.0, ears_forward=0.1)
+    ]))
+
+    assert posture.shoulder_tilt[0] == pytest.approx(15.0, abs=0.01)
+    assert posture.head_forward[2] == pytest.approx(0.5, abs=1e-4)
+    # Tilting widens the shoulders, so the same ear offset is a smaller head-forward ratio
+    combined_head_forward = 0.1 * math.cos(math.radians(15.0)) / 0.2
+    combined = 100.0 - 30.0 - 35.0 * (combined_head_forward - 0.1) / 0.4
+    assert posture.score == pytest.approx([70.0, 85.0, 65.0, combined], abs=0.05)
+
+
+def test_hips_out_of_frame_cost_nothing():
+    posture = PostureEstimator().estimate(pose(hips_visible=False))
+
+    assert np.isnan(posture.torso_lean[0])
+    assert posture.score == pytest.approx([100.0])
+
+
+def test_occluded_shoulder_means_no_pose():
+    landmarks = pose()
+    landmarks[LEFT_SHOULDER, 3] = 0.1
+
+    posture = PostureEstimator().estimate(np.stack([landmarks, pose()]))
+
+    assert posture.pose_detected.tolist() == [False, True]
+    assert np.isnan(posture.score[0])
+    assert posture.score[1] == pytest.approx(100.0)
+
+
+def test_each_run_of_fast_wrist_movement_is_one_gesture():
+    wrist_positions = [0.3, 0.3, 0.5, 0.7, 0.7, 0.7, 0.5, 0.5]
+    frames = np.stack([pose(wrist_x=x) for x in wrist_positions])
+
+    posture = PostureEstimator().estimate(frames, timestamps=np.arange(len(frames)) * 1.0)
+
+    assert posture.gesture_count == 2
+    assert PostureEstimator().estimate(pose()).gesture_count == 0
+
+
+def test_pose_landmark_array():
+    landmarks = [SimpleNamespace(x=i / 100, y=0.5, z=0.0, visibility=0.8) for i in range(POSE_POINTS)]
+
+    points = pose_landmark_array(SimpleNamespace(landmark=landmarks))
+
+    assert points.shape == (POSE_POINTS, 4)
+    assert points[3] == pytest.approx([0.03, 0.5, 0.0, 0.8])
+    assert np.isnan(pose_landmark_array(None)).all()
@@ -0,0 +1,116 @@
+import base64
+import json
+
+from services.gemini_governor import estimate_tokens
+from services.prompt_builder import CompactPromptBuilder, PromptSection, compact, summarize_analysis
+
+
+def test_compact_strips_binary_and_detail_fields():
+    blob = base64.b64encode(bytes(range(256)) * 20).decode()
+
+    result = compact({
+        "audio_data": "UklGRg==",
+        "timeline": [{"t": 0}],
+        "missing": None,
+        "notes": blob,
+        "score": 71.23456,
+        "nested": {"video_data": "AAAA", "kept": "yes"}
+    })
+
+    assert result == {
+        "notes": f"[binary data omitted, {len(blob)} chars]",
+        "score": 71.235,
+        "nested": {"kept": "yes"}
+    }
+
+
+def test_compact_truncates_long_strings_and_lists():
+    result = compact({"text": "word " * 100, "items": list(range(10))}, max_string=20, max_items=3)
+
+    assert result["text"] == ("word " * 4) + "..."
+    assert result["items"] == [0, 1, 2, "... 7 more"]
+
+
+def test_summarize_analysis_keeps_key_metrics():
+    summary = summarize_analysis({
+        "audio": {
+            "clarity_score": 80.0,
+            "pause_analysis": [
+                {"duration": 0.5, "type": "short"},
+                {"duration": 2.0, "type": "medium"},
+                {"duration": 0.7, "type": "short"}
+            ],
+            "tone_analysis": [{"assessment": "Good vocal variety"}, {"ignored": True}]
+        },
+        "emotions": {
+            "frames_analyzed": 12,
+            "timeline": [{"t": 0}],
+            "overall_statistics": {"average_emotions": {"happy": 50.0}, "dominant_emotion_overall": "happy"}
+        },
+        "content": {
+            "averageScore": 7,
+            "responses": [{"overallScore": 7, "strengths": ["a", "b", "c"], "improvements": ["x"], "detail": "..."}]
+        },
+        "stages": {"audio": {"status": "completed", "duration_ms": 10}},
+        "overall": 85
+    })
+
+    assert summary == {
+        "audio": {
+            "clarity_score": 80.0,
+            "pauses": {"count": 3, "total_seconds": 3.2, "by_type": {"short": 2, "medium": 1}},
+            "tone": {"assessment": "Good vocal variety"}
+        },
+        "emotions": {"frames_analyzed": 12, "dominant_emotion_overall": "happy"},
+        "content": {
+            "averageScore": 7,
+            "responses": [{"overallScore": 7, "strengths": ["a", "b"], "improvements": ["x"]}]
+        },
+        "stages": {"audio": "completed"},
+        "overall": 85
+    }
+
+
+def test_prompt_within_budget_is_rendered_whole():
+    builder = CompactPromptBuilder(token_budget=1000)
+    section = PromptSection("data", {"score": 1.5, "items": [1, 2]}, priority=1)
+
+    prompt = builder.build("Data: {data}", [section])
+
+    assert prompt == 'Data: {"score":1.5,"items":[1,2]}'
+    assert section.level == 0 and not section.dropped
+
+
+def test_lowest_priority_section_is_compacted_first():
+    builder = CompactPromptBuilder(token_budget=400)
+    low = PromptSection("low", {"items": ["x" * 40] * 60}, priority=1)
+    high = PromptSection("high", {"items": ["y" * 40] * 5}, priority=2)
+
+    prompt = builder.build("{high}\n{low}", [low, high])
+
+    assert estimate_tokens(prompt) <= 400
+    assert low.level > 0 and not low.dropped
+    assert high.level == 0
+    assert json.loads(prompt.split("\n")[0]) == {"items": ["y" * 40] * 5}
+
+
+def test_sections_are_dropped_when_compaction_is_not_enough():
+    builder = CompactPromptBuilder(token_budget=60)
+    optional = PromptSection("optional", {f"key{i}": i for i in range(100)}, priority=1)
+    required = PromptSection("required", "Keep this answer", priority=2, droppable=False)
+
+    prompt = builder.build("{required}\n{optional}", [optional, required])
+
+    assert optional.dropped
+    assert prompt == "Keep this answer\n(omitted to fit the prompt budget)"
+
+
+def test_prompt_over_budget_is_returned_when_nothing_can_be_dropped():
+    builder = CompactPromptBuilder(token_budget=10)
+    required = PromptSection("required", "z" * 1000, priority=1, droppable=False)
+
+    prompt = builder.build("{required}", [required])
+
+    assert not required.dropped
+    assert required.level == 5
+    assert prompt == "z" * 960 + "..."
@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+
+from services.response_batcher import ResponseAnalysisBatcher
+
+
+class FakeCache:
+    def __init__(self):
+        self.values = {}
+
+    def key(self, model, prompt):
+        return f"{model}:{prompt}"
+
+    def ttl_for(self, method):
+        return 60
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl):
+        self.values[key] = value
+
+
+class FakeGemini:
+    model_name = "test-model"
+
+    def __init__(self, fail_individual=False):
+        self.cache = FakeCache()
+        self.batch_calls = 0
+        self.individual_calls = 0
+        self.fail_individual = fail_individual
+
+    def _build_analysis_prompt(self, params):
+        return params["answer"]
+
+    def _build_batch_analysis_prompt(self, items):
+        return json.dumps([item["answer"] for item in items])
+
+    async def _generate_json(self, method, prompt):
+        self.batch_calls += 1
+        return [
+            {"index": index, "overallScore": len(answer), "scores": {}}
+            for index, answer in enumerate(json.loads(prompt))
+        ]
+
+    async def _analyze_response_now(self, params):
+        self.individual_calls += 1
+        if self.fail_individual:
+            raise RuntimeError("model unavailable")
+        return {"overallScore": 0, "scores": {}}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_answers_share_one_batch():
+    service = FakeGemini()
+    batcher = ResponseAnalysisBatcher(service, window_seconds=0.01, max_items=8)
+
+    results = await asyncio.gather(*(batcher.submit({"answer": "a" * n}) for n in (1, 2, 3)))
+
+    assert [result["overallScore"] for result in results] == [1, 2, 3]
+    assert service.batch_calls == 1
+    assert batcher.stats()["in_flight_batches"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_answer_skips_batch():
+    service = FakeGemini()
+    batcher = ResponseAnalysisBatcher(service, window_seconds=0.01)
+    await asyncio.gather(batcher.submit({"answer": "ab"}), batcher.submit({"answer": "abc"}))
+
+    assert (await batcher.submit({"answer": "ab"}))["overallScore"] == 2
+    assert service.batch_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_fails_waiters_instead_of_hanging():
+    batcher = ResponseAnalysisBatcher(FakeGemini(fail_individual=True), window_seconds=0.01)
+
+    with pytest.raises(RuntimeError, match="model unavailable"):
+        await asyncio.wait_for(batcher.submit({"answer": "a"}), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_answers():
+    service = FakeGemini()
+    batcher = ResponseAnalysisBatcher(service, window_seconds=60)
+    waiters = [asyncio.ensure_future(batcher.submit({"answer": answer})) for answer in ("a", "bb")]
+    await asyncio.sleep(0)
+
+    await batcher.close()
+
+    assert [waiter.result()["overallScore"] for waiter in waiters] == [1, 2]
+    assert batcher.stats()["pending"] == 0
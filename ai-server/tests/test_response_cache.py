@@ -0,0 +1,102 @@
+import fakeredis
+import pytest
+
+from services.response_cache import ResponseCache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    return ResponseCache(max_entries=2)
+
+
+def with_redis(server, max_entries=2):
+    cache = ResponseCache(max_entries=max_entries, redis_url="")
+    cache.redis = fakeredis.aioredis.FakeRedis(server=server)
+    return cache
+
+
+def test_key_ignores_whitespace_runs_but_not_model():
+    key = ResponseCache.key("gemini-2.5-flash", "Rate  this\n answer ")
+
+    assert key == ResponseCache.key("gemini-2.5-flash", "Rate this answer")
+    assert key != ResponseCache.key("gemini-2.5-pro", "Rate this answer")
+
+
+@pytest.mark.asyncio
+async def test_miss_then_hit_returns_copies(cache):
+    assert await cache.get("k") is None
+    await cache.set("k", {"scores": [1, 2]}, ttl=60)
+
+    first = await cache.get("k")
+    first["scores"].append(3)
+
+    assert await cache.get("k") == {"scores": [1, 2]}
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["memory_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_a_miss(cache):
+    await cache.set("k", {"a": 1}, ttl=60)
+    expires_at, payload = cache._entries["k"]
+    cache._entries["k"] = (expires_at - 120, payload)
+
+    assert await cache.get("k") is None
+    assert "k" not in cache._entries
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_is_not_cached(cache):
+    await cache.set("k", {"a": 1}, ttl=0)
+
+    assert await cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used(cache):
+    await cache.set("a", 1, ttl=60)
+    await cache.set("b", 2, ttl=60)
+    await cache.get("a")
+    await cache.set("c", 3, ttl=60)
+
+    assert list(cache._entries) == ["a", "c"]
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_instances():
+    server = fakeredis.FakeServer()
+    await with_redis(server).set("k", {"a": 1}, ttl=60)
+
+    other = with_redis(server)
+
+    assert await other.get("k") == {"a": 1}
+    assert other.stats()["redis_hits"] == 1
+    assert 0 < await other.redis.ttl(other.prefix + "k") <= 60
+    # Now served from memory
+    assert await other.get("k") == {"a": 1}
+    assert other.stats()["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_expiry_is_a_miss():
+    server = fakeredis.FakeServer()
+    cache = with_redis(server)
+    await cache.set("k", {"a": 1}, ttl=60)
+    await cache.redis.delete(cache.prefix + "k")
+
+    assert await with_redis(server).get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_misses():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    cache = with_redis(server)
+
+    await cache.set("k", {"a": 1}, ttl=60)
+    cache._entries.clear()
+
+    assert await cache.get("k") is None
+    assert cache.stats()["redis_errors"] == 2
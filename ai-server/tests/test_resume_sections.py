@@ -0,0 +1,65 @@
+from services.resume_sections import SectionIndex
+
+RESUME = """Jane Doe
+jane@example.com
+
+PROFESSIONAL SUMMARY
+Backend engineer building Python services.
+
+Skills: Python, Go, Docker
+Core Competencies
+API design; Distributed systems
+
+EXPERIENCE
+GOOGLE INC
+Senior Software Engineer, 2019 - 2023
+Responsibilities:
+- Built payment services handling 2M requests per day
+MICROSOFT
+Software Engineer, 2017 - 2019
+
+EDUCATION
+Bachelor of Science, Example University, 2017
+"""
+
+
+def test_known_headings_split_sections():
+    sections = SectionIndex(RESUME)
+
+    assert sections.get("summary") == "Backend engineer building Python services."
+    assert sections.get("education") == "Bachelor of Science, Example University, 2017"
+    assert [section for section, _ in sections.headings] == [
+        "summary", "skills", "skills", "experience", "education"
+    ]
+
+
+def test_repeated_section_headings_contribute_every_span():
+    sections = SectionIndex(RESUME)
+
+    assert sections.get("skills") == "Python, Go, Docker\nAPI design; Distributed systems"
+
+
+def test_all_caps_company_lines_stay_inside_section():
+    experience = SectionIndex(RESUME).get("experience")
+
+    assert experience.startswith("GOOGLE INC\nSenior Software Engineer, 2019 - 2023")
+    assert "MICROSOFT\nSoftware Engineer, 2017 - 2019" in experience
+
+
+def test_sub_labels_stay_inside_section():
+    experience = SectionIndex(RESUME).get("experience")
+
+    assert "Responsibilities:\n- Built payment services" in experience
+
+
+def test_missing_section_is_empty():
+    sections = SectionIndex(RESUME)
+
+    assert sections.get("languages") == ""
+    assert SectionIndex("").spans == {}
+
+
+def test_original_case_is_kept():
+    sections = SectionIndex("EDUCATION\nMSc, ETH Zurich\n")
+
+    assert sections.get("education") == "MSc, ETH Zurich"
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from services.audio_analysis import AudioAnalysisService
+from services.pcm import pcm_to_float32
+from services.shared_buffer import SharedBuffer, attach_shared_buffer
+
+
+def test_chunks_written_by_the_api_are_visible_to_the_worker():
+    buffer = SharedBuffer(8)
+    try:
+        buffer.write(b"abc")
+        buffer.write(b"defgh")
+
+        with attach_shared_buffer(buffer.name, buffer.size) as view:
+            assert bytes(view) == b"abcdefgh"
+    finally:
+        buffer.close()
+
+
+def test_writing_past_the_declared_length_fails():
+    buffer = SharedBuffer(4)
+    try:
+        buffer.write(b"abcd")
+        with pytest.raises(ValueError):
+            buffer.write(b"e")
+    finally:
+        buffer.close()
+
+
+def test_pcm_views_must_be_released_before_detaching():
+    samples = np.linspace(-1, 1, 16, dtype="<f4")
+    buffer = SharedBuffer(samples.nbytes)
+    try:
+        buffer.write(samples.tobytes())
+
+        with attach_shared_buffer(buffer.name, buffer.size) as view:
+            signal = pcm_to_float32(view, "pcm_f32le")
+            assert np.array_equal(signal, samples)
+            del signal
+    finally:
+        buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_audio_matches_analysis_of_the_bytes():
+    sr = 16000
+    t = np.arange(sr) / sr
+    pcm = (0.3 * np.sin(2 * np.pi * 150 * t) * 32767).astype("<i2").tobytes()
+    service = AudioAnalysisService()
+    buffer = SharedBuffer(len(pcm))
+    try:
+        buffer.write(pcm)
+
+        shared = await service.analyze_shared_audio(buffer.name, buffer.size, sr, "pcm_s16le")
+    finally:
+        buffer.close()
+
+    assert shared == await service.analyze_audio_bytes(pcm, sr, "pcm_s16le")
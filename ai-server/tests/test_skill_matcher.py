@@ -0,0 +1,97 @@
+import pytest
+
+from services.resume_sections import SectionIndex
+from services.skill_matcher import SkillIndex, load_skill_index
+
+TAXONOMY = {"categories": {
+    "programming_languages": {
+        "javascript": ["js", "ecmascript"],
+        "go": {"synonyms": ["golang"], "exact": ["Go"], "context": True},
+        "r": {"exact": ["R"]}
+    },
+    "frameworks": {
+        "node.js": ["nodejs", "node"],
+        "asp.net": [],
+        "machine learning": ["ml"],
+        "spring": {"synonyms": ["spring boot"], "context": True}
+    }
+}}
+
+
+def skills(text, index=None, context=()):
+    matches = (index or SkillIndex(TAXONOMY)).find(text, context=context)
+    return [(match["skill"], text[match["start"]:match["end"]]) for match in matches]
+
+
+def everywhere(text):
+    return [(0, len(text))]
+
+
+def test_synonyms_map_to_the_skill_and_category():
+    index = SkillIndex(TAXONOMY)
+
+    matches = index.find("Wrote ECMAScript and Golang")
+
+    assert [(match["skill"], match["category"]) for match in matches] == [
+        ("javascript", "programming_languages"), ("go", "programming_languages")
+    ]
+
+
+def test_matches_respect_word_boundaries():
+    assert skills("JSON parsing, Django, Goal setting") == []
+
+
+def test_dotted_names_are_one_word():
+    assert skills("Built APIs in Node.js and ASP.NET") == [("node.js", "Node.js"), ("asp.net", "ASP.NET")]
+
+
+def test_exact_forms_are_case_sensitive():
+    text = "Go and R for services"
+    assert skills(text, context=everywhere(text)) == [("go", "Go"), ("r", "R")]
+    text = "go for a run, r u there"
+    assert skills(text, context=everywhere(text)) == []
+
+
+def test_contextual_names_only_match_inside_context_spans():
+    text = "Spring 2020: Go team!\nSKILLS: Go, Spring\nBuilt Spring Boot and Golang services"
+    context = [(text.index("Go, Spring"), text.index("\nBuilt"))]
+
+    assert skills(text, context=context) == [
+        ("go", "Go"), ("spring", "Spring"), ("spring", "Spring Boot"), ("go", "Golang")
+    ]
+    assert skills(text) == [("spring", "Spring Boot"), ("go", "Golang")]
+
+
+def test_whitespace_runs_match_a_single_space():
+    assert skills("Machine\n   learning pipelines") == [("machine learning", "Machine\n   learning")]
+
+
+def test_fingerprint_tracks_taxonomy_content():
+    changed = {"categories": {"frameworks": {"node.js": []}}}
+
+    assert SkillIndex(TAXONOMY).fingerprint == SkillIndex(TAXONOMY).fingerprint
+    assert SkillIndex(TAXONOMY).fingerprint != SkillIndex(changed).fingerprint
+
+
+def test_bundled_taxonomy_loads():
+    index = load_skill_index()
+
+    assert {"python", "javascript"} <= set(index.skills)
+    assert skills("Python and Docker", index) == [("python", "Python"), ("docker", "Docker")]
+
+
+@pytest.mark.parametrize("phrase", [
+    "Sketch ideas on paper", "Slack off", "I express myself", "Spring 2020",
+    "the oracle of delphi", "A Go-getter", "React quickly", "Bootstrap a startup"
+])
+def test_everyday_words_are_not_skills_in_prose(phrase):
+    assert skills(f"SUMMARY\n{phrase}\n", load_skill_index()) == []
+
+
+def test_everyday_words_are_skills_in_the_skills_section():
+    text = "SUMMARY\nA Go-getter who likes to sketch.\n\nSKILLS\nGo, Sketch, Slack, Oracle\n"
+    context = SectionIndex(text).spans["skills"]
+
+    assert skills(text, load_skill_index(), context) == [
+        ("go", "Go"), ("sketch", "Sketch"), ("slack", "Slack"), ("oracle", "Oracle")
+    ]
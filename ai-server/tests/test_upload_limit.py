@@ -0,0 +1,56 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from middleware.upload_limit import UploadLimitMiddleware
+
+
+def make_client():
+    app = FastAPI()
+    app.add_middleware(UploadLimitMiddleware, default_limit=100, route_limits={"/big": 1000})
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body())}
+
+    @app.post("/big")
+    async def big(request: Request):
+        return {"size": len(await request.body())}
+
+    return TestClient(app)
+
+
+def chunks(count, size):
+    for _ in range(count):
+        yield b"x" * size
+
+
+def test_body_within_limit_passes():
+    response = make_client().post("/echo", content=b"x" * 100)
+
+    assert response.status_code == 200
+    assert response.json() == {"size": 100}
+
+
+def test_content_length_over_limit_is_rejected():
+    response = make_client().post("/echo", content=b"x" * 101)
+
+    assert response.status_code == 413
+    assert "Maximum size" in response.json()["detail"]
+
+
+def test_route_limit_overrides_default():
+    client = make_client()
+
+    assert client.post("/big", content=b"x" * 500).status_code == 200
+    assert client.post("/big", content=b"x" * 1001).status_code == 413
+
+
+def test_chunked_body_is_cut_off_mid_stream():
+    client = make_client()
+
+    within = client.post("/echo", content=chunks(4, 25))
+    over = client.post("/echo", content=chunks(10, 25))
+
+    assert within.status_code == 200
+    assert within.json() == {"size": 100}
+    assert over.status_code == 413
@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from services.voice_activity import EnergyVADEngine, VADSegmenter, run_lengths
+
+
+def test_run_lengths_finds_every_true_run():
+    starts, ends = run_lengths(np.array([1, 1, 0, 0, 1, 0, 1, 1, 1], dtype=bool))
+
+    assert starts.tolist() == [0, 4, 6]
+    assert ends.tolist() == [2, 5, 9]
+
+
+def test_run_lengths_of_empty_and_all_false_masks():
+    for mask in (np.zeros(0, dtype=bool), np.zeros(4, dtype=bool)):
+        starts, ends = run_lengths(mask)
+        assert starts.size == 0 and ends.size == 0
+
+
+def test_energy_engine_hysteresis_keeps_last_decided_state():
+    # mean 0.5: speech above 0.15, silence below 0.10, in between keeps state
+    rms = np.array([0.12, 1.0, 0.12, 0.12, 0.05, 0.12, 2.80, 0.12, 0.05])
+    features = SimpleNamespace(rms=rms)
+
+    mask = EnergyVADEngine(speech_ratio=0.3, silence_ratio=0.2).speech_mask(features)
+
+    assert mask.tolist() == [False, True, True, True, False, False, True, True, False]
+
+
+def test_energy_engine_handles_empty_signal():
+    assert EnergyVADEngine().speech_mask(SimpleNamespace(rms=np.zeros(0))).size == 0
+
+
+def test_segments_and_pauses_exclude_trailing_silence():
+    engine = SimpleNamespace(speech_mask=lambda features: features.mask)
+    mask = np.array([0, 1, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0], dtype=bool)
+    features = SimpleNamespace(mask=mask, time_per_frame=0.1)
+
+    segments = VADSegmenter(engine).segment(features)
+
+    assert np.allclose(segments.speech_starts, [0.1, 0.7])
+    assert np.allclose(segments.speech_durations, [0.2, 0.1])
+    assert np.isclose(segments.speech_duration, 0.3)
+    starts, durations = segments.pauses(min_duration=0.3)
+    assert np.allclose(starts, [0.3])
+    assert np.allclose(durations, [0.4])